@@ -0,0 +1,326 @@
+"""Aggregate analytics for the frontend dashboards, built in one pass over the bills.
+
+The charts, word cloud and representative profiles otherwise walk every bill in the
+browser on each load. This computes the same numbers once and writes them as a small
+``analytics.json``:
+
+- ``words``: the most frequent words of captions and summaries (word cloud)
+- ``statuses``: bills per latest-status category (status chart)
+- ``issues``: bills per issue area (issue chart)
+- ``committees``: bills per committee
+- ``months``: status events per month (activity chart)
+- ``sponsors``: per-sponsor rollups (bills, outcome counts, top issues, co-sponsors)
+
+The text, status and issue rules mirror ``src/utils.ts`` and the components, so the
+dashboards show the same numbers whether they use this file or compute them.
+
+Usage:
+    python -m backend.analytics [input_json_or_jsonl] [output_json]
+"""
+
+import json
+import re
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from backend.output import iter_bills
+
+ANALYTICS_VERSION = 1
+TOP_WORDS = 50
+TOP_SPONSOR_ISSUES = 5
+TOP_COSPONSORS = 5
+
+# Must match the stop words in src/components/WordCloudView.tsx
+WORD_CLOUD_STOP_WORDS = frozenset(
+    "the a an and or but in on at to for of with by from as is was are be been has have "
+    "had will would could should may might must can this that these those it its they "
+    "their them which who whom whose what when where why how all each every both few "
+    "more most other some such no nor not only same so than too very any code section "
+    "act chapter".split()
+)
+# JavaScript's \w is ASCII-only
+NON_WORD_PATTERN = re.compile(r"[^\w\s-]", re.ASCII)
+DIGITS_PATTERN = re.compile(r"^\d+$", re.ASCII)
+MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})")
+US_DATE_PATTERN = re.compile(r"^(\d{1,2})/\d{1,2}/(\d{4})")
+
+# Must match issueKeywords in src/utils.ts; the first matching issue wins
+ISSUE_KEYWORDS = {
+    "gun-control": [
+        "firearm",
+        "gun",
+        "weapon",
+        "ammunition",
+        "concealed carry",
+        "background check",
+        "safe storage",
+    ],
+    "lgbtqia": [
+        "lgbtq",
+        "same-sex",
+        "transgender",
+        "gender identity",
+        "sexual orientation",
+        "drag",
+        "non-binary",
+    ],
+    "healthcare": [
+        "healthcare",
+        "health",
+        "medicaid",
+        "medicare",
+        "insurance",
+        "prescription",
+        "mental health",
+        "welfare",
+        "disability",
+    ],
+    "education": [
+        "school",
+        "education",
+        "university",
+        "college",
+        "student",
+        "teacher",
+        "curriculum",
+    ],
+    "environment": [
+        "environment",
+        "climate",
+        "renewable",
+        "energy",
+        "pollution",
+        "conservation",
+        "wildlife",
+    ],
+    "criminal-justice": [
+        "crime",
+        "prison",
+        "jail",
+        "sentencing",
+        "parole",
+        "police",
+        "law enforcement",
+        "prosecution",
+    ],
+    "taxes": ["tax", "revenue", "budget", "fiscal", "finance", "income"],
+    "immigration": ["immigration", "immigrant", "border", "visa", "citizenship", "alien"],
+    "voting-rights": ["vote", "voting", "election", "registration", "franchise", "ballot"],
+    "reproductive": [
+        "abortion",
+        "reproductive",
+        "pregnancy",
+        "contraception",
+        "planned parenthood",
+        "roe",
+        "fetal",
+    ],
+    "workers-rights": [
+        "labor",
+        "union",
+        "worker",
+        "wage",
+        "employment",
+        "overtime",
+        "minimum wage",
+        "workplace",
+    ],
+    "gun-violence": [
+        "gun violence",
+        "mass shooting",
+        "shooting",
+        "assault weapon",
+        "magazine",
+        "red flag",
+        "threat assessment",
+    ],
+}
+GENERAL_ISSUE = "general"
+
+
+def _as_list(value: object) -> list[str]:
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return [str(value)] if value else []
+
+
+def _capitalize(word: str) -> str:
+    return word[:1].upper() + word[1:].lower()
+
+
+def normalize_sponsor_name(name: str) -> str:
+    """Return "First Last" for "LAST, FIRST" names (mirrors normalizeSponsorName)."""
+    trimmed = name.strip()
+    if not trimmed:
+        return ""
+    if "," in trimmed:
+        last_name, first_part = (part.strip() for part in trimmed.split(",")[:2])
+        first_names = " ".join(_capitalize(word) for word in re.split(r"\s+", first_part))
+        last_name = " ".join(_capitalize(word) for word in re.split(r"\s+", last_name))
+        return f"{first_names} {last_name}"
+    return " ".join(_capitalize(word) for word in re.split(r"\s+", trimmed))
+
+
+def sponsor_names(bill: dict) -> list[str]:
+    """Return a bill's normalized sponsor names (mirrors getSponsorNames)."""
+    return [normalize_sponsor_name(name) for name in _as_list(bill.get("sponsors")) if name.strip()]
+
+
+def bill_issue(bill: dict) -> str:
+    """Return the bill's issue area, or "general" (mirrors getBillIssue)."""
+    text = " ".join(
+        [
+            bill.get("caption", ""),
+            " ".join(_as_list(bill.get("sponsors"))),
+            " ".join(_as_list(bill.get("committees"))),
+            bill.get("first_reader_summary") or "",
+        ]
+    ).lower()
+    for issue, keywords in ISSUE_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return issue
+    return GENERAL_ISSUE
+
+
+def cloud_words(bill: dict) -> Iterator[str]:
+    """Yield the words the word cloud counts for a bill (repeats included)."""
+    text = " ".join(
+        [
+            bill.get("caption", ""),
+            bill.get("first_reader_summary") or "",
+            bill.get("summary") or "",
+        ]
+    )
+    for word in NON_WORD_PATTERN.sub(" ", text.lower()).split():
+        if len(word) > 3 and word not in WORD_CLOUD_STOP_WORDS and not DIGITS_PATTERN.match(word):
+            yield word
+
+
+def status_category(history: list[dict]) -> str:
+    """Group the last status entry into a chart category (mirrors ChartsView)."""
+    if not history:
+        return "Unknown"
+    status = history[-1].get("status", "").lower()
+    if "introduc" in status or "filed" in status:
+        return "Introduced"
+    if "committee" in status:
+        return "In Committee"
+    if "passed" in status or "adopted" in status:
+        return "Passed"
+    if "sign" in status or "enacted" in status:
+        return "Signed/Enacted"
+    if "veto" in status or "failed" in status:
+        return "Vetoed/Failed"
+    return "Other"
+
+
+def outcome(history: list[dict]) -> str:
+    """Classify the most recent status as passed, failed or pending (mirrors RepresentativeProfile)."""
+    if not history:
+        return "pending"
+    # Stable sort by date, like getLatestStatus; dates are ISO strings
+    status = sorted(history, key=lambda entry: entry.get("date") or "")[-1].get("status", "")
+    status = status.lower()
+    if any(word in status for word in ("sign", "enacted", "pass", "adopt")):
+        return "passed"
+    if any(word in status for word in ("veto", "failed", "reject")):
+        return "failed"
+    return "pending"
+
+
+def month_key(date: str) -> str | None:
+    """Return "YYYY-MM" for ISO or M/D/YYYY dates, else None."""
+    match = MONTH_PATTERN.match(date)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}"
+    match = US_DATE_PATTERN.match(date)
+    if match:
+        return f"{match.group(2)}-{int(match.group(1)):02d}"
+    return None
+
+
+def build_analytics(bills: Iterable[dict]) -> dict:
+    """Aggregate every dashboard statistic in a single pass over ``bills``.
+
+    Args:
+        bills (Iterable): Legislation records; may be a generator streaming a file.
+
+    Returns:
+        Dict: The contents of ``analytics.json``.
+    """
+    count = 0
+    words: Counter[str] = Counter()
+    statuses: Counter[str] = Counter()
+    issues: Counter[str] = Counter()
+    committees: Counter[str] = Counter()
+    months: Counter[str] = Counter()
+    sponsors: dict[str, dict] = {}
+
+    for bill in bills:
+        count += 1
+        history = bill.get("status_history") or []
+        issue = bill_issue(bill)
+
+        words.update(cloud_words(bill))
+        statuses[status_category(history)] += 1
+        issues[issue] += 1
+        committees.update(name.strip() for name in _as_list(bill.get("committees")) if name.strip())
+        for entry in history:
+            month = month_key(entry.get("date") or "")
+            if month:
+                months[month] += 1
+
+        names = sponsor_names(bill)
+        bill_outcome = outcome(history)
+        for name in names:
+            rollup = sponsors.get(name)
+            if rollup is None:
+                rollup = sponsors[name] = {
+                    "bills": [],
+                    "outcomes": Counter(),
+                    "issues": Counter(),
+                    "cosponsors": Counter(),
+                }
+            rollup["bills"].append(bill.get("doc_number", ""))
+            rollup["outcomes"][bill_outcome] += 1
+            if issue != GENERAL_ISSUE:
+                rollup["issues"][issue] += 1
+            rollup["cosponsors"].update(other for other in names if other.lower() != name.lower())
+
+    return {
+        "version": ANALYTICS_VERSION,
+        "generated_at": time.time(),
+        "count": count,
+        "words": words.most_common(TOP_WORDS),
+        "statuses": dict(statuses),
+        "issues": dict(issues.most_common()),
+        "committees": dict(committees.most_common()),
+        "months": dict(sorted(months.items())),
+        "sponsors": {
+            name: {
+                "bills": rollup["bills"],
+                "passed": rollup["outcomes"]["passed"],
+                "pending": rollup["outcomes"]["pending"],
+                "failed": rollup["outcomes"]["failed"],
+                "issues": rollup["issues"].most_common(TOP_SPONSOR_ISSUES),
+                "cosponsors": rollup["cosponsors"].most_common(TOP_COSPONSORS),
+            }
+            for name, rollup in sponsors.items()
+        },
+    }
+
+
+if __name__ == "__main__":
+    input_file = sys.argv[1] if len(sys.argv) > 1 else "ga_legislation.jsonl"
+    output_file = Path(sys.argv[2] if len(sys.argv) > 2 else "analytics.json")
+
+    analytics = build_analytics(iter_bills(input_file))
+    content = json.dumps(analytics, ensure_ascii=False, separators=(",", ":"))
+    output_file.write_text(content, encoding="utf-8")
+    print(
+        f"Wrote analytics for {analytics['count']} bills and {len(analytics['sponsors'])} "
+        f"sponsors to {output_file} ({len(content) / 1024:.1f} KiB)"
+    )
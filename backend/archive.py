@@ -0,0 +1,183 @@
+"""Multi-session archive: scrape several legislative sessions in one bounded job.
+
+Each session is scraped into its own directory under the archive root, with its own
+detail cache, HTTP cache and checkpoint, so sessions never share cache entries and
+each can resume independently::
+
+    archive/
+        archive.json                    sessions in the archive and their status
+        2023-2024-regular-session/
+            ga_legislation.json(l)
+            bill_details_cache.jsonl
+            http_cache/
+            scrape_metrics.json, .prom  timings of the last run
+            scrape_checkpoint.json, .bills.jsonl  only while the session is incomplete
+
+Sessions run concurrently in one event loop, at most ``parallel_sessions`` at a time,
+and share a single rate limiter, so the whole job stays within the request rate a
+single scrape would use.
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+
+from backend.scraper import GALegislationScraper
+from backend.sessions import LegislativeSession
+
+ARCHIVE_VERSION = 1
+ARCHIVE_INDEX = "archive.json"
+SESSION_OUTPUT = "ga_legislation.json"
+
+
+def session_dir(archive_dir: str | Path, session: LegislativeSession) -> Path:
+    """Directory holding one session's output and caches."""
+    return Path(archive_dir) / session.slug
+
+
+def load_archive_index(archive_dir: str | Path) -> dict:
+    """Read ``archive.json``, or return an empty index if there is none yet."""
+    path = Path(archive_dir) / ARCHIVE_INDEX
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        index = None
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not read archive index {path}: {e}")
+        index = None
+
+    if not isinstance(index, dict) or index.get("version") != ARCHIVE_VERSION:
+        return {"version": ARCHIVE_VERSION, "sessions": {}}
+    return index
+
+
+def _save_archive_index(archive_dir: Path, index: dict) -> None:
+    path = archive_dir / ARCHIVE_INDEX
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def scrape_archive(
+    sessions: list[LegislativeSession],
+    archive_dir: str = "archive",
+    parallel_sessions: int = 2,
+    max_pages: int | None = None,
+    resume: bool = False,
+    json_array: bool = True,
+    scraper_kwargs: dict | None = None,
+) -> dict[str, int]:
+    """Scrape each session into its own directory under ``archive_dir``.
+
+    Args:
+        sessions (list): Sessions to scrape, e.g. from ``GALegislationScraper.list_sessions``.
+        archive_dir (str): Archive root. Default "archive".
+        parallel_sessions (int): Sessions scraped at the same time. Default 2.
+        max_pages (int, optional): Maximum listing pages per session. None = all pages.
+        resume (bool): Skip sessions the archive index records as complete and resume
+            the others from their checkpoints. Default False (rescrape every session;
+            cached details are reused).
+        json_array (bool): Also write each session's JSON array file. Default True.
+        scraper_kwargs (dict, optional): Other ``GALegislationScraper`` options, applied
+            to every session. ``max_concurrent`` and ``max_rate`` bound the whole job.
+
+    Returns:
+        Dict: Bills saved per session id (the recorded count for skipped sessions).
+        Sessions that failed are left out.
+    """
+    return asyncio.run(
+        _scrape_archive(
+            sessions,
+            Path(archive_dir),
+            max(1, parallel_sessions),
+            max_pages,
+            resume,
+            json_array,
+            dict(scraper_kwargs or {}),
+        )
+    )
+
+
+async def _scrape_archive(
+    sessions: list[LegislativeSession],
+    archive_dir: Path,
+    parallel_sessions: int,
+    max_pages: int | None,
+    resume: bool,
+    json_array: bool,
+    scraper_kwargs: dict,
+) -> dict[str, int]:
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    index = load_archive_index(archive_dir)
+    semaphore = asyncio.Semaphore(parallel_sessions)
+    shared: dict = {}
+
+    # Split the CPUs between the sessions' HTML parsing pools (0 parses inline)
+    if scraper_kwargs.get("parse_workers") is None:
+        scraper_kwargs["parse_workers"] = (os.cpu_count() or 1) // parallel_sessions
+
+    async def scrape_session(session: LegislativeSession) -> int:
+        entry = index["sessions"].get(session.id, {})
+        if resume and entry.get("complete"):
+            print(f"[{session.name}] Already complete with {entry.get('bills', 0)} bills")
+            return int(entry.get("bills", 0))
+
+        async with semaphore:
+            directory = session_dir(archive_dir, session)
+            directory.mkdir(parents=True, exist_ok=True)
+            http_cache_dir = scraper_kwargs.get("http_cache_dir", "http_cache")
+            metrics_file = scraper_kwargs.get("metrics_file", "scrape_metrics.json")
+            scraper = GALegislationScraper(
+                **{
+                    **scraper_kwargs,
+                    "session_id": session.id,
+                    "cache_file": str(directory / "bill_details_cache.jsonl"),
+                    "http_cache_dir": str(directory / "http_cache") if http_cache_dir else None,
+                    "checkpoint_file": str(directory / "scrape_checkpoint.json"),
+                    "metrics_file": str(directory / "scrape_metrics.json")
+                    if metrics_file
+                    else None,
+                }
+            )
+            # The first session's limiter paces every session
+            scraper.rate_limiter = shared.setdefault("rate_limiter", scraper.rate_limiter)
+
+            index["sessions"][session.id] = {
+                "name": session.name,
+                "year": session.year,
+                "path": directory.name,
+                "complete": False,
+                "bills": entry.get("bills", 0),
+                "started_at": time.time(),
+            }
+            _save_archive_index(archive_dir, index)
+
+            print(f"\n[{session.name}] Scraping into {directory}/")
+            saved = await scraper.scrape_and_save_async(
+                str(directory / SESSION_OUTPUT), max_pages, resume=resume, json_array=json_array
+            )
+
+            index["sessions"][session.id].update(
+                complete=scraper.listing_complete and scraper.stats["failed"] == 0,
+                bills=saved,
+                finished_at=time.time(),
+            )
+            _save_archive_index(archive_dir, index)
+            print(f"\n[{session.name}] Saved {saved} bills")
+            return saved
+
+    results = await asyncio.gather(
+        *(scrape_session(session) for session in sessions), return_exceptions=True
+    )
+
+    saved_by_session = {}
+    for session, result in zip(sessions, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"[{session.name}] Failed: {result}")
+        else:
+            saved_by_session[session.id] = result
+    return saved_by_session
@@ -0,0 +1,215 @@
+"""Compact, pre-indexed data files for the frontend.
+
+From the scraped bills this builds, under one output directory:
+
+- ``ga_legislation.min.json`` (+ ``.gz`` / ``.br``): the full dataset, minified and
+  precompressed for servers that can serve precompressed files.
+- ``index.json``: one lightweight record per bill (doc number, caption, sponsors,
+  committees and the first and last status entries) for the first paint.
+- ``bills/<shard>.json``: full records grouped by chamber and hundred
+  (``HB-12`` holds HB 1200-1299), fetched when a bill is opened.
+- ``search.json``: an inverted index from search tokens to positions in ``index.json``,
+  covering captions, sponsors, committees and summaries.
+- ``analytics.json``: precomputed dashboard aggregates (see ``backend.analytics``).
+- ``similar.json``: the most similar bills for each bill (see ``backend.similarity``),
+  written only when NumPy is installed.
+
+Usage:
+    python -m backend.artifacts [input_json] [output_dir]
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from backend.analytics import build_analytics
+from backend.similarity import NUMPY_AVAILABLE, build_similarity_index
+
+# Optional brotli compression
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+ARTIFACTS_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+DOC_NUMBER_PATTERN = re.compile(r"^([A-Za-z]+)\s*(\d+)")
+
+# Words too common in bill text to narrow a search
+SEARCH_STOP_WORDS = frozenset(
+    "a an and are as at be by for from in into is it its of on or that the this to was "
+    "were with act bill amend provide relating other purposes".split()
+)
+
+
+def _dump_min(data: object) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def shard_key(doc_number: str) -> str:
+    """Return the detail shard a bill is stored in, e.g. "HB-12" for "HB1234"."""
+    match = DOC_NUMBER_PATTERN.match(doc_number)
+    if not match:
+        return "other"
+    return f"{match.group(1).upper()}-{int(match.group(2)) // 100}"
+
+
+def summary_record(bill: dict) -> dict:
+    """Reduce a bill to the fields the list view, filters and sorting need.
+
+    The status history keeps only its first and last entries, in their original order,
+    so date filters, sorting and "latest status" behave the same before the full record
+    is loaded.
+    """
+    history = bill.get("status_history") or []
+    if len(history) > 2:
+        history = [history[0], history[-1]]
+    return {
+        "doc_number": bill.get("doc_number", ""),
+        "caption": bill.get("caption", ""),
+        "sponsors": bill.get("sponsors", []),
+        "committees": bill.get("committees", []),
+        "status_history": history,
+    }
+
+
+def tokenize(text: str) -> set[str]:
+    """Split text into lowercase search tokens, dropping stop words and single characters."""
+    return {
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in SEARCH_STOP_WORDS
+    }
+
+
+def build_search_index(bills: list[dict]) -> dict[str, list[int]]:
+    """Map each search token to the sorted positions of the bills containing it."""
+    postings: dict[str, list[int]] = defaultdict(list)
+    for position, bill in enumerate(bills):
+        names = bill.get("sponsors") or []
+        committees = bill.get("committees") or []
+        text = " ".join(
+            [
+                bill.get("doc_number", ""),
+                bill.get("caption", ""),
+                bill.get("first_reader_summary", ""),
+                " ".join(names) if isinstance(names, list) else str(names),
+                " ".join(committees) if isinstance(committees, list) else str(committees),
+            ]
+        )
+        tokens = tokenize(text)
+        # "HB 123" is searched as "hb123" as well as "hb" + "123"
+        tokens.add(re.sub(r"\s+", "", bill.get("doc_number", "")).lower())
+        for token in tokens:
+            postings[token].append(position)
+    return dict(sorted(postings.items()))
+
+
+def write_compressed(path: Path, content: bytes) -> dict[str, int]:
+    """Write ``content`` plus gzip (and brotli, if installed) siblings.
+
+    Returns:
+        Dict: Byte sizes by encoding ("raw", "gzip", "br").
+    """
+    _write_atomic(path, content)
+    sizes = {"raw": len(content)}
+
+    gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+    _write_atomic(path.with_name(path.name + ".gz"), gzipped)
+    sizes["gzip"] = len(gzipped)
+
+    if BROTLI_AVAILABLE:
+        compressed = brotli.compress(content, quality=11)
+        _write_atomic(path.with_name(path.name + ".br"), compressed)
+        sizes["br"] = len(compressed)
+    return sizes
+
+
+def build_artifacts(bills: list[dict], output_dir: Path) -> dict:
+    """Write every frontend artifact for ``bills`` into ``output_dir``.
+
+    Args:
+        bills (list): Scraped legislation records.
+        output_dir (Path): Directory to write into (created if needed).
+
+    Returns:
+        Dict: Manifest of the written files, also saved as ``manifest.json``.
+    """
+    bills_dir = output_dir / "bills"
+    bills_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {"bundle": write_compressed(output_dir / "ga_legislation.min.json", _dump_min(bills))}
+
+    index = {
+        "version": ARTIFACTS_VERSION,
+        "generated_at": time.time(),
+        "count": len(bills),
+        "bills": [summary_record(bill) for bill in bills],
+    }
+    files["index"] = write_compressed(output_dir / "index.json", _dump_min(index))
+
+    search = {"version": ARTIFACTS_VERSION, "tokens": build_search_index(bills)}
+    files["search"] = write_compressed(output_dir / "search.json", _dump_min(search))
+
+    analytics = build_analytics(bills)
+    files["analytics"] = write_compressed(output_dir / "analytics.json", _dump_min(analytics))
+
+    if NUMPY_AVAILABLE:
+        similar = build_similarity_index(bills)
+        files["similar"] = write_compressed(output_dir / "similar.json", _dump_min(similar))
+
+    shards: dict[str, dict[str, dict]] = defaultdict(dict)
+    for bill in bills:
+        doc_number = bill.get("doc_number", "")
+        shards[shard_key(doc_number)][doc_number] = bill
+    for stale in bills_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+    for key, shard in shards.items():
+        _write_atomic(bills_dir / f"{key}.json", _dump_min(shard))
+
+    manifest = {
+        "version": ARTIFACTS_VERSION,
+        "generated_at": index["generated_at"],
+        "count": len(bills),
+        "shards": sorted(shards),
+        "sizes": files,
+    }
+    _write_atomic(output_dir / "manifest.json", _dump_min(manifest))
+    return manifest
+
+
+if __name__ == "__main__":
+    input_file = Path(sys.argv[1] if len(sys.argv) > 1 else "ga_legislation.json")
+    output_dir = Path(sys.argv[2] if len(sys.argv) > 2 else "data")
+
+    with open(input_file, encoding="utf-8") as f:
+        bills = json.load(f)
+
+    if not BROTLI_AVAILABLE:
+        print("Warning: brotli not installed; writing gzip files only")
+        print("Install it with: pip install brotli")
+    if not NUMPY_AVAILABLE:
+        print("Warning: NumPy not installed; skipping similar.json")
+        print("Install it with: pip install numpy")
+
+    manifest = build_artifacts(bills, output_dir)
+    print(f"Wrote artifacts for {manifest['count']} bills to {output_dir}/")
+    for name, sizes in manifest["sizes"].items():
+        encoded = ", ".join(f"{encoding} {size / 1024:.1f} KiB" for encoding, size in sizes.items())
+        print(f"  {name}: {encoded}")
+    print(f"  bills/: {len(manifest['shards'])} detail shards")
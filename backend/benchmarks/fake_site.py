@@ -0,0 +1,237 @@
+"""Local stand-in for legis.ga.gov, serving the synthetic fixture pages.
+
+The listing at ``/legislation/all`` behaves like the real single-page app: the served
+HTML is an empty shell whose script loads each page of results from a JSON search
+endpoint and re-renders the table when a pagination link is clicked. So both the
+listing API mode and browser pagination can be exercised. Detail pages are either
+server-rendered (answered by plain HTTP, with ETag revalidation) or client-rendered
+shells that only a browser can fill in.
+
+Usage:
+    python -m backend.benchmarks.fake_site [--port 8700] [--bills 200] [--latency-ms 50]
+
+then point the scraper at it with ``SCRAPER_BASE_URL=http://127.0.0.1:8700``.
+"""
+
+import argparse
+import asyncio
+import re
+
+from aiohttp import web
+from aiohttp.typedefs import Handler
+
+from backend.benchmarks.fixtures import (
+    detail_html,
+    listing_records,
+    listing_rows,
+    spa_page,
+)
+
+SESSIONS = [
+    {"id": 1031, "name": "2025-2026 Regular Session"},
+    {"id": 1029, "name": "2023-2024 Regular Session"},
+]
+
+LISTING_SCRIPT = """
+<script>
+(() => {
+  const params = new URLSearchParams(location.search);
+  const session = params.get("session");
+  const pageSize = %(per_page)d;
+  let current = 1;
+  let totalPages = 1;
+
+  async function load(page) {
+    const body = { page: page, pageSize: pageSize };
+    if (session) body.sessionId = Number(session);
+    const response = await fetch("/api/legislation/search", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+    });
+    const data = await response.json();
+    current = page;
+    totalPages = Math.max(1, Math.ceil(data.totalCount / pageSize));
+    const first = (page - 1) * pageSize + 1;
+    const last = Math.min(page * pageSize, data.totalCount);
+    document.querySelector("table tbody").innerHTML = data.html;
+    document.querySelector(".results span").textContent =
+      `${first}-${last} of ${data.totalCount}`;
+    const links = [];
+    for (let n = Math.max(1, page - 4); n <= Math.min(totalPages, page + 5); n++) {
+      links.push(`<li><a href="#" class="page-link">${n}</a></li>`);
+    }
+    links.push('<li><a href="#" aria-label="Next">Next</a></li>');
+    document.querySelector("ul.pagination").innerHTML = links.join("");
+  }
+
+  document.querySelector("ul.pagination").addEventListener("click", (event) => {
+    const link = event.target.closest("a");
+    if (!link) return;
+    event.preventDefault();
+    const text = link.textContent.trim();
+    const page = text === "Next" ? current + 1 : Number(text);
+    if (page >= 1 && page <= totalPages && page !== current) load(page);
+  });
+
+  fetch("/api/sessions");
+  load(1);
+})();
+</script>
+"""
+
+DETAIL_SHELL_SCRIPT = """
+<script>
+fetch("/api/legislation/%(bill_id)d/html")
+  .then((response) => response.text())
+  .then((html) => { document.getElementById("detail").innerHTML = html; });
+</script>
+"""
+
+
+class FakeSite:
+    """aiohttp application imitating the parts of legis.ga.gov the scraper uses."""
+
+    def __init__(
+        self,
+        total: int = 200,
+        per_page: int = 20,
+        latency: float = 0.05,
+        client_rendered_details: bool = False,
+    ):
+        """Configure the fake site.
+
+        Args:
+            total (int): Bills per session. Default 200.
+            per_page (int): Bills per page when the SPA does not ask for a page size.
+                Default 20.
+            latency (float): Seconds added to every response, like a network round trip.
+                Default 0.05.
+            client_rendered_details (bool): Serve detail pages as shells filled in by
+                JavaScript, so only the browser path can read them. Default False.
+        """
+        self.total = total
+        self.per_page = per_page
+        self.latency = latency
+        self.client_rendered_details = client_rendered_details
+        self.requests = 0
+        self._runner: web.AppRunner | None = None
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._delay])
+        app.router.add_get("/", self._home)
+        app.router.add_get("/robots.txt", self._robots)
+        app.router.add_get("/legislation/all", self._listing)
+        app.router.add_get(r"/legislation/{bill_id:\d+}", self._detail)
+        app.router.add_get("/api/sessions", self._sessions)
+        app.router.add_post("/api/legislation/search", self._search)
+        app.router.add_get(r"/api/legislation/{bill_id:\d+}/html", self._detail_fragment)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL (``port`` 0 picks a free port)."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        return f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _delay(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def _home(self, request: web.Request) -> web.Response:
+        return web.Response(text=spa_page("Georgia General Assembly", ""), content_type="text/html")
+
+    async def _robots(self, request: web.Request) -> web.Response:
+        return web.Response(text="User-agent: *\nAllow: /\n")
+
+    async def _listing(self, request: web.Request) -> web.Response:
+        body = (
+            '<table class="table"><thead><tr><th>Doc</th><th>Caption</th><th>Committees</th>'
+            "<th>Sponsors</th></tr></thead><tbody></tbody></table>"
+            '<div class="results"><span></span></div><ul class="pagination"></ul>'
+            + LISTING_SCRIPT
+            % {"per_page": self.per_page}
+        )
+        return web.Response(text=spa_page("Legislation", body), content_type="text/html")
+
+    async def _sessions(self, request: web.Request) -> web.Response:
+        return web.json_response(SESSIONS)
+
+    async def _search(self, request: web.Request) -> web.Response:
+        params = await request.json()
+        page = max(1, int(params.get("page", 1)))
+        page_size = max(1, int(params.get("pageSize", self.per_page)))
+        # Bill ids differ per session so sessions do not share cache entries
+        session = params.get("sessionId")
+        doc_offset = 0 if session in (None, SESSIONS[0]["id"]) else int(session) * 100_000
+
+        records = listing_records(page, page_size, self.total, doc_offset)
+        return web.json_response(
+            {"results": records, "totalCount": self.total, "html": listing_rows(records)}
+        )
+
+    async def _detail(self, request: web.Request) -> web.Response:
+        bill_id = int(request.match_info["bill_id"])
+        if self.client_rendered_details:
+            body = '<div id="detail"></div>' + DETAIL_SHELL_SCRIPT % {"bill_id": bill_id}
+            return web.Response(text=spa_page("Legislation", body), content_type="text/html")
+
+        etag = f'"{bill_id}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            text=detail_html(bill_id), content_type="text/html", headers={"ETag": etag}
+        )
+
+    async def _detail_fragment(self, request: web.Request) -> web.Response:
+        html = detail_html(int(request.match_info["bill_id"]))
+        main = re.search(r"<main>(.*)</main>", html, re.DOTALL)
+        return web.Response(text=main.group(1) if main else html, content_type="text/html")
+
+
+async def serve(site: FakeSite, port: int) -> None:
+    base_url = await site.start(port=port)
+    print(f"Serving a fake legis.ga.gov with {site.total} bills at {base_url}")
+    print(f"Scrape it with: SCRAPER_BASE_URL={base_url} python -m backend.scraper")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await site.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake legis.ga.gov for benchmarks")
+    parser.add_argument("--port", type=int, default=8700, help="Port to listen on")
+    parser.add_argument("--bills", type=int, default=200, help="Bills per session")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Delay added per response")
+    parser.add_argument(
+        "--client-rendered-details",
+        action="store_true",
+        help="Serve detail pages that only render in a browser",
+    )
+    args = parser.parse_args()
+
+    site = FakeSite(
+        args.bills,
+        latency=args.latency_ms / 1000,
+        client_rendered_details=args.client_rendered_details,
+    )
+    try:
+        asyncio.run(serve(site, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
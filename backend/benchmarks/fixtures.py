@@ -0,0 +1,148 @@
+"""Synthetic legis.ga.gov pages shaped like the rendered Angular app.
+
+The pages carry the same structure the scraper extracts from (results table, "1-20 of N"
+counter, "First Reader Summary"/"Status History" sections) inside the bulk of markup a
+rendered SPA page has: inline scripts and styles, navigation menus and footers.
+"""
+
+import random
+
+SPONSORS = [
+    f"{name} {district}th"
+    for name in ("Smith", "Jones", "Lee", "Brown")
+    for district in range(1, 60)
+]
+COMMITTEES = ["Judiciary", "Ways and Means", "Education", "Health", "Appropriations"]
+STATUSES = [
+    "House Hopper",
+    "House First Readers",
+    "House Second Readers",
+    "House Committee Favorably Reported",
+    "House Passed/Adopted",
+    "Senate Read and Referred",
+    "Senate Passed/Adopted",
+    "Effective Date",
+]
+
+
+def spa_page(title: str, body: str) -> str:
+    """Wrap page content in the boilerplate of a rendered SPA page."""
+    scripts = "\n".join(
+        f"<script>window.__chunk{i}=function(a,b){{return a+b*{i};}};"
+        + "/*"
+        + "x" * 1500
+        + "*/</script>"
+        for i in range(40)
+    )
+    styles = (
+        "<style>" + "".join(f".c{i}{{margin:{i}px;padding:{i}px}}" for i in range(800)) + "</style>"
+    )
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(200))
+    footer = "".join(
+        f"<p>Footer line {i} of the Georgia General Assembly site.</p>" for i in range(60)
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title>{styles}{scripts}</head>"
+        f"<body><app-root><nav><ul>{nav}</ul></nav><main>{body}</main>"
+        f"<footer>{footer}</footer></app-root></body></html>"
+    )
+
+
+def listing_records(
+    page_num: int, per_page: int = 20, total: int = 3000, doc_offset: int = 0
+) -> list[dict]:
+    """Return the bills on listing page ``page_num`` (1-based) as listing API records.
+
+    Args:
+        page_num (int): Page to return.
+        per_page (int): Bills per page. Default 20.
+        total (int): Total bills in the session. Default 3000.
+        doc_offset (int): Added to bill ids, to tell sessions apart. Default 0.
+
+    Returns:
+        List of records with id, docNumber, caption, committees and sponsors.
+    """
+    first = (page_num - 1) * per_page + 1
+    last = min(page_num * per_page, total)
+    rng = random.Random(page_num)
+    records = []
+    for bill_id in range(first, last + 1):
+        sponsors = [{"id": rng.randrange(500), "name": s} for s in rng.sample(SPONSORS, 3)]
+        caption = (
+            f"A BILL to be entitled an Act to amend Title {bill_id % 50} "
+            f"relating to {rng.choice(COMMITTEES).lower()}"
+        )
+        records.append(
+            {
+                "id": bill_id + doc_offset,
+                "docNumber": f"HB {bill_id}",
+                "caption": caption,
+                "committees": [{"id": 1, "name": rng.choice(COMMITTEES)}],
+                "sponsors": sponsors,
+            }
+        )
+    return records
+
+
+def listing_rows(records: list[dict]) -> str:
+    """Render listing records as the rows of the results table."""
+    rows = []
+    for record in records:
+        sponsors = "".join(
+            f'<a href="/members/{sponsor["id"]}">{sponsor["name"]}</a>'
+            for sponsor in record["sponsors"]
+        )
+        committees = "".join(
+            f'<a href="/committees/{committee["id"]}">{committee["name"]}</a>'
+            for committee in record["committees"]
+        )
+        rows.append(
+            f'<tr><td><a href="/legislation/{record["id"]}">{record["docNumber"]}</a></td>'
+            f'<td><a href="/legislation/{record["id"]}">{record["caption"]}</a></td>'
+            f"<td>{committees}</td><td>{sponsors}</td></tr>"
+        )
+    return "".join(rows)
+
+
+def listing_html(page_num: int, per_page: int = 20, total: int = 3000, doc_offset: int = 0) -> str:
+    """Render listing page ``page_num`` (1-based) of ``total`` bills.
+
+    Args:
+        page_num (int): Page to render.
+        per_page (int): Bills per page. Default 20.
+        total (int): Total bills in the session. Default 3000.
+        doc_offset (int): Added to bill ids, to tell sessions apart. Default 0.
+
+    Returns:
+        str: HTML of the rendered listing page.
+    """
+    first = (page_num - 1) * per_page + 1
+    last = min(page_num * per_page, total)
+    rows = listing_rows(listing_records(page_num, per_page, total, doc_offset))
+    pages = "".join(f'<li><a href="#" class="page-link">{n}</a></li>' for n in range(1, 11))
+    body = (
+        '<table class="table"><thead><tr><th>Doc</th><th>Caption</th><th>Committees</th>'
+        f"<th>Sponsors</th></tr></thead><tbody>{rows}</tbody></table>"
+        f'<div class="results"><span>{first}-{last} of {total}</span></div>'
+        f'<ul class="pagination">{pages}<li><a href="#" aria-label="Next">Next</a></li></ul>'
+    )
+    return spa_page("Legislation", body)
+
+
+def detail_html(bill_id: int) -> str:
+    """Render the detail page of bill ``bill_id``."""
+    rng = random.Random(bill_id)
+    history = "".join(
+        f"<tr><td>{1 + i % 3:02d}/{1 + (bill_id + i) % 28:02d}/2025</td><td>{status}</td></tr>"
+        for i, status in enumerate(STATUSES[: rng.randrange(2, len(STATUSES) + 1)])
+    )
+    body = (
+        f"<h1>HB {bill_id}</h1>"
+        "<h2>First Reader Summary</h2>"
+        f"<div><p>A BILL to be entitled an Act to amend Title {bill_id % 50} of the O.C.G.A.; "
+        "to provide for related matters; to repeal conflicting laws; and for other purposes.</p></div>"
+        "<h2>Status History</h2>"
+        "<div><table><thead><tr><th>Date</th><th>Status</th></tr></thead>"
+        f"<tbody>{history}</tbody></table></div>"
+    )
+    return spa_page(f"HB {bill_id}", body)
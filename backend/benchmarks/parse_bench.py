@@ -0,0 +1,65 @@
+"""Compare per-page parse time of the available HTML parser backends.
+
+Usage:
+    python -m backend.benchmarks.parse_bench [--repeat N] [--listing FILE] [--detail FILE]
+
+Without files, synthetic pages from ``backend.benchmarks.fixtures`` are used. Saved
+pages (e.g. ``page.content()`` dumps from a real run) give the most faithful numbers.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from backend.benchmarks.fixtures import detail_html, listing_html
+from backend.parsing import available_parsers, parse_bill_details, parse_listing_page
+
+
+def time_parse(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the median and best wall time in milliseconds of ``repeat`` calls."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="Parses per measurement")
+    parser.add_argument("--listing", type=Path, help="Saved listing page HTML")
+    parser.add_argument("--detail", type=Path, help="Saved bill detail page HTML")
+    args = parser.parse_args()
+
+    listing = args.listing.read_text(encoding="utf-8") if args.listing else listing_html(1)
+    detail = args.detail.read_text(encoding="utf-8") if args.detail else detail_html(1)
+    base_url = "https://www.legis.ga.gov"
+
+    print(f"Listing page: {len(listing) / 1024:.0f} KiB, detail page: {len(detail) / 1024:.0f} KiB")
+    print(f"{'parser':<12}{'listing median':>16}{'best':>10}{'detail median':>16}{'best':>10}")
+
+    reference = None
+    for name in available_parsers():
+        result = (
+            parse_listing_page(listing, base_url, name),
+            parse_bill_details(detail, name),
+        )
+        if reference is None:
+            reference = result
+        elif result != reference:
+            print(f"  Warning: {name} output differs from {available_parsers()[0]}")
+
+        listing_ms = time_parse(partial(parse_listing_page, listing, base_url, name), args.repeat)
+        detail_ms = time_parse(partial(parse_bill_details, detail, name), args.repeat)
+        print(
+            f"{name:<12}{listing_ms[0]:>13.2f} ms{listing_ms[1]:>7.2f} ms"
+            f"{detail_ms[0]:>13.2f} ms{detail_ms[1]:>7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
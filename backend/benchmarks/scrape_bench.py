@@ -0,0 +1,208 @@
+"""End-to-end scraper throughput against a local fake legis.ga.gov.
+
+Every combination of ``--concurrency`` and ``--page-pool`` scrapes the fake site (see
+``backend.benchmarks.fake_site``) in a fresh process with cold caches, and reports
+bills/second, p50/p99 per-bill latency, peak RSS and CPU time. No network access is
+needed beyond Playwright's Chromium being installed.
+
+Usage:
+    python -m backend.benchmarks.scrape_bench [--bills 200] [--concurrency 2,5,10]
+        [--page-pool 2,5] [--detail-mode auto] [--listing-mode auto]
+        [--latency-ms 50] [--client-rendered-details] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any
+
+from backend.benchmarks.fake_site import FakeSite
+
+RESULT_PREFIX = "BENCH_RESULT "
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    """Scrape the fake site once and print the result as one JSON line."""
+    from backend.metrics import ScrapeMetrics
+    from backend.scraper import GALegislationScraper
+
+    # Cold caches: every file the scraper writes lands in a fresh directory
+    os.chdir(tempfile.mkdtemp(prefix="scrape_bench_"))
+    scraper = GALegislationScraper(
+        max_concurrent=args.max_concurrent,
+        request_delay=0,
+        page_pool_size=args.page_pool_size,
+        detail_mode=args.detail_mode,
+        listing_mode=args.listing_mode,
+        max_rate=args.max_rate,
+        parser=args.parser,
+        metrics_file=None,
+        base_url=args.base_url,
+    )
+    scraper.metrics = ScrapeMetrics(keep_samples=True)
+
+    bills = asyncio.run(scraper.get_all_pages())
+    wall = scraper.metrics.wall_seconds
+    bill_latency = scraper.metrics.phases.get("bill")
+    result = {
+        "bills": len(bills),
+        "failed": scraper.stats["failed"],
+        "wall_seconds": round(wall, 3),
+        "bills_per_second": round(len(bills) / wall, 2) if wall else 0.0,
+        "p50_ms": round(bill_latency.quantile(0.5) * 1000, 1) if bill_latency else 0.0,
+        "p99_ms": round(bill_latency.quantile(0.99) * 1000, 1) if bill_latency else 0.0,
+        "http_details": scraper.stats["http_details"],
+        "browser_details": scraper.stats["browser_details"],
+    }
+    print(RESULT_PREFIX + json.dumps(result))
+
+
+def run_case(base_url: str, args: argparse.Namespace, concurrency: int, page_pool: int) -> dict:
+    """Run one matrix cell in a child process and add its resource usage."""
+    command = [
+        sys.executable,
+        "-m",
+        "backend.benchmarks.scrape_bench",
+        "--worker",
+        "--base-url",
+        base_url,
+        "--max-concurrent",
+        str(concurrency),
+        "--page-pool-size",
+        str(page_pool),
+        "--detail-mode",
+        args.detail_mode,
+        "--listing-mode",
+        args.listing_mode,
+        "--max-rate",
+        str(args.max_rate),
+        "--parser",
+        args.parser,
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    assert process.stdout is not None
+    output = process.stdout.read()
+    # wait4 reports the child's own usage, including the browser processes it reaped
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    result: dict[str, Any] = {"concurrency": concurrency, "page_pool": page_pool}
+    lines = [line for line in output.splitlines() if line.startswith(RESULT_PREFIX)]
+    if process.returncode != 0 or not lines:
+        print(output[-2000:])
+        result["error"] = f"worker exited with {process.returncode}"
+        return result
+
+    result.update(json.loads(lines[-1][len(RESULT_PREFIX) :]))
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    rss_divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    result["peak_rss_mb"] = round(usage.ru_maxrss / rss_divisor, 1)
+    result["cpu_seconds"] = round(usage.ru_utime + usage.ru_stime, 2)
+    return result
+
+
+def start_site(site: FakeSite) -> str:
+    """Serve ``site`` from a background thread and return its base URL."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    base_url: list[str] = []
+
+    def serve() -> None:
+        asyncio.set_event_loop(loop)
+        base_url.append(loop.run_until_complete(site.start()))
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    started.wait()
+    return base_url[0]
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bills", type=int, default=200, help="Bills on the fake site")
+    parser.add_argument(
+        "--concurrency", type=_int_list, default=[2, 5, 10], help="max_concurrent values"
+    )
+    parser.add_argument("--page-pool", type=_int_list, default=[2, 5], help="page_pool_size values")
+    parser.add_argument("--detail-mode", default="auto", help="Scraper detail_mode")
+    parser.add_argument("--listing-mode", default="auto", help="Scraper listing_mode")
+    parser.add_argument("--parser", default="auto", help="HTML parser backend")
+    parser.add_argument("--max-rate", type=float, default=1000, help="Rate limiter ceiling (req/s)")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Delay added per response")
+    parser.add_argument(
+        "--client-rendered-details",
+        action="store_true",
+        help="Serve detail pages that only render in a browser",
+    )
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    # Internal: one scrape in a child process
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--max-concurrent", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--page-pool-size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    site = FakeSite(
+        args.bills,
+        latency=args.latency_ms / 1000,
+        client_rendered_details=args.client_rendered_details,
+    )
+    base_url = start_site(site)
+    print(
+        f"Fake site with {args.bills} bills at {base_url}, {args.latency_ms:.0f}ms latency, "
+        f"{'client' if args.client_rendered_details else 'server'}-rendered details"
+    )
+    print(
+        f"{'concurrency':>11}{'pool':>6}{'bills':>7}{'bills/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'RSS MB':>9}{'CPU s':>8}"
+    )
+
+    results = []
+    for concurrency, page_pool in itertools.product(args.concurrency, args.page_pool):
+        result = run_case(base_url, args, concurrency, page_pool)
+        results.append(result)
+        if "error" in result:
+            print(f"{concurrency:>11}{page_pool:>6}  {result['error']}")
+            continue
+        print(
+            f"{concurrency:>11}{page_pool:>6}{result['bills']:>7}{result['bills_per_second']:>9.1f}"
+            f"{result['p50_ms']:>9.0f}{result['p99_ms']:>9.0f}{result['peak_rss_mb']:>9.0f}"
+            f"{result['cpu_seconds']:>8.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "bills": args.bills,
+                    "latency_ms": args.latency_ms,
+                    "detail_mode": args.detail_mode,
+                    "listing_mode": args.listing_mode,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nWrote {args.output}")
+
+    if any("error" in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Crash-safe, append-only storage for scraped bill details."""
+
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+
+class DetailCache:
+    """Append-only JSON Lines cache keyed by bill detail URL.
+
+    Every update is appended to the log as one ``{"key": ..., "value": ...}`` line, so
+    writing a bill costs O(1) bytes instead of re-serializing the whole cache. Writes are
+    buffered and flushed in batches; the log is compacted (rewritten atomically with only
+    the latest value per key) when it accumulates too many superseded or damaged records.
+
+    Batches reached while scraping are appended and fsynced by a background writer
+    thread, so the event loop setting values never waits on the disk; ``flush`` and
+    ``close`` wait for them. A crash can at worst leave a truncated final line, which is
+    skipped on load and removed by the compaction that follows.
+
+    Values are JSON objects on disk. ``decode`` and ``encode`` let callers keep them as
+    a more compact type in memory (e.g. ``backend.models.BillDetails``).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_path: Path | None = None,
+        flush_every: int = 25,
+        flush_interval: float = 5.0,
+        decode: Callable[[dict[str, Any]], Any] | None = None,
+        encode: Callable[[Any], dict[str, Any]] | None = None,
+    ):
+        """Open (and load) the cache log.
+
+        Args:
+            path (Path): JSON Lines log file.
+            legacy_path (Path, optional): Old single-document JSON cache to migrate from
+                when ``path`` does not exist yet.
+            flush_every (int): Flush after this many buffered records. Default 25.
+            flush_interval (float): Flush when the oldest buffered record is older than
+                this many seconds. Default 5.0.
+            decode (callable, optional): Converts a loaded value to its in-memory form.
+            encode (callable, optional): Converts an in-memory value back to a dict.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._decode = decode
+        self._encode_value = encode
+        self._data: dict[str, Any] = {}
+        self._pending: list[str] = []
+        self._last_flush = time.monotonic()
+        self._stale_records = 0
+        # Background appends, in submission order; records of a failed append are kept
+        # by the writer thread and retried with the next batch
+        self._writer: ThreadPoolExecutor | None = None
+        self._writes: list[Future] = []
+        self._unwritten: list[str] = []
+
+        needs_compaction = False
+        if self.path.exists():
+            needs_compaction = self._load()
+        elif legacy_path is not None and legacy_path.exists():
+            needs_compaction = self._migrate(legacy_path)
+
+        if needs_compaction:
+            self.compact()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._data:
+            self._stale_records += 1
+        self._data[key] = value
+        self._pending.append(self._encode(key, value))
+
+        if (
+            len(self._pending) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._write_behind()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default``."""
+        return self._data.get(key, default)
+
+    def discard(self, key: str) -> None:
+        """Forget ``key``; its records stay in the log until the next compaction."""
+        if key in self._data:
+            del self._data[key]
+            self._stale_records += 1
+
+    def flush(self) -> None:
+        """Append buffered records to the log and wait until they are fsynced."""
+        self._write_behind()
+        self._wait_for_writes()
+
+    def _write_behind(self) -> None:
+        """Hand the buffered records to the writer thread without waiting for the disk."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detail-cache")
+        self._writes = [write for write in self._writes if not write.done()]
+        self._writes.append(self._writer.submit(self._append, self._pending))
+        self._pending = []
+
+    def _append(self, lines: list[str]) -> None:
+        """Append ``lines`` (after any earlier failed ones) and fsync; runs on the writer."""
+        lines = self._unwritten + lines
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+            self._unwritten = []
+        except OSError as e:
+            print(f"Warning: Could not save cache: {e}")
+            self._unwritten = lines
+
+    def _wait_for_writes(self) -> None:
+        wait(self._writes)
+        self._writes = []
+
+    def compact(self) -> None:
+        """Atomically rewrite the log with one record per key."""
+        self._wait_for_writes()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for key, value in self._data.items():
+                    f.write(self._encode(key, value))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._pending = []
+            self._unwritten = []
+            self._stale_records = 0
+        except OSError as e:
+            print(f"Warning: Could not compact cache: {e}")
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush pending records, compacting first if the log is mostly superseded."""
+        if self._stale_records > len(self._data) // 2:
+            self.compact()
+        else:
+            self.flush()
+        if self._writer is not None:
+            self._writer.shutdown()
+            self._writer = None
+
+    def _encode(self, key: str, value: Any) -> str:
+        if self._encode_value is not None:
+            value = self._encode_value(value)
+        return json.dumps({"key": key, "value": value}, ensure_ascii=False) + "\n"
+
+    def _load(self) -> bool:
+        """Replay the log into memory.
+
+        Returns:
+            bool: True if the log contained damaged records and should be compacted.
+        """
+        damaged = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Truncated tail from an interrupted write
+                        damaged += 1
+                        break
+                    try:
+                        record = json.loads(line)
+                        key, value = record["key"], record["value"]
+                    except (ValueError, KeyError, TypeError):
+                        damaged += 1
+                        continue
+                    if key in self._data:
+                        self._stale_records += 1
+                    self._data[key] = value if self._decode is None else self._decode(value)
+        except OSError as e:
+            print(f"Warning: Could not load cache: {e}")
+            return False
+
+        if damaged:
+            print(f"Warning: Skipped {damaged} damaged cache record(s) in {self.path}")
+        return damaged > 0 or self._stale_records > len(self._data)
+
+    def _migrate(self, legacy_path: Path) -> bool:
+        """Import a legacy ``bill_details_cache.json`` document.
+
+        Returns:
+            bool: True if anything was imported and the new log should be written.
+        """
+        try:
+            with open(legacy_path, encoding="utf-8") as f:
+                legacy = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load cache: {e}")
+            return False
+
+        if not isinstance(legacy, dict):
+            return False
+
+        for key, value in legacy.items():
+            self._data[key] = value if self._decode is None else self._decode(value)
+        print(f"Migrated {len(self._data)} cached details from {legacy_path} to {self.path}")
+        return bool(self._data)
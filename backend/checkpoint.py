@@ -0,0 +1,161 @@
+"""Listing progress checkpoints so an interrupted scrape can resume."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+CHECKPOINT_VERSION = 2
+
+
+class ScrapeCheckpoint:
+    """Records which listing pages are done and the bill stubs they produced.
+
+    Bill stubs are appended to a JSON Lines sidecar (``<path>.bills.jsonl``) as pages
+    are saved, so each save writes only the new stubs. The small JSON document at
+    ``path`` is rewritten atomically after every ``every_pages`` listed pages and
+    records how many sidecar lines belong to the saved progress; lines past that count
+    (from a save interrupted between the two writes) are ignored.
+
+    Fetched details are not stored here: they already survive in the detail cache, so
+    a resumed run re-queues the saved stubs (answered from the cache) and continues
+    the listing after the last completed page.
+    """
+
+    def __init__(self, path: Path, every_pages: int = 1):
+        """Create a checkpoint writer.
+
+        Args:
+            path (Path): Checkpoint JSON file.
+            every_pages (int): Listed pages between two writes. Default 1.
+        """
+        self.path = path
+        self.bills_path = path.with_name(path.name.removesuffix(".json") + ".bills.jsonl")
+        self.every_pages = max(1, every_pages)
+        self.source: str | None = None
+        self.last_page = 0
+        self.complete = False
+        self.bills: list[dict] = []
+        self._unsaved_pages = 0
+        self._saved_bills = 0
+        self._saved_offset = 0
+
+    def load(self) -> dict | None:
+        """Read a previous run's checkpoint and continue from it.
+
+        Returns:
+            Dict with ``source``, ``last_page``, ``complete`` and ``bill_count``, or None
+            if there is no usable checkpoint.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not read checkpoint {self.path}: {e}")
+            return None
+
+        if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+            print(f"Warning: Ignoring checkpoint {self.path} from an incompatible version")
+            return None
+
+        bill_count = state.get("bill_count", 0)
+        if not self._read_bills(bill_count):
+            return None
+
+        self.source = state.get("source")
+        self.last_page = state.get("last_page", 0)
+        self.complete = state.get("complete", False)
+        return state
+
+    def _read_bills(self, count: int) -> bool:
+        """Load the first ``count`` stubs of the sidecar; False if it has fewer."""
+        bills: list[dict] = []
+        offset = 0
+        if count:
+            try:
+                with open(self.bills_path, encoding="utf-8") as f:
+                    while len(bills) < count:
+                        line = f.readline()
+                        if not line.endswith("\n"):
+                            break
+                        bills.append(json.loads(line))
+                    offset = f.tell()
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Warning: Could not read checkpoint {self.bills_path}: {e}")
+                return False
+        if len(bills) < count:
+            print(f"Warning: Ignoring checkpoint {self.path}: its bill list is incomplete")
+            return False
+        self.bills = bills
+        self._saved_bills = count
+        self._saved_offset = offset
+        return True
+
+    def reset(self, source: str | None = None) -> None:
+        """Start over, e.g. when the listing is paged differently than before."""
+        self.source = source
+        self.last_page = 0
+        self.complete = False
+        self.bills = []
+        self._unsaved_pages = 0
+        self._saved_bills = 0
+        self._saved_offset = 0
+        self.bills_path.unlink(missing_ok=True)
+
+    def record_page(self, page_num: int, page_bills: list[dict]) -> None:
+        """Note a listed page, writing the checkpoint when one is due.
+
+        Args:
+            page_num (int): Listing page that was fully queued.
+            page_bills (list): Bill stubs found on that page.
+        """
+        self.bills.extend(page_bills)
+        self.last_page = page_num
+        self._unsaved_pages += 1
+        if self._unsaved_pages >= self.every_pages:
+            self.save()
+
+    def mark_complete(self) -> None:
+        """Record that the whole listing was walked."""
+        self.complete = True
+        self.save()
+
+    def save(self) -> None:
+        """Append the new stubs to the sidecar, then atomically write the progress."""
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "updated_at": time.time(),
+            "source": self.source,
+            "last_page": self.last_page,
+            "complete": self.complete,
+            "bill_count": len(self.bills),
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            if len(self.bills) > self._saved_bills:
+                # Drop lines of an interrupted save so the counts line up
+                mode = "r+" if self.bills_path.exists() else "w"
+                with open(self.bills_path, mode, encoding="utf-8") as f:
+                    f.seek(self._saved_offset)
+                    f.truncate()
+                    for bill in self.bills[self._saved_bills :]:
+                        f.write(json.dumps(bill, ensure_ascii=False) + "\n")
+                    offset = f.tell()
+            else:
+                offset = self._saved_offset
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not write checkpoint {self.path}: {e}")
+            return
+        self._saved_bills = len(self.bills)
+        self._saved_offset = offset
+        self._unsaved_pages = 0
+
+    def clear(self) -> None:
+        """Delete the checkpoint after a run finished."""
+        self.path.unlink(missing_ok=True)
+        self.reset()
@@ -0,0 +1,323 @@
+"""Versioned change deltas between consecutive scrape outputs.
+
+Each run that changes the data writes one delta file, so clients holding version ``n``
+can fetch only the deltas since ``n`` instead of the whole dataset::
+
+    deltas/
+        manifest.json       current version, bill count and the available deltas
+        000041.json         changes from version 40 to 41
+        000042.json         changes from version 41 to 42
+
+A delta is keyed by ``doc_number``::
+
+    {
+      "version": 42, "from": 41, "generated_at": 1767225600.0,
+      "added": [{...full bill...}],
+      "removed": ["HB 12"],
+      "changed": {
+        "HB 7": {
+          "caption": "New caption",
+          "status_history": {"start": 3, "delete": 0, "insert": [{"date": ..., "status": ...}]}
+        }
+      }
+    }
+
+Changed fields hold their new value (``null`` removes the field). Except
+``status_history``, which is a splice like JavaScript's ``Array.prototype.splice``:
+keep the first ``start`` events, drop the next ``delete`` and put ``insert`` in their
+place. New events added to either end of the history cost only those events.
+
+Usage:
+    python -m backend.deltas previous.json current.json [deltas_dir]
+    python -m backend.deltas --describe [deltas_dir]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from backend.output import iter_bills
+
+DELTAS_VERSION = 1
+DELTAS_MANIFEST = "manifest.json"
+# Deltas kept on disk; clients further behind reload the full dataset
+MAX_DELTAS = 60
+
+SPLICED_FIELDS = ("status_history",)
+
+
+def _digest(bill: dict) -> bytes:
+    encoded = json.dumps(bill, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def history_splice(old: list, new: list) -> dict:
+    """Describe ``new`` as one splice of ``old``: keep the common prefix and suffix."""
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[len(old) - 1 - end] == new[len(new) - 1 - end]:
+        end += 1
+    return {
+        "start": start,
+        "delete": len(old) - start - end,
+        "insert": new[start : len(new) - end],
+    }
+
+
+def apply_splice(items: list, splice: dict) -> list:
+    """Apply a ``history_splice`` result to ``items``."""
+    start: int = splice["start"]
+    inserted: list = splice["insert"]
+    return items[:start] + inserted + items[start + splice["delete"] :]
+
+
+def diff_bill(old: dict, new: dict) -> dict:
+    """Return the fields of ``new`` that differ from ``old`` (empty if none)."""
+    changes: dict[str, Any] = {}
+    for field in old.keys() | new.keys():
+        if field not in new:
+            changes[field] = None
+        elif old.get(field) != new[field]:
+            if field in SPLICED_FIELDS and isinstance(old.get(field), list):
+                changes[field] = history_splice(old[field], new[field])
+            else:
+                changes[field] = new[field]
+    return dict(sorted(changes.items()))
+
+
+def diff_outputs(previous: str | Path, current: str | Path) -> tuple[dict, int]:
+    """Compare two output files by ``doc_number`` without loading either of them.
+
+    The previous output is read twice: once to hash each bill, and once more for the
+    old records of the bills whose hash changed. Only the hashes, the added bills and
+    the changed bills are held in memory.
+
+    Args:
+        previous (str): Output file of the previous run.
+        current (str): Output file of this run.
+
+    Returns:
+        Tuple: The delta (``added`` full records, ``removed`` doc numbers and
+        ``changed`` doc number -> changed fields, in the order bills appear in the
+        outputs) and the number of bills in ``current``.
+
+    Raises:
+        OSError: If a file cannot be read.
+        ValueError: If a file is not a JSON array or JSON Lines file.
+    """
+    before: dict[str, bytes] = {}
+    for bill in iter_bills(previous):
+        if bill.get("doc_number"):
+            before[bill["doc_number"]] = _digest(bill)
+
+    count = 0
+    seen: set[str] = set()
+    added: dict[str, dict] = {}
+    updated: dict[str, dict] = {}
+    for bill in iter_bills(current):
+        count += 1
+        doc_number = bill.get("doc_number")
+        if not doc_number:
+            continue
+        seen.add(doc_number)
+        digest = before.get(doc_number)
+        if digest is None:
+            added[doc_number] = bill
+        elif digest != _digest(bill):
+            updated[doc_number] = bill
+        else:
+            updated.pop(doc_number, None)
+
+    changes_by_bill: dict[str, dict] = {}
+    if updated:
+        for old in iter_bills(previous):
+            new = updated.get(old.get("doc_number") or "")
+            if new is not None:
+                changes_by_bill[new["doc_number"]] = diff_bill(old, new)
+
+    delta = {
+        "added": list(added.values()),
+        "removed": [doc_number for doc_number in before if doc_number not in seen],
+        "changed": {
+            doc_number: changes_by_bill[doc_number]
+            for doc_number in updated
+            if changes_by_bill.get(doc_number)
+        },
+    }
+    return delta, count
+
+
+def apply_delta(bills: list[dict], delta: dict) -> list[dict]:
+    """Return ``bills`` with ``delta`` applied; new bills are appended at the end."""
+    removed = set(delta["removed"])
+    added: list[dict] = delta["added"]
+    result = []
+    for bill in bills:
+        doc_number = bill.get("doc_number")
+        if doc_number in removed:
+            continue
+        changes = delta["changed"].get(doc_number)
+        if changes:
+            bill = dict(bill)
+            for field, value in changes.items():
+                if value is None:
+                    bill.pop(field, None)
+                elif field in SPLICED_FIELDS and isinstance(value, dict):
+                    bill[field] = apply_splice(bill.get(field) or [], value)
+                else:
+                    bill[field] = value
+        result.append(bill)
+    return result + added
+
+
+def delta_file(version: int) -> str:
+    return f"{version:06d}.json"
+
+
+def load_deltas_manifest(deltas_dir: str | Path) -> dict | None:
+    """Read the deltas manifest, or return None if there is none (or it is unreadable)."""
+    path = Path(deltas_dir) / DELTAS_MANIFEST
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not read deltas manifest {path}: {e}")
+        return None
+    if not isinstance(manifest, dict) or manifest.get("format") != DELTAS_VERSION:
+        return None
+    return manifest
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def publish_delta(
+    previous: str | Path | None, current: str | Path, deltas_dir: str | Path = "deltas"
+) -> dict | None:
+    """Write the changes from ``previous`` to ``current`` as the next delta version.
+
+    Without a manifest yet, the current data becomes version 1 and no delta is written.
+    Deltas beyond the newest ``MAX_DELTAS`` are deleted.
+
+    Args:
+        previous (str, optional): Output file of the previous run (None, or a missing
+            file, if there was none).
+        current (str): Output file of this run.
+        deltas_dir (str): Directory holding the manifest and delta files. Default "deltas".
+
+    Returns:
+        Dict: The manifest entry of the new delta, or None if nothing changed or no
+        delta could be written (a new baseline).
+    """
+    deltas_path = Path(deltas_dir)
+    deltas_path.mkdir(parents=True, exist_ok=True)
+    manifest = load_deltas_manifest(deltas_path)
+    now = time.time()
+
+    if previous is not None and not Path(previous).exists():
+        previous = None
+    try:
+        if manifest is None or previous is None:
+            count = sum(1 for _ in iter_bills(current))
+        else:
+            delta, count = diff_outputs(previous, current)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Could not compare {previous} and {current} for deltas: {e}")
+        return None
+
+    if manifest is None or previous is None:
+        print(f"  Deltas: starting a new baseline in {deltas_path}/")
+        version = manifest["version"] + 1 if manifest else 1
+        _save_deltas_manifest(
+            deltas_path,
+            {"format": DELTAS_VERSION, "version": version, "deltas": []},
+            count,
+            now,
+        )
+        return None
+
+    if not (delta["added"] or delta["removed"] or delta["changed"]):
+        print(f"  Deltas: no changes since v{manifest['version']}")
+        return None
+
+    version = manifest["version"] + 1
+    content = json.dumps(
+        {"version": version, "from": version - 1, "generated_at": now, **delta},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    _write_atomic(deltas_path / delta_file(version), content)
+
+    entry = {
+        "version": version,
+        "from": version - 1,
+        "file": delta_file(version),
+        "generated_at": now,
+        "added": len(delta["added"]),
+        "removed": len(delta["removed"]),
+        "changed": len(delta["changed"]),
+        "bytes": len(content.encode("utf-8")),
+    }
+    manifest["deltas"] = (manifest["deltas"] + [entry])[-MAX_DELTAS:]
+    manifest["version"] = version
+    _save_deltas_manifest(deltas_path, manifest, count, now)
+    print(f"  Deltas: {describe(entry)} in {deltas_path}/")
+    return entry
+
+
+def _save_deltas_manifest(deltas_dir: Path, manifest: dict, count: int, now: float) -> None:
+    manifest.update(count=count, generated_at=now)
+    kept = {entry["file"] for entry in manifest["deltas"]}
+    for stale in deltas_dir.glob("[0-9]*.json"):
+        if stale.name not in kept:
+            stale.unlink()
+    _write_atomic(deltas_dir / DELTAS_MANIFEST, json.dumps(manifest, indent=2) + "\n")
+
+
+def describe(entry: dict) -> str:
+    """One-line summary of a manifest entry."""
+    return (
+        f"v{entry['version']}: {entry['added']} added, {entry['removed']} removed, "
+        f"{entry['changed']} changed ({entry['bytes'] / 1024:.1f} KiB)"
+    )
+
+
+def describe_latest(deltas_dir: str | Path) -> str:
+    """Summarize the current version: its delta, or that it is a new baseline."""
+    manifest = load_deltas_manifest(deltas_dir)
+    if manifest is None:
+        return "no deltas"
+    latest = manifest["deltas"][-1] if manifest["deltas"] else None
+    if latest is None or latest["version"] != manifest["version"]:
+        return f"v{manifest['version']}: new baseline of {manifest['count']} bills"
+    return describe(latest)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--describe":
+        print(describe_latest(sys.argv[2] if len(sys.argv) > 2 else "deltas"))
+        sys.exit(0)
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m backend.deltas previous.json current.json [deltas_dir]")
+        print("       python -m backend.deltas --describe [deltas_dir]")
+        sys.exit(1)
+
+    if not Path(sys.argv[2]).exists():
+        print(f"Error: Could not read {sys.argv[2]}")
+        sys.exit(1)
+    deltas_dir = sys.argv[3] if len(sys.argv) > 3 else "deltas"
+
+    publish_delta(sys.argv[1], sys.argv[2], deltas_dir)
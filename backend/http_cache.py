@@ -0,0 +1,134 @@
+"""HTTP validator and response-body cache for conditional requests."""
+
+import gzip
+import hashlib
+import os
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from backend.cache import DetailCache
+
+# Bodies not stored or revalidated for this long are deleted when the cache is closed
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+
+class HttpCache:
+    """Remembers ETag/Last-Modified validators and bodies per URL.
+
+    Validators are kept in an append-only ``index.jsonl`` (see ``DetailCache``) and
+    bodies as gzip files named by URL hash, so a ``304 Not Modified`` response can be
+    answered from disk. The directory is only created when the first response is
+    stored. Closing the cache deletes bodies that are no longer indexed or were not
+    used for ``max_age_days``.
+    """
+
+    def __init__(self, directory: Path, max_age_days: float = DEFAULT_MAX_AGE_DAYS):
+        """Open the cache directory (if it exists yet).
+
+        Args:
+            directory (Path): Directory holding the index and body files.
+            max_age_days (float): Delete bodies not stored or revalidated for this many
+                days. Default 30.
+        """
+        self.directory = directory
+        self.bodies_dir = directory / "bodies"
+        self.max_age = max_age_days * 24 * 3600
+        self.index = DetailCache(directory / "index.jsonl")
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for a cached URL."""
+        entry = self.index.get(url)
+        if entry is None or not self._body_path(url).exists():
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def load_body(self, url: str) -> str | None:
+        """Return the stored body for ``url``, or None if it is missing or unreadable.
+
+        A body that is read (after a 304) counts as used again for ``max_age_days``.
+        """
+        path = self._body_path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                body = f.read()
+            os.utime(path)
+        except (OSError, EOFError):
+            return None
+        return body
+
+    def store(self, url: str, headers: Mapping[str, str], body: str) -> None:
+        """Save a 200 response if it carries validators.
+
+        Args:
+            url (str): Request URL.
+            headers: Response headers.
+            body (str): Decoded response body.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        path = self._body_path(url)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not cache response for {url}: {e}")
+            return
+
+        self.index[url] = {"etag": etag, "last_modified": last_modified}
+
+    def flush(self) -> None:
+        """Write buffered validator records to disk."""
+        self.index.flush()
+
+    def prune(self) -> int:
+        """Delete expired bodies and bodies whose URL is no longer in the index.
+
+        Index entries whose body is gone are dropped as well.
+
+        Returns:
+            int: Number of body files deleted.
+        """
+        if not self.bodies_dir.is_dir():
+            return 0
+
+        indexed = {self._body_path(url).name: url for url in self.index}
+        oldest = time.time() - self.max_age
+        kept = set()
+        removed = 0
+        for path in self.bodies_dir.iterdir():
+            try:
+                if path.name in indexed and path.stat().st_mtime >= oldest:
+                    kept.add(path.name)
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                print(f"Warning: Could not prune cached response {path}: {e}")
+
+        for name, url in indexed.items():
+            if name not in kept:
+                self.index.discard(url)
+        return removed
+
+    def close(self) -> None:
+        """Prune old bodies and flush the validator index."""
+        if self.prune():
+            self.index.compact()
+        self.index.close()
+
+    def _body_path(self, url: str) -> Path:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.bodies_dir / f"{digest}.html.gz"
@@ -0,0 +1,59 @@
+"""Freshness rules for incremental re-scrapes of cached bill details."""
+
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+
+from backend.models import Bill, BillDetails, StatusEvent
+
+# Statuses after which a bill's history no longer changes
+FINAL_STATUS_MARKERS = ("effective date", "signed by governor", "vetoed", "veto v")
+
+
+def listing_fingerprint(bill: Bill | dict) -> str:
+    """Hash the listing fields of a bill so changes to its row can be detected.
+
+    Args:
+        bill (Bill | dict): Bill stub with caption, committees and sponsors.
+
+    Returns:
+        str: Short hex digest of the listing row.
+    """
+    row = [bill.get("caption", ""), bill.get("committees", []), bill.get("sponsors", [])]
+    encoded = json.dumps(row, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def is_final(status_history: Sequence[StatusEvent]) -> bool:
+    """Return True if the latest status means the bill will not move again."""
+    if not status_history:
+        return False
+    latest = max(status_history, key=lambda event: event.date)
+    status = latest.status.lower()
+    return any(marker in status for marker in FINAL_STATUS_MARKERS)
+
+
+def needs_refresh(entry: BillDetails, fingerprint: str | None, ttl_seconds: float) -> bool:
+    """Decide whether a cached detail entry should be fetched again.
+
+    An entry is refreshed when its listing row changed, or when the bill is still
+    active and the entry is older than ``ttl_seconds``. Entries written before
+    fetch times were recorded count as stale.
+
+    Args:
+        entry (BillDetails): Cached detail entry.
+        fingerprint (str, optional): Fingerprint of the bill's current listing row.
+        ttl_seconds (float): Maximum age of details for bills that are still active.
+
+    Returns:
+        bool: True if the details should be fetched again.
+    """
+    if fingerprint is not None and entry.fingerprint != fingerprint:
+        return True
+    if is_final(entry.status_history or ()):
+        return False
+    fetched_at = entry.fetched_at
+    if not isinstance(fetched_at, int | float):
+        return True
+    return time.time() - fetched_at > ttl_seconds
@@ -0,0 +1,231 @@
+"""Direct access to the JSON search endpoint behind the legislation listing.
+
+The listing page at ``/legislation/all`` is a single-page app that loads each page of
+results from a JSON endpoint. Instead of clicking through the rendered pagination, the
+scraper watches the SPA's first request once, describes it as a ``ListingEndpoint`` and
+then pages through the endpoint directly with aiohttp.
+
+The endpoint's exact shape is not documented, so field and parameter names are matched
+against the common spellings below.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+
+PAGE_KEYS = ("page", "pageNumber", "pageIndex", "currentPage", "pageNum")
+SIZE_KEYS = ("pageSize", "perPage", "limit", "take", "size", "rows", "itemsPerPage")
+OFFSET_KEYS = ("skip", "offset", "start", "startIndex")
+RECORD_KEYS = ("results", "items", "data", "records", "legislation", "documents", "rows")
+TOTAL_KEYS = ("total", "totalCount", "totalResults", "totalRecords", "count", "totalItems")
+
+DOC_NUMBER_KEYS = ("docNumber", "documentNumber", "doc_number", "number", "billNumber")
+CAPTION_KEYS = ("caption", "title", "shortTitle", "description")
+ID_KEYS = ("id", "legislationId", "documentId")
+NAME_KEYS = ("name", "fullName", "displayName", "title")
+
+# Headers that belong to the browser connection rather than the API request
+SKIPPED_HEADERS = {"content-length", "host", "cookie", "accept-encoding", "connection"}
+
+
+@dataclass
+class ListingEndpoint:
+    """A replayable description of the SPA's listing request."""
+
+    method: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: dict[str, Any] | None = None
+    page_key: str | None = None
+    size_key: str | None = None
+    offset_key: str | None = None
+    in_body: bool = False
+    first_page: int = 1
+
+    def request_for(self, page_index: int, page_size: int) -> tuple[str, dict[str, Any] | None]:
+        """Build the URL and JSON body for a zero-based page index.
+
+        Args:
+            page_index (int): Zero-based page to request.
+            page_size (int): Number of records per page.
+
+        Returns:
+            Tuple of the request URL and the JSON body (None for GET requests).
+        """
+        params: dict[str, Any] = {}
+        if self.page_key:
+            params[self.page_key] = page_index + self.first_page
+        if self.offset_key:
+            params[self.offset_key] = page_index * page_size
+        if self.size_key:
+            params[self.size_key] = page_size
+
+        if self.in_body:
+            return self.url, {**(self.body or {}), **params}
+
+        parts = urlsplit(self.url)
+        query = dict(parse_qsl(parts.query))
+        query.update({key: str(value) for key, value in params.items()})
+        return urlunsplit(parts._replace(query=urlencode(query))), self.body
+
+
+def first_key(mapping: dict, keys: tuple[str, ...]) -> str | None:
+    """Return the key of ``mapping`` matching the first of ``keys``, ignoring case."""
+    lowered = {str(key).lower(): key for key in mapping}
+    for key in keys:
+        if key.lower() in lowered:
+            return lowered[key.lower()]  # type: ignore[no-any-return]
+    return None
+
+
+def extract_records(payload: Any) -> list[dict]:
+    """Return the list of result records in a listing response, or an empty list."""
+    if isinstance(payload, list):
+        return [record for record in payload if isinstance(record, dict)]
+    if isinstance(payload, dict):
+        key = first_key(payload, RECORD_KEYS)
+        if key is not None:
+            return extract_records(payload[key])
+    return []
+
+
+def extract_total(payload: Any) -> int | None:
+    """Return the total result count advertised by a listing response, if any."""
+    if isinstance(payload, dict):
+        key = first_key(payload, TOTAL_KEYS)
+        if key is not None and isinstance(payload[key], int):
+            return payload[key]  # type: ignore[no-any-return]
+    return None
+
+
+def _names(value: Any) -> list[str]:
+    """Normalize a sponsor/committee field into a list of display names."""
+    if isinstance(value, str):
+        return [value.strip()] if value.strip() else []
+    if isinstance(value, dict):
+        key = first_key(value, NAME_KEYS)
+        return _names(value[key]) if key is not None else []
+    if isinstance(value, list):
+        return [name for item in value for name in _names(item)]
+    return []
+
+
+def record_to_bill(record: dict, base_url: str) -> dict | None:
+    """Convert one API record into the bill stub produced by the HTML listing.
+
+    Args:
+        record (dict): Result record from the listing endpoint.
+        base_url (str): Site root used to build detail URLs.
+
+    Returns:
+        Dict with doc_number, caption, committees, sponsors and detail_url, or None if
+        the record does not look like a bill.
+    """
+    doc_key = first_key(record, DOC_NUMBER_KEYS)
+    id_key = first_key(record, ID_KEYS)
+    if doc_key is None or id_key is None:
+        return None
+
+    doc_number = str(record[doc_key]).strip().replace(" ", "")
+    if not doc_number:
+        return None
+
+    caption_key = first_key(record, CAPTION_KEYS)
+    sponsors_key = first_key(record, ("sponsors", "authors", "sponsor"))
+    committees_key = first_key(record, ("committees", "committee"))
+
+    return {
+        "doc_number": doc_number,
+        "caption": str(record[caption_key]).strip() if caption_key else "",
+        "committees": _names(record[committees_key]) if committees_key else [],
+        "sponsors": _names(record[sponsors_key]) if sponsors_key else [],
+        "detail_url": f"{base_url}/legislation/{record[id_key]}",
+    }
+
+
+def endpoint_from_request(
+    method: str,
+    url: str,
+    post_data: str | None,
+    headers: dict[str, str],
+    payload: Any,
+    base_url: str,
+) -> ListingEndpoint | None:
+    """Recognize a captured XHR/fetch request as the paginated listing endpoint.
+
+    Args:
+        method (str): HTTP method of the captured request.
+        url (str): Full request URL.
+        post_data (str, optional): Raw request body.
+        headers (dict): Request headers sent by the browser.
+        payload: Decoded JSON response.
+        base_url (str): Site root used to validate that records are bills.
+
+    Returns:
+        ListingEndpoint if the request returns bill records and carries recognizable
+        pagination parameters, otherwise None.
+    """
+    records = extract_records(payload)
+    if not records or record_to_bill(records[0], base_url) is None:
+        return None
+
+    body: dict[str, Any] | None = None
+    if post_data:
+        try:
+            decoded = json.loads(post_data)
+        except ValueError:
+            return None
+        if isinstance(decoded, dict):
+            body = decoded
+
+    in_body = body is not None
+    params: dict[str, Any] = body if body is not None else dict(parse_qsl(urlsplit(url).query))
+
+    page_key = first_key(params, PAGE_KEYS)
+    offset_key = first_key(params, OFFSET_KEYS)
+    if page_key is None and offset_key is None:
+        return None
+
+    first_page = 1
+    if page_key is not None and str(params[page_key]) == "0":
+        first_page = 0
+
+    return ListingEndpoint(
+        method=method.upper(),
+        url=url,
+        headers={k: v for k, v in headers.items() if k.lower() not in SKIPPED_HEADERS},
+        body=body,
+        page_key=page_key,
+        size_key=first_key(params, SIZE_KEYS),
+        offset_key=offset_key,
+        in_body=in_body,
+        first_page=first_page,
+    )
+
+
+async def fetch_listing_page(
+    session: aiohttp.ClientSession,
+    endpoint: ListingEndpoint,
+    page_index: int,
+    page_size: int,
+) -> Any:
+    """Request one page of results from the listing endpoint.
+
+    Args:
+        session: aiohttp session.
+        endpoint (ListingEndpoint): Endpoint captured from the SPA.
+        page_index (int): Zero-based page to request.
+        page_size (int): Number of records per page.
+
+    Returns:
+        Decoded JSON response.
+    """
+    url, body = endpoint.request_for(page_index, page_size)
+    async with session.request(
+        endpoint.method, url, json=body, headers=endpoint.headers
+    ) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
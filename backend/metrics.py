@@ -0,0 +1,232 @@
+"""Run metrics: per-phase timings, latency histograms, counters and gauges.
+
+A scrape records how long each phase takes (navigation, DOM waits, content
+serialization, parsing, HTTP requests, cache I/O), how often requests are retried and
+how deep the detail queue gets. At the end of a run the metrics are written as a JSON
+report and in the Prometheus text format (for the node_exporter textfile collector
+or a Pushgateway), so runs can be compared.
+"""
+
+import bisect
+import json
+import os
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+METRICS_VERSION = 1
+METRIC_PREFIX = "ga_scraper"
+
+# Upper bounds in seconds, from cache reads to slow page loads
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with count, sum and max.
+
+    Quantiles are estimated from the buckets unless the raw samples are kept.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max", "samples")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, keep_samples: bool = False):
+        self.buckets = buckets
+        self.samples: list[float] | None = [] if keep_samples else None
+        # One extra slot for observations above the last bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        if self.samples is not None:
+            self.samples.append(value)
+
+    def quantile(self, q: float) -> float:
+        """Return a quantile: exact from kept samples, else the bound of its bucket."""
+        if not self.count:
+            return 0.0
+        if self.samples:
+            ordered = sorted(self.samples)
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 6),
+        }
+
+
+class ScrapeMetrics:
+    """Collects timings, counters and gauges for one scrape run."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, keep_samples: bool = False):
+        """Start a new run.
+
+        Args:
+            buckets (tuple): Histogram bucket upper bounds in seconds.
+            keep_samples (bool): Keep every observation for exact quantiles (e.g. in
+                benchmarks). Default False.
+        """
+        self.buckets = buckets
+        self.keep_samples = keep_samples
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.phases: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, dict[str, float]] = {}
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block (including awaits) as one observation of ``phase``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Record a duration for ``phase``."""
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram(self.buckets, self.keep_samples)
+        histogram.observe(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge, remembering the highest value seen."""
+        gauge = self.gauges.get(name)
+        if gauge is None:
+            self.gauges[name] = {"last": value, "max": value}
+        else:
+            gauge["last"] = value
+            gauge["max"] = max(gauge["max"], value)
+
+    @property
+    def wall_seconds(self) -> float:
+        return time.perf_counter() - self._started
+
+    def report(self, stats: dict | None = None) -> dict:
+        """Return the metrics as a JSON-serializable dict.
+
+        Args:
+            stats (dict, optional): Scraper statistics to include.
+        """
+        return {
+            "version": METRICS_VERSION,
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "phases": {name: h.to_dict() for name, h in sorted(self.phases.items())},
+            "counters": dict(sorted(self.counters.items())),
+            "gauges": dict(sorted(self.gauges.items())),
+            "stats": stats or {},
+        }
+
+    def to_prometheus(self, stats: dict | None = None) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {METRIC_PREFIX}_wall_seconds Wall time of the last scrape.",
+            f"# TYPE {METRIC_PREFIX}_wall_seconds gauge",
+            f"{METRIC_PREFIX}_wall_seconds {self.wall_seconds:.3f}",
+            f"# HELP {METRIC_PREFIX}_started_timestamp_seconds Start time of the last scrape.",
+            f"# TYPE {METRIC_PREFIX}_started_timestamp_seconds gauge",
+            f"{METRIC_PREFIX}_started_timestamp_seconds {self.started_at:.3f}",
+        ]
+
+        if self.phases:
+            name = f"{METRIC_PREFIX}_phase_seconds"
+            lines += [
+                f"# HELP {name} Time spent per scrape phase.",
+                f"# TYPE {name} histogram",
+            ]
+            for phase_name, histogram in sorted(self.phases.items()):
+                phase = _label_value(phase_name)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+                lines += [
+                    f'{name}_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}',
+                    f'{name}_sum{{phase="{phase}"}} {histogram.sum:.6f}',
+                    f'{name}_count{{phase="{phase}"}} {histogram.count}',
+                ]
+
+        if self.counters:
+            name = f"{METRIC_PREFIX}_events_total"
+            lines += [f"# HELP {name} Events counted during the scrape.", f"# TYPE {name} counter"]
+            lines += [
+                f'{name}{{event="{_label_value(event)}"}} {value}'
+                for event, value in sorted(self.counters.items())
+            ]
+
+        for gauge_name, gauge in sorted(self.gauges.items()):
+            name = f"{METRIC_PREFIX}_{_metric_name(gauge_name)}"
+            lines += [
+                f"# TYPE {name} gauge",
+                f"{name} {gauge['last']}",
+                f"# TYPE {name}_max gauge",
+                f"{name}_max {gauge['max']}",
+            ]
+
+        if stats:
+            name = f"{METRIC_PREFIX}_run_stat"
+            lines += [f"# HELP {name} Scraper statistics of the last run.", f"# TYPE {name} gauge"]
+            lines += [
+                f'{name}{{stat="{_label_value(key)}"}} {value}'
+                for key, value in sorted(stats.items())
+                if isinstance(value, int | float)
+            ]
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_file: Path, stats: dict | None = None) -> Path:
+        """Atomically write the JSON report and its ``.prom`` sibling.
+
+        Args:
+            json_file (Path): JSON report path.
+            stats (dict, optional): Scraper statistics to include.
+
+        Returns:
+            Path: The Prometheus text file that was written.
+        """
+        prom_file = json_file.with_suffix(".prom")
+        _write_atomic(json_file, json.dumps(self.report(stats), indent=2) + "\n")
+        _write_atomic(prom_file, self.to_prometheus(stats))
+        return prom_file
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label_value(value: str) -> str:
+    """Escape a label value for the text format (backslash, double quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
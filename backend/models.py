@@ -0,0 +1,213 @@
+"""Compact in-memory records for scraped bills.
+
+A bill dict costs a hash table per bill and per status event, and every copy of a
+sponsor, committee, date or status string ("House Second Readers") is a separate
+object. These slotted records hold the same data with interned strings and tuples, so
+the bills collected by a run and the detail cache entries share one copy of each
+repeated string (and a bill shares its status history with its cache entry).
+
+Conversion is lossless: ``Bill.from_dict(bill).to_dict() == bill`` for any bill dict,
+including fields this module does not know (kept in ``extra``) and fields with an
+unexpected shape (kept verbatim in ``extra``, so validation still reports them).
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+# Bill fields in the order the listing parsers emit them
+LISTING_FIELDS = ("doc_number", "caption", "committees", "sponsors", "detail_url")
+
+
+def _names(value: list) -> tuple[str, ...] | None:
+    if not all(isinstance(item, str) for item in value):
+        return None
+    return tuple(sys.intern(item) for item in value)
+
+
+@dataclass(slots=True)
+class StatusEvent:
+    """One entry of a bill's status history."""
+
+    date: str
+    status: str
+
+    @classmethod
+    def from_dict(cls, item: dict) -> "StatusEvent | None":
+        """Return the event for a ``{"date", "status"}`` dict, or None for any other shape."""
+        if len(item) != 2 or not isinstance(item.get("date"), str):
+            return None
+        if not isinstance(item.get("status"), str):
+            return None
+        return cls(sys.intern(item["date"]), sys.intern(item["status"]))
+
+    def to_dict(self) -> dict[str, str]:
+        return {"date": self.date, "status": self.status}
+
+
+def _history(value: list) -> tuple[StatusEvent, ...] | None:
+    events = []
+    for item in value:
+        event = StatusEvent.from_dict(item) if isinstance(item, dict) else None
+        if event is None:
+            return None
+        events.append(event)
+    return tuple(events)
+
+
+def _history_dicts(events: tuple[StatusEvent, ...]) -> list[dict[str, str]]:
+    return [event.to_dict() for event in events]
+
+
+def _split_details(data: dict, extra: dict[str, Any]) -> tuple[str | None, tuple | None]:
+    """Pop the detail fields of ``data`` into typed values; odd shapes go to ``extra``."""
+    summary = None
+    if "first_reader_summary" in data:
+        summary = data.pop("first_reader_summary")
+        if not isinstance(summary, str):
+            extra["first_reader_summary"] = summary
+            summary = None
+
+    events = None
+    if "status_history" in data:
+        history = data.pop("status_history")
+        events = _history(history) if isinstance(history, list) else None
+        if events is None:
+            extra["status_history"] = history
+    return summary, events
+
+
+@dataclass(slots=True)
+class BillDetails:
+    """Detail page fields of a bill, as kept in the detail cache.
+
+    ``None`` marks a field the source dict did not have.
+    """
+
+    first_reader_summary: str | None = None
+    status_history: tuple[StatusEvent, ...] | None = None
+    fetched_at: int | float | None = None
+    fingerprint: str | None = None
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict,
+        fetched_at: int | float | None = None,
+        fingerprint: str | None = None,
+    ) -> "BillDetails":
+        """Build the record of a detail dict or a cache entry.
+
+        Args:
+            data (dict): ``first_reader_summary`` and ``status_history``, and for cache
+                entries ``fetched_at`` and ``fingerprint``.
+            fetched_at (int, optional): Fetch time, if ``data`` has none.
+            fingerprint (str, optional): Listing fingerprint, if ``data`` has none.
+        """
+        data = dict(data)
+        extra: dict[str, Any] = {}
+        summary, events = _split_details(data, extra)
+        fetched_at = data.pop("fetched_at", fetched_at)
+        fingerprint = data.pop("fingerprint", fingerprint)
+        extra.update(data)
+        return cls(summary, events, fetched_at, fingerprint, extra or None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the cache entry dict."""
+        result: dict[str, Any] = {}
+        if self.first_reader_summary is not None:
+            result["first_reader_summary"] = self.first_reader_summary
+        if self.status_history is not None:
+            result["status_history"] = _history_dicts(self.status_history)
+        if self.extra:
+            result.update(self.extra)
+        if self.fetched_at is not None:
+            result["fetched_at"] = self.fetched_at
+        if self.fingerprint is not None:
+            result["fingerprint"] = self.fingerprint
+        return result
+
+
+@dataclass(slots=True)
+class Bill:
+    """One bill: its listing row plus, once fetched, its detail fields.
+
+    ``None`` marks a field the source dict did not have.
+    """
+
+    doc_number: str | None = None
+    caption: str | None = None
+    committees: tuple[str, ...] | None = None
+    sponsors: tuple[str, ...] | None = None
+    detail_url: str | None = None
+    first_reader_summary: str | None = None
+    status_history: tuple[StatusEvent, ...] | None = None
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Bill":
+        """Build the record of a bill dict (a listing stub or a full bill)."""
+        data = dict(data)
+        extra: dict[str, Any] = {}
+        values: dict[str, Any] = {}
+        for field in LISTING_FIELDS:
+            if field not in data:
+                continue
+            raw = data.pop(field)
+            if field in ("committees", "sponsors"):
+                names = _names(raw) if isinstance(raw, list) else None
+                if names is None:
+                    extra[field] = raw
+                values[field] = names
+            else:
+                text = raw if isinstance(raw, str) else None
+                if text is None:
+                    extra[field] = raw
+                values[field] = text
+        summary, events = _split_details(data, extra)
+        extra.update(data)
+        return cls(
+            first_reader_summary=summary, status_history=events, extra=extra or None, **values
+        )
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Return a field like ``to_dict().get(field, default)`` without building the dict.
+
+        Names and status history come back as the record's tuples rather than lists.
+        """
+        value = getattr(self, field) if field in _BILL_FIELDS else None
+        if field in LISTING_FIELDS and value is not None:
+            return value
+        if self.extra and field in self.extra:
+            return self.extra[field]
+        return default if value is None else value
+
+    def apply_details(self, details: BillDetails) -> None:
+        """Take over the detail fields of ``details`` (like ``dict.update``)."""
+        if details.first_reader_summary is not None:
+            self.first_reader_summary = details.first_reader_summary
+        if details.status_history is not None:
+            self.status_history = details.status_history
+        if details.extra:
+            self.extra = {**(self.extra or {}), **details.extra}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the bill in the JSON output schema."""
+        result: dict[str, Any] = {}
+        for field in LISTING_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = list(value) if isinstance(value, tuple) else value
+            elif self.extra and field in self.extra:
+                result[field] = self.extra[field]
+        if self.first_reader_summary is not None:
+            result["first_reader_summary"] = self.first_reader_summary
+        if self.status_history is not None:
+            result["status_history"] = _history_dicts(self.status_history)
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+_BILL_FIELDS = frozenset(LISTING_FIELDS + ("first_reader_summary", "status_history"))
@@ -0,0 +1,190 @@
+"""Streaming output of scraped bills, and reading it back one bill at a time."""
+
+import heapq
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from backend.models import Bill
+
+
+class StreamingBillWriter:
+    """Writes each bill to disk as soon as it is scraped, skipping duplicate doc numbers.
+
+    Bills are appended to a JSON Lines file, which is flushed per record so partial
+    results can be read while the scrape runs. Optionally the same bills are streamed
+    into a JSON array (formatted like ``json.dump(bills, indent=2)``) in a temporary
+    file that replaces ``json_file`` only when the writer is closed successfully, so
+    an interrupted run never truncates the previous output the frontend reads.
+    """
+
+    def __init__(self, jsonl_file: Path, json_file: Path | None = None):
+        """Open the output files.
+
+        Args:
+            jsonl_file (Path): JSON Lines file, one bill per line.
+            json_file (Path, optional): JSON array file. None writes JSON Lines only.
+        """
+        self.jsonl_file = jsonl_file
+        self.json_file = json_file
+        self.written = 0
+        self.duplicates = 0
+        self._seen: set[str] = set()
+
+        self._jsonl: IO[str] = open(jsonl_file, "w", encoding="utf-8")
+        self._array: IO[str] | None = None
+        self._array_tmp: Path | None = None
+        if json_file is not None:
+            self._array_tmp = json_file.with_name(json_file.name + ".tmp")
+            self._array = open(self._array_tmp, "w", encoding="utf-8")
+
+    def __enter__(self) -> "StreamingBillWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(commit=exc_type is None)
+
+    def write(self, bill: dict) -> bool:
+        """Write a bill unless its doc number was already written.
+
+        Args:
+            bill (dict): Validated legislation record.
+
+        Returns:
+            bool: True if the bill was written, False if it was a duplicate.
+        """
+        doc_num = bill.get("doc_number")
+        if not doc_num or doc_num in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(doc_num)
+
+        self._jsonl.write(json.dumps(bill, ensure_ascii=False) + "\n")
+        self._jsonl.flush()
+
+        if self._array is not None:
+            item = json.dumps(bill, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+            self._array.write(("[\n  " if not self.written else ",\n  ") + item)
+
+        self.written += 1
+        return True
+
+    def close(self, commit: bool = True) -> None:
+        """Finish the output files.
+
+        Args:
+            commit (bool): Replace ``json_file`` with the streamed array. Pass False
+                after a failed run to keep the previous file. Default True.
+        """
+        self._jsonl.close()
+        if self._array is None or self._array_tmp is None:
+            return
+
+        self._array.write("\n]" if self.written else "[]")
+        self._array.close()
+        self._array = None
+        if commit and self.json_file is not None:
+            os.replace(self._array_tmp, self.json_file)
+        else:
+            self._array_tmp.unlink(missing_ok=True)
+
+
+class OrderedBillSink:
+    """Releases bills finished out of order to the writer and results in listing order.
+
+    Detail workers finish bills in whatever order their requests complete. Each bill
+    is numbered when it is queued; finished bills wait in a heap until every bill
+    queued before them has finished (or failed), so the output order matches the
+    listing like a sequential scrape would.
+    """
+
+    def __init__(self, results: list[Bill] | None, writer: StreamingBillWriter | None = None):
+        """Create a sink.
+
+        Args:
+            results (list, optional): List that released bills are appended to.
+            writer (StreamingBillWriter, optional): Writer that released bills go to.
+        """
+        self.results = results
+        self.writer = writer
+        self.queued = 0
+        self._next = 0
+        self._done: list[tuple[int, Bill | None]] = []
+
+    def ticket(self) -> int:
+        """Return the sequence number of the next queued bill."""
+        self.queued += 1
+        return self.queued - 1
+
+    def finish(self, seq: int, bill: Bill | None) -> None:
+        """Record a finished bill and release every bill that is now in order.
+
+        Args:
+            seq (int): Sequence number from ``ticket()``.
+            bill (Bill, optional): Validated bill, or None if it failed.
+        """
+        heapq.heappush(self._done, (seq, bill))
+        while self._done and self._done[0][0] == self._next:
+            _, ready = heapq.heappop(self._done)
+            self._next += 1
+            if ready is None:
+                continue
+            if self.writer is not None:
+                self.writer.write(ready.to_dict())
+            if self.results is not None:
+                self.results.append(ready)
+
+
+def iter_bills(path: str | Path) -> Iterator[dict]:
+    """Yield bills from a JSON Lines file or a JSON array file one at a time.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a JSON array or JSON Lines file.
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f)
+
+
+def _iter_json_array(f: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Decode the items of a JSON array without holding the whole document."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    started = False
+    after_item = False
+    while True:
+        buffer = buffer.lstrip()
+        if not started and buffer.startswith("["):
+            buffer = buffer[1:].lstrip()
+            started = True
+        elif after_item and buffer.startswith(","):
+            buffer = buffer[1:].lstrip()
+            after_item = False
+        if started and buffer.startswith("]"):
+            return
+        try:
+            if not started or after_item or not buffer:
+                raise json.JSONDecodeError("Expecting a JSON array", buffer, 0)
+            item, end = decoder.raw_decode(buffer)
+            if buffer[end:].lstrip()[:1] not in (",", "]") and not eof:
+                # A number could continue in the next chunk
+                raise json.JSONDecodeError("Incomplete item", buffer, end)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield item
+        buffer = buffer[end:]
+        after_item = True
@@ -0,0 +1,107 @@
+"""Pool of Playwright pages with exclusive checkout."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class PagePool:
+    """Hands out browser pages one coroutine at a time.
+
+    Pages are created lazily up to ``size``, so a run that never needs the browser for
+    details never opens one. A page is replaced when it is found closed, when the work
+    done on it raised, or after ``max_uses`` checkouts to cap Chromium's memory growth.
+    """
+
+    def __init__(self, context: Any, size: int, max_uses: int = 50):
+        """Create an empty pool.
+
+        Args:
+            context: Playwright browser context that pages are opened in.
+            size (int): Maximum number of pages open at once.
+            max_uses (int): Checkouts after which a page is closed and replaced. Default 50.
+        """
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[Any] = []
+        self._uses: dict[Any, int] = {}
+
+        self.checkouts = 0
+        self.created = 0
+        self.recycled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Any]:
+        """Borrow a page for exclusive use until the ``async with`` block exits.
+
+        Yields:
+            A Playwright page that no other coroutine holds.
+        """
+        started = time.monotonic()
+        await self._slots.acquire()
+        try:
+            page = await self._acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        wait = time.monotonic() - started
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+        healthy = False
+        try:
+            yield page
+            healthy = True
+        finally:
+            self._uses[page] += 1
+            if healthy and not page.is_closed() and self._uses[page] < self.max_uses:
+                self._idle.append(page)
+            else:
+                self.recycled += 1
+                await self._discard(page)
+            self._slots.release()
+
+    async def close(self) -> None:
+        """Close every idle page. Pages still checked out are closed with the context."""
+        while self._idle:
+            await self._discard(self._idle.pop())
+
+    def stats(self) -> dict[str, float]:
+        """Return checkout, wait-time and recycling counters."""
+        return {
+            "checkouts": self.checkouts,
+            "created": self.created,
+            "recycled": self.recycled,
+            "avg_wait": self.total_wait / self.checkouts if self.checkouts else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+    async def _acquire(self) -> Any:
+        """Return an idle healthy page, or open a new one (caller holds a slot)."""
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                return page
+            # Health check failed: drop the dead page
+            self.recycled += 1
+            await self._discard(page)
+
+        page = await self.context.new_page()
+        self.created += 1
+        self._uses[page] = 0
+        return page
+
+    async def _discard(self, page: Any) -> None:
+        self._uses.pop(page, None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            print(f"  Warning: Could not close browser page: {e}")
@@ -0,0 +1,414 @@
+"""HTML extraction helpers for legis.ga.gov pages.
+
+Three interchangeable parser backends are supported: ``selectolax`` (lexbor) and
+``lxml`` when installed (``pip install georgia-legislation-webcrawler[fast]``), and
+BeautifulSoup's ``html.parser`` as the always-available fallback. Each backend only
+walks the parts of the page it needs: the results table and the text around the
+"1-20 of N" counter on listing pages, and the two ``h2`` sections on detail pages.
+"""
+
+import re
+from datetime import datetime
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+# Optional faster parser backends
+try:
+    from lxml import html as lxml_html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+PARSERS = ("auto", "selectolax", "lxml", "bs4")
+
+SUMMARY_HEADING = "First Reader Summary"
+HISTORY_HEADING = "Status History"
+
+# "1-20 of 3000" pagination counter; OF_PATTERN finds candidate text nodes cheaply
+RANGE_PATTERN = re.compile(r"(\d+)-(\d+)\s+of\s+(\d+)")
+OF_PATTERN = re.compile(r"\bof\s+\d")
+
+
+def available_parsers() -> list[str]:
+    """Return the concrete parser backends that can be used in this environment."""
+    parsers = []
+    if SELECTOLAX_AVAILABLE:
+        parsers.append("selectolax")
+    if LXML_AVAILABLE:
+        parsers.append("lxml")
+    parsers.append("bs4")
+    return parsers
+
+
+def resolve_parser(name: str) -> str:
+    """Map a configured parser name to an installed backend.
+
+    Args:
+        name (str): One of PARSERS. "auto" picks the fastest installed backend.
+
+    Returns:
+        str: "selectolax", "lxml" or "bs4".
+
+    Raises:
+        ValueError: If ``name`` is not a known parser.
+    """
+    if name not in PARSERS:
+        raise ValueError(f"parser must be one of {PARSERS}, got {name!r}")
+    if name == "auto":
+        return available_parsers()[0]
+    if name not in available_parsers():
+        print(f"Warning: {name} is not installed; parsing with BeautifulSoup instead")
+        print("Install it with: pip install georgia-legislation-webcrawler[fast]")
+        return "bs4"
+    return name
+
+
+def empty_details() -> dict:
+    """Return the detail record used when a bill page yields nothing."""
+    return {"first_reader_summary": "", "status_history": []}
+
+
+def has_details(details: dict) -> bool:
+    """Return True if a parsed detail record contains any detail content."""
+    return bool(details.get("first_reader_summary") or details.get("status_history"))
+
+
+def _format_date(date_str: str) -> str:
+    """Convert MM/DD/YYYY to YYYY-MM-DD, leaving other formats untouched."""
+    try:
+        return datetime.strptime(date_str, "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return date_str
+
+
+def _result_range(text: str) -> tuple[int, int] | None:
+    """Return (total results, items per page) from pagination counter text."""
+    match = RANGE_PATTERN.search(text)
+    if not match:
+        return None
+    return int(match.group(3)), int(match.group(2)) - int(match.group(1)) + 1
+
+
+def parse_bill_details(html_content: str, parser: str = "bs4") -> dict:
+    """Extract the first reader summary and status history from a bill detail page.
+
+    Args:
+        html_content (str): HTML of the bill's detail page.
+        parser (str): Concrete backend from ``resolve_parser``. Default "bs4".
+
+    Returns:
+        Dict: Dictionary containing first_reader_summary and status_history.
+    """
+    if parser == "selectolax":
+        return _parse_details_selectolax(html_content)
+    if parser == "lxml":
+        return _parse_details_lxml(html_content)
+    return _parse_details_bs4(html_content)
+
+
+def parse_listing_page(
+    html_content: str, base_url: str, parser: str = "bs4"
+) -> tuple[list[dict], int | None, int]:
+    """Extract bill stubs and pagination info from a rendered listing page.
+
+    Args:
+        html_content (str): HTML of a ``/legislation/all`` results page.
+        base_url (str): Site root used to build absolute detail URLs.
+        parser (str): Concrete backend from ``resolve_parser``. Default "bs4".
+
+    Returns:
+        Tuple of (bill stubs, total result count or None, items per page or 0).
+    """
+    if parser == "selectolax":
+        rows, result_range = _listing_rows_selectolax(html_content)
+    elif parser == "lxml":
+        rows, result_range = _listing_rows_lxml(html_content)
+    else:
+        rows, result_range = _listing_rows_bs4(html_content)
+
+    bills = []
+    for cells in rows:
+        # cells: doc number text, href, caption, committees, sponsors
+        try:
+            doc_text, href, caption, committees_list, sponsors_list = cells
+            bills.append(
+                {
+                    "doc_number": doc_text.strip().replace(" ", ""),
+                    "caption": caption.strip(),
+                    "committees": [name.strip() for name in committees_list],
+                    "sponsors": [name.strip() for name in sponsors_list],
+                    "detail_url": base_url + href,
+                }
+            )
+        except Exception as e:
+            print(f"  Error processing row: {e}")
+            continue
+
+    total_results, items_per_page = result_range or (None, 0)
+    return bills, total_results, items_per_page
+
+
+# BeautifulSoup backend
+
+
+def _parse_details_bs4(html_content: str) -> dict:
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    details = empty_details()
+
+    # Get First Reader Summary - find h2, then get next div sibling
+    summary_section = soup.find("h2", string=lambda x: x and SUMMARY_HEADING in x)
+    if summary_section:
+        # The content is in the next sibling div
+        content_div = summary_section.find_next_sibling("div")
+        if content_div:
+            details["first_reader_summary"] = content_div.get_text(strip=True)
+
+    # Get Status History - find h2, then find table inside next div
+    history_section = soup.find("h2", string=lambda x: x and HISTORY_HEADING in x)
+    if history_section:
+        # The table is in the next sibling div
+        history_div = history_section.find_next_sibling("div")
+        if history_div:
+            history_table = history_div.find("table")
+            if history_table:
+                # Skip header row (tr with th elements)
+                status_list: list[dict[str, str]] = details["status_history"]
+                for row in history_table.select("tbody tr"):
+                    cols = row.find_all("td")
+                    if len(cols) >= 2:
+                        status_list.append(
+                            {
+                                "date": _format_date(cols[0].get_text(strip=True)),
+                                "status": cols[1].get_text(strip=True),
+                            }
+                        )
+
+    return details
+
+
+def _listing_rows_bs4(html_content: str) -> tuple[list, tuple[int, int] | None]:
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # Only look at text near an "of N" string instead of the whole document's text
+    result_range = None
+    for string in soup.find_all(string=OF_PATTERN):
+        element = string.parent
+        for _ in range(2):
+            if element is None:
+                break
+            result_range = _result_range(element.get_text())
+            if result_range:
+                break
+            element = element.parent
+        if result_range:
+            break
+
+    rows: Any = soup.select("table tbody tr")
+    if not rows:
+        rows = soup.select("table tr")[1:]  # Skip header row if it exists
+
+    cells = []
+    for row in rows:
+        doc_number_elem = row.select_one("td:first-child a")
+        if not doc_number_elem:
+            continue
+        tds = row.select("td")
+        if len(tds) < 4:
+            continue
+
+        href = doc_number_elem.get("href", "")
+        caption_elem = tds[1].select_one("a")
+        cells.append(
+            (
+                doc_number_elem.text,
+                href if isinstance(href, str) else str(href),
+                caption_elem.text if caption_elem else "",
+                [a.text for a in tds[2].select("a")],
+                [a.text for a in tds[3].select("a")],
+            )
+        )
+
+    return cells, result_range
+
+
+# lxml backend
+
+
+def _lxml_text(element: Any) -> str:
+    """Concatenate stripped text fragments, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+def _lxml_section(tree: Any, heading: str) -> Any:
+    matches = tree.xpath(f"//h2[contains(., '{heading}')]/following-sibling::div[1]")
+    return matches[0] if matches else None
+
+
+def _parse_details_lxml(html_content: str) -> dict:
+    details = empty_details()
+    if not html_content.strip():
+        return details
+    tree = lxml_html.fromstring(html_content)
+
+    content_div = _lxml_section(tree, SUMMARY_HEADING)
+    if content_div is not None:
+        details["first_reader_summary"] = _lxml_text(content_div)
+
+    history_div = _lxml_section(tree, HISTORY_HEADING)
+    if history_div is not None:
+        tables = history_div.xpath(".//table")
+        if tables:
+            status_list: list[dict[str, str]] = details["status_history"]
+            for row in tables[0].xpath("./tbody/tr"):
+                cols = row.xpath("./td")
+                if len(cols) >= 2:
+                    status_list.append(
+                        {
+                            "date": _format_date(_lxml_text(cols[0])),
+                            "status": _lxml_text(cols[1]),
+                        }
+                    )
+
+    return details
+
+
+def _listing_rows_lxml(html_content: str) -> tuple[list, tuple[int, int] | None]:
+    if not html_content.strip():
+        return [], None
+    tree = lxml_html.fromstring(html_content)
+
+    result_range = None
+    for text in tree.xpath("//text()[contains(., 'of ')]"):
+        if not OF_PATTERN.search(text):
+            continue
+        element = text.getparent()
+        for _ in range(2):
+            if element is None:
+                break
+            result_range = _result_range(element.text_content())
+            if result_range:
+                break
+            element = element.getparent()
+        if result_range:
+            break
+
+    rows = tree.xpath("//table/tbody/tr")
+    if not rows:
+        rows = tree.xpath("//table//tr")[1:]  # Skip header row if it exists
+
+    cells = []
+    for row in rows:
+        tds = row.xpath("./td")
+        doc_links = tds[0].xpath(".//a") if tds else []
+        if not doc_links or len(tds) < 4:
+            continue
+
+        caption_links = tds[1].xpath(".//a")
+        cells.append(
+            (
+                doc_links[0].text_content(),
+                doc_links[0].get("href", ""),
+                caption_links[0].text_content() if caption_links else "",
+                [a.text_content() for a in tds[2].xpath(".//a")],
+                [a.text_content() for a in tds[3].xpath(".//a")],
+            )
+        )
+
+    return cells, result_range
+
+
+# selectolax backend
+
+
+def _selectolax_text(node: Any) -> str:
+    return node.text(deep=True, separator="", strip=True)  # type: ignore[no-any-return]
+
+
+def _selectolax_section(tree: Any, heading: str) -> Any:
+    for h2 in tree.css("h2"):
+        if heading in h2.text(deep=True):
+            sibling = h2.next
+            while sibling is not None and sibling.tag != "div":
+                sibling = sibling.next
+            return sibling
+    return None
+
+
+def _parse_details_selectolax(html_content: str) -> dict:
+    tree = LexborHTMLParser(html_content)
+    details = empty_details()
+
+    content_div = _selectolax_section(tree, SUMMARY_HEADING)
+    if content_div is not None:
+        details["first_reader_summary"] = _selectolax_text(content_div)
+
+    history_div = _selectolax_section(tree, HISTORY_HEADING)
+    if history_div is not None:
+        table = history_div.css_first("table")
+        if table is not None:
+            status_list: list[dict[str, str]] = details["status_history"]
+            for row in table.css("tbody > tr"):
+                cols = row.css("td")
+                if len(cols) >= 2:
+                    status_list.append(
+                        {
+                            "date": _format_date(_selectolax_text(cols[0])),
+                            "status": _selectolax_text(cols[1]),
+                        }
+                    )
+
+    return details
+
+
+def _listing_rows_selectolax(html_content: str) -> tuple[list, tuple[int, int] | None]:
+    tree = LexborHTMLParser(html_content)
+
+    result_range = None
+    if tree.root is not None:
+        for node in tree.root.traverse(include_text=True):
+            if node.tag != "-text" or not OF_PATTERN.search(node.text_content or ""):
+                continue
+            element = node.parent
+            for _ in range(2):
+                if element is None:
+                    break
+                result_range = _result_range(element.text(deep=True))
+                if result_range:
+                    break
+                element = element.parent
+            if result_range:
+                break
+
+    rows = tree.css("table > tbody > tr")
+    if not rows:
+        rows = tree.css("table tr")[1:]  # Skip header row if it exists
+
+    cells = []
+    for row in rows:
+        tds = row.css("td")
+        doc_link = tds[0].css_first("a") if tds else None
+        if doc_link is None or len(tds) < 4:
+            continue
+
+        caption_link = tds[1].css_first("a")
+        cells.append(
+            (
+                doc_link.text(deep=True),
+                doc_link.attributes.get("href") or "",
+                caption_link.text(deep=True) if caption_link is not None else "",
+                [a.text(deep=True) for a in tds[2].css("a")],
+                [a.text(deep=True) for a in tds[3].css("a")],
+            )
+        )
+
+    return cells, result_range
@@ -0,0 +1,243 @@
+"""Opt-in profiling of a scrape run.
+
+A ``ScrapeProfiler`` wraps a whole run and the scraper marks its major stages
+(browser setup, listing, detail drain, cache save) with ``stage()``. Per-bill work is
+tagged with ``profile_tag`` (detail cache vs. fetch). Each run writes into its own
+directory:
+
+- ``stacks.folded``: stacks of the event loop thread sampled every few milliseconds,
+  in the collapsed format read by flamegraph.pl, speedscope and inferno.
+- ``cprofile.pstats`` / ``cprofile.txt`` (mode "cprofile"): deterministic profile of
+  the main thread, for snakeviz, gprof2dot or ``python -m pstats``.
+- ``yappi.pstats``, ``yappi.callgrind`` and ``yappi_<stage>.pstats`` (mode "yappi"):
+  asyncio-aware wall-clock profile, split by stage, for KCachegrind or snakeviz.
+- ``memory.txt`` (with ``memory=True``): tracemalloc snapshots at the end of every
+  stage, showing which lines allocated the most since the previous stage.
+- ``stages.json``: wall time and traced memory of each stage.
+
+HTML parsing runs in worker processes, which are not profiled; set
+``SCRAPER_PARSE_WORKERS=0`` to parse inline and see it in the profile.
+"""
+
+import contextvars
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Optional asyncio-aware profiler
+try:
+    import yappi
+
+    YAPPI_AVAILABLE = True
+except ImportError:
+    YAPPI_AVAILABLE = False
+
+PROFILE_MODES = ("auto", "cprofile", "yappi", "sample")
+
+# Stage of the running task; asyncio tasks inherit it from the code that created them
+_current_stage: contextvars.ContextVar[str] = contextvars.ContextVar("stage", default="other")
+
+
+def resolve_profile_mode(mode: str) -> str:
+    """Return the profiler to use for ``mode``: "yappi" when installed for "auto".
+
+    Raises:
+        ValueError: If ``mode`` is unknown.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"profile mode must be one of {PROFILE_MODES}, got {mode!r}")
+    if mode == "auto":
+        return "yappi" if YAPPI_AVAILABLE else "cprofile"
+    if mode == "yappi" and not YAPPI_AVAILABLE:
+        print("Warning: yappi not installed; profiling with cProfile instead")
+        print("Install it with: pip install yappi")
+        return "cprofile"
+    return mode
+
+
+@contextmanager
+def profile_tag(name: str) -> Iterator[None]:
+    """Attribute the enclosed block to ``name`` in yappi's per-stage output.
+
+    Unlike ``ScrapeProfiler.stage`` this records nothing else, so it is cheap enough
+    for per-bill code and costs next to nothing when no profiler runs.
+    """
+    token = _current_stage.set(name)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval into folded stacks."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            if frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def write(self, path: Path) -> None:
+        """Write ``stack count`` lines, the input format of flame graph tools."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class ScrapeProfiler:
+    """Profiles one scrape run and writes the results to ``output_dir``."""
+
+    def __init__(
+        self,
+        output_dir: str | Path = "profiles",
+        mode: str = "auto",
+        memory: bool = False,
+        sample_interval: float = 0.005,
+    ):
+        """Configure the profiler.
+
+        Args:
+            output_dir (str): Parent directory; each run gets a subdirectory named after
+                the start time and process id. Default "profiles".
+            mode (str): "auto" (yappi if installed, else cProfile), "cprofile", "yappi",
+                or "sample" for stack sampling only. Stacks are sampled in every mode.
+                Default "auto".
+            memory (bool): Take tracemalloc snapshots at stage boundaries. Slows the
+                run down noticeably. Default False.
+            sample_interval (float): Seconds between stack samples. Default 0.005.
+        """
+        self.mode = resolve_profile_mode(mode)
+        self.memory = memory
+        self.sample_interval = sample_interval
+        self.run_dir = Path(output_dir) / f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.stages: dict[str, dict[str, float]] = {}
+        self._stage_ids: dict[str, int] = {}
+        self._memory_report: list[str] = []
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._cprofile: cProfile.Profile | None = None
+        self._sampler: StackSampler | None = None
+
+    def start(self) -> None:
+        """Begin profiling the calling thread."""
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        if self.memory:
+            tracemalloc.start(10)
+            self._snapshot = tracemalloc.take_snapshot()
+        if self.mode == "yappi":
+            yappi.set_clock_type("wall")
+            yappi.set_tag_callback(self._stage_tag)
+            yappi.start()
+        elif self.mode == "cprofile":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        self._sampler.start()
+
+    def stop(self) -> Path:
+        """Stop profiling and write every output file.
+
+        Returns:
+            Path: The run's output directory.
+        """
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler.write(self.run_dir / "stacks.folded")
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.run_dir / "cprofile.pstats")
+            summary = io.StringIO()
+            stats = pstats.Stats(self._cprofile, stream=summary)
+            stats.sort_stats("cumulative").print_stats(40)
+            stats.sort_stats("tottime").print_stats(40)
+            (self.run_dir / "cprofile.txt").write_text(summary.getvalue(), encoding="utf-8")
+
+        if self.mode == "yappi":
+            yappi.stop()
+            func_stats = yappi.get_func_stats()
+            func_stats.save(str(self.run_dir / "yappi.pstats"), type="pstat")
+            func_stats.save(str(self.run_dir / "yappi.callgrind"), type="callgrind")
+            for stage, tag in self._stage_ids.items():
+                stage_stats = yappi.get_func_stats(filter={"tag": tag})
+                if not stage_stats.empty():
+                    stage_stats.save(str(self.run_dir / f"yappi_{stage}.pstats"), type="pstat")
+            yappi.clear_stats()
+
+        if self.memory:
+            tracemalloc.stop()
+            (self.run_dir / "memory.txt").write_text(
+                "\n".join(self._memory_report) + "\n", encoding="utf-8"
+            )
+
+        with open(self.run_dir / "stages.json", "w", encoding="utf-8") as f:
+            json.dump({"mode": self.mode, "stages": self.stages}, f, indent=2)
+        return self.run_dir
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute the enclosed block, and tasks created in it, to stage ``name``."""
+        self._stage_ids.setdefault(name, len(self._stage_ids) + 1)
+        token = _current_stage.set(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            _current_stage.reset(token)
+            record = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+            record["seconds"] = round(record["seconds"] + time.perf_counter() - started, 6)
+            record["calls"] += 1
+            if self.memory:
+                self._snapshot_memory(name, record)
+
+    def _stage_tag(self) -> int:
+        stage = _current_stage.get()
+        tag = self._stage_ids.get(stage)
+        if tag is None:
+            tag = self._stage_ids[stage] = len(self._stage_ids) + 1
+        return tag
+
+    def _snapshot_memory(self, name: str, record: dict[str, float]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        record["memory_current_mb"] = round(current / 1_000_000, 2)
+        record["memory_peak_mb"] = round(peak / 1_000_000, 2)
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        self._memory_report.append(
+            f"== after {name}: {current / 1_000_000:.1f} MB traced, peak {peak / 1_000_000:.1f} MB"
+        )
+        if self._snapshot is not None:
+            for diff in snapshot.compare_to(self._snapshot, "lineno")[:25]:
+                self._memory_report.append(f"  {diff}")
+        self._snapshot = snapshot
@@ -0,0 +1,205 @@
+"""Adaptive request pacing shared by every fetch path."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+# Responses that mean "slow down"
+THROTTLE_STATUSES = {429, 503}
+
+
+def is_retryable(status: int | None) -> bool:
+    """Return whether a failed request is worth retrying.
+
+    Args:
+        status (int, optional): HTTP status of the failure, or None if no response
+            arrived (timeouts, dropped connections).
+    """
+    return status is None or status in THROTTLE_STATUSES or status >= 500
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Convert a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class RequestOutcome:
+    """What a request reported back to the limiter (filled in by the caller)."""
+
+    __slots__ = ("status", "retry_after")
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.retry_after: str | None = None
+
+
+class AdaptiveRateLimiter:
+    """Token bucket for requests/second plus an AIMD limit on requests in flight.
+
+    Every request goes through ``request()``. Fast successful responses raise the rate
+    and concurrency additively; throttling responses (429/503), server errors and
+    latencies above ``latency_target`` halve both, at most once per ``cooldown``
+    seconds. A ``Retry-After`` header pauses all requests until it expires.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: float,
+        max_concurrency: int,
+        min_rate: float = 0.2,
+        min_concurrency: int = 1,
+        burst: int = 1,
+        latency_target: float = 3.0,
+        cooldown: float = 5.0,
+    ):
+        """Create a limiter.
+
+        Args:
+            rate (float): Initial requests per second.
+            max_rate (float): Upper bound the rate may grow to.
+            max_concurrency (int): Upper bound on requests in flight.
+            min_rate (float): Lower bound the rate may shrink to. Default 0.2.
+            min_concurrency (int): Lower bound on requests in flight. Default 1.
+            burst (int): Token bucket capacity. Default 1 (no bursts).
+            latency_target (float): Response time in seconds above which the server is
+                considered overloaded. Default 3.0.
+            cooldown (float): Minimum seconds between two decreases. Default 5.0.
+        """
+        self.max_rate = max(max_rate, rate)
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.concurrency = float(min(2, self.max_concurrency))
+        self.burst = burst
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._token_lock = asyncio.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+        self.decreases = 0
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[RequestOutcome]:
+        """Wait for a concurrency slot and a token, then time the wrapped request.
+
+        Set ``status`` and ``retry_after`` on the yielded outcome when the response
+        provides them; an exception escaping the block counts as a failed request.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.concurrency))
+            self._in_flight += 1
+
+        outcome = RequestOutcome()
+        try:
+            await self._take_token()
+            started = time.monotonic()
+            try:
+                yield outcome
+            except Exception:
+                self._observe(time.monotonic() - started, outcome, failed=True)
+                raise
+            self._observe(time.monotonic() - started, outcome, failed=False)
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    async def backoff(self, attempt: int, outcome: RequestOutcome) -> None:
+        """Wait before retrying a failed request.
+
+        A throttled response pauses every request, for its ``Retry-After`` if it sent
+        one and for ``2 ** attempt`` seconds otherwise; the retry's own ``request()``
+        then waits out the pause. Other failures only delay the caller.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that failed.
+            outcome (RequestOutcome): Outcome recorded for that attempt.
+        """
+        delay = float(2**attempt)
+        if outcome.status in THROTTLE_STATUSES:
+            if parse_retry_after(outcome.retry_after) is None:
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            return
+        await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, float]:
+        """Return the current pacing and how often the limiter backed off."""
+        return {
+            "rate": self.rate,
+            "concurrency": int(self.concurrency),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "decreases": self.decreases,
+        }
+
+    async def _take_token(self) -> None:
+        async with self._token_lock:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _observe(self, latency: float, outcome: RequestOutcome, failed: bool) -> None:
+        self.requests += 1
+        throttled = outcome.status in THROTTLE_STATUSES
+
+        if throttled:
+            self.throttled += 1
+            retry_after = parse_retry_after(outcome.retry_after)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+        # Client errors such as 404 say nothing about server load
+        server_error = failed and (outcome.status is None or outcome.status >= 500)
+        if throttled or server_error or latency > self.latency_target:
+            self._decrease()
+        elif not failed:
+            # Additive increase: about +1 concurrency per window of requests
+            self.concurrency = min(
+                self.max_concurrency, self.concurrency + 1 / max(self.concurrency, 1)
+            )
+            self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self._refill()  # Settle tokens earned at the old rate
+        self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+        self.rate = max(self.min_rate, self.rate / 2)
@@ -1,17 +1,63 @@
 import asyncio
 import json
-import re
+import multiprocessing
+import os
+import shutil
 import sys
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from urllib.robotparser import RobotFileParser
 
 import aiohttp
 import requests
-from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from backend.cache import DetailCache
+from backend.checkpoint import ScrapeCheckpoint
+from backend.deltas import publish_delta
+from backend.http_cache import HttpCache
+from backend.incremental import listing_fingerprint, needs_refresh
+from backend.listing_api import (
+    ListingEndpoint,
+    endpoint_from_request,
+    extract_records,
+    extract_total,
+    fetch_listing_page,
+    record_to_bill,
+)
+from backend.metrics import ScrapeMetrics
+from backend.models import Bill, BillDetails, StatusEvent
+from backend.output import OrderedBillSink, StreamingBillWriter
+from backend.page_pool import PagePool
+from backend.parsing import (
+    empty_details,
+    has_details,
+    parse_bill_details,
+    parse_listing_page,
+    resolve_parser,
+)
+from backend.profiling import ScrapeProfiler, profile_tag
+from backend.rate_limit import AdaptiveRateLimiter, RequestOutcome, is_retryable
+from backend.resource_blocking import (
+    BLOCKED_DOMAINS,
+    BLOCKED_RESOURCE_TYPES,
+    ResourceBlocker,
+)
+from backend.sessions import (
+    LegislativeSession,
+    endpoint_for_session,
+    extract_sessions,
+    listing_url,
+)
+from backend.sharding import dedupe_bills, load_manifest, select_shard, write_manifest
+from backend.store import build_store
+
 # Try to import playwright, with fallback to requests-only mode
 try:
     from playwright.async_api import async_playwright
@@ -22,6 +68,8 @@ except ImportError:
     print("Warning: Playwright not installed. Install with: pip install playwright")
     print("Then run: playwright install")
 
+T = TypeVar("T")
+
 
 class ValidationError(Exception):
     """Raised when bill data validation fails."""
@@ -29,26 +77,168 @@ class ValidationError(Exception):
     pass
 
 
+DETAIL_MODES = ("auto", "http", "browser")
+LISTING_MODES = ("auto", "api", "browser")
+
+# Doc number in the first listing row; a page turn is complete once it changes
+FIRST_ROW_DOC_JS = """
+() => {
+    const link = document.querySelector("table tbody tr td:first-child a")
+        || document.querySelector("table tr td:first-child a");
+    return link ? link.textContent.trim() : null;
+}
+"""
+FIRST_ROW_CHANGED_JS = """
+(previous) => {
+    const link = document.querySelector("table tbody tr td:first-child a")
+        || document.querySelector("table tr td:first-child a");
+    return link !== null && link.textContent.trim() !== previous;
+}
+"""
+# Page numbers of the visible pagination links
+PAGE_LINKS_JS = """
+() => Array.from(document.querySelectorAll('.pagination a, a[href*="page"]'))
+    .map((link) => link.textContent.trim())
+    .filter((text) => /^\\d+$/.test(text))
+    .map(Number)
+"""
+
+# Options of the session picker, as {id, name} records
+SESSION_OPTIONS_JS = """
+() => Array.from(document.querySelectorAll("select option"))
+    .filter((option) => option.value)
+    .map((option) => ({ id: option.value, name: option.textContent.trim() }))
+"""
+# Values of the options currently selected in the page's pickers
+SELECTED_OPTIONS_JS = """
+() => Array.from(document.querySelectorAll("select option:checked")).map((option) => option.value)
+"""
+
+
 class GALegislationScraper:
     def __init__(
         self,
         max_concurrent: int = 5,
         request_delay: float = 0.3,
         page_pool_size: int = 5,
+        detail_mode: str = "auto",
+        listing_mode: str = "auto",
+        listing_page_size: int = 100,
+        page_max_uses: int = 50,
+        max_rate: float = 10.0,
+        incremental: bool = False,
+        cache_ttl_hours: float = 24.0,
+        http_cache_dir: str | None = "http_cache",
+        parser: str = "auto",
+        parse_workers: int | None = None,
+        blocked_resource_types: tuple[str, ...] = BLOCKED_RESOURCE_TYPES,
+        blocked_domains: tuple[str, ...] = BLOCKED_DOMAINS,
+        cache_file: str = "bill_details_cache.jsonl",
+        checkpoint_file: str | None = "scrape_checkpoint.json",
+        session_id: str | None = None,
+        metrics_file: str | None = "scrape_metrics.json",
+        base_url: str = "https://www.legis.ga.gov",
+        profiler: ScrapeProfiler | None = None,
+        deltas_dir: str | None = None,
+        store_file: str | None = None,
     ):
         """Initialize scraper with async support and caching.
 
         Args:
             max_concurrent (int): Maximum concurrent requests. Default 5.
-            request_delay (float): Delay between requests in seconds. Default 0.3.
+            request_delay (float): Initial spacing between requests in seconds; the
+                rate limiter adapts from there. Default 0.3.
             page_pool_size (int): Number of Playwright browser pages to pool. Default 5.
+            detail_mode (str): How bill detail pages are fetched. "auto" tries a plain
+                HTTP request first and falls back to a browser page when the details are
+                not server-rendered; "http" never uses the browser; "browser" always
+                renders with Playwright. Default "auto".
+            listing_mode (str): How the bill listing is paged. "auto" pages through the
+                SPA's JSON search endpoint when it can be discovered and otherwise clicks
+                through the rendered pagination; "api" requires the endpoint; "browser"
+                always clicks. Default "auto".
+            listing_page_size (int): Bills requested per listing API page. Default 100.
+            page_max_uses (int): Navigations after which a pooled page is closed and
+                replaced, to cap Chromium memory growth. Default 50.
+            max_rate (float): Requests per second the rate limiter may grow to. Default 10.
+            incremental (bool): Refetch cached details only for bills whose listing row
+                changed, or that are still active and older than ``cache_ttl_hours``.
+                Without it, cached details never expire. Default False.
+            cache_ttl_hours (float): Maximum age of cached details for active bills in
+                incremental mode. Default 24.
+            http_cache_dir (str, optional): Directory for ETag/Last-Modified validators
+                and response bodies used for conditional requests. None disables the
+                HTTP cache. Default "http_cache".
+            parser (str): HTML parser backend: "auto" (fastest installed), "selectolax",
+                "lxml" or "bs4". Default "auto".
+            parse_workers (int, optional): Worker processes that parse HTML off the event
+                loop. 0 parses inline. Default None: one per CPU, up to
+                ``max_concurrent``.
+            blocked_resource_types (tuple): Playwright resource types the browser skips
+                loading. Default images, fonts, stylesheets and media.
+            blocked_domains (tuple): Third-party hosts (analytics, ads, trackers) whose
+                requests the browser aborts. Default BLOCKED_DOMAINS.
+            cache_file (str): Detail cache log. Processes scraping in parallel on one
+                host each need their own. Default "bill_details_cache.jsonl".
+            checkpoint_file (str, optional): Where listing progress is checkpointed after
+                every page so ``resume`` can pick up an interrupted run. None disables
+                checkpoints. Default "scrape_checkpoint.json".
+            session_id (str, optional): Legislative session to list (see
+                ``list_sessions``). None lists the site's current session. Default None.
+            metrics_file (str, optional): JSON report of phase timings, latency
+                histograms, counters and gauges written after each scrape, plus a
+                Prometheus text file next to it (``.prom``). None disables the export.
+                Default "scrape_metrics.json".
+            base_url (str): Site root, e.g. a local fake site for benchmarks. Default
+                "https://www.legis.ga.gov".
+            profiler (ScrapeProfiler, optional): Profiler whose stages the run reports
+                (browser setup, listing, detail drain, cache save). The caller starts and
+                stops it. Default None.
+            deltas_dir (str, optional): Directory of versioned change deltas (see
+                ``backend.deltas``). After a complete ``scrape_and_save`` the changes
+                since the previous output are written there as the next version. None
+                disables deltas. Default None.
+            store_file (str, optional): SQLite database (see ``backend.store``) that
+                ``scrape_and_save`` rebuilds from the output, indexed for lookups by
+                sponsor, committee, status date and text. None disables it. Default None.
         """
-        self.base_url = "https://www.legis.ga.gov"
+        if detail_mode not in DETAIL_MODES:
+            raise ValueError(f"detail_mode must be one of {DETAIL_MODES}, got {detail_mode!r}")
+        if listing_mode not in LISTING_MODES:
+            raise ValueError(f"listing_mode must be one of {LISTING_MODES}, got {listing_mode!r}")
+
+        self.base_url = base_url.rstrip("/")
+        self.session_id = session_id
+        self.parser = resolve_parser(parser)
+        if parse_workers is None:
+            parse_workers = min(os.cpu_count() or 1, max(1, max_concurrent))
+        self.parse_workers = parse_workers
+        self._parse_executor: ProcessPoolExecutor | None = None
         self.max_concurrent = max_concurrent
         self.request_delay = request_delay
+        # Shared by listing and detail requests: token bucket plus AIMD concurrency
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate=1 / request_delay if request_delay > 0 else max_rate,
+            max_rate=max_rate,
+            max_concurrency=max_concurrent,
+        )
         self.page_pool_size = page_pool_size
-        self.cache_file = Path("bill_details_cache.json")
-        self.cache = self._load_cache()
+        self.page_max_uses = page_max_uses
+        self.detail_mode = detail_mode
+        self.listing_mode = listing_mode
+        self.listing_page_size = listing_page_size
+        # Bill stubs buffered between the listing producer and detail workers
+        self.queue_size = max(1, max_concurrent) * 4
+        self.incremental = incremental
+        self.cache_ttl_hours = cache_ttl_hours
+        self.cache_file = Path(cache_file)
+        self.legacy_cache_file = Path("bill_details_cache.json")
+        # Phase timings, retry counters and queue depths (see backend.metrics)
+        self.metrics = ScrapeMetrics()
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        # Loaded on first use, so listing sessions or a preflight never opens it
+        self._cache: DetailCache | None = None
+        self.http_cache = HttpCache(Path(http_cache_dir)) if http_cache_dir else None
         self.session = requests.Session()
 
         # Configure retries
@@ -81,10 +271,31 @@ class GALegislationScraper:
             "failed": 0,
             "total_bills": 0,
             "pages_processed": 0,
+            "refreshed": 0,
+            "http_details": 0,
+            "browser_details": 0,
+            "saved": 0,
         }
 
-        # Page locks for preventing concurrent navigation
-        self.page_locks: list[asyncio.Lock] = []
+        # In "auto" mode, stop trying plain HTTP after this many consecutive misses
+        self.http_miss_limit = 10
+        self._http_misses = 0
+
+        # Aborts browser requests for resources that never reach the parsed HTML
+        self.resource_blocker = ResourceBlocker(blocked_resource_types, blocked_domains)
+
+        # Listing progress for resuming interrupted runs
+        self.checkpoint = ScrapeCheckpoint(Path(checkpoint_file)) if checkpoint_file else None
+        self._listing_stalled = False
+        # Whether the last run walked the listing to its end
+        self.listing_complete = False
+
+        self.profiler = profiler
+        self.deltas_dir = deltas_dir
+        self.store_file = store_file
+
+        # Browser page pool counters from the last run (see PagePool.stats)
+        self.page_pool_stats: dict[str, float] = {}
 
     def check_robots_txt(self) -> bool:
         """Check if scraping is allowed per robots.txt.
@@ -94,13 +305,12 @@ class GALegislationScraper:
         """
         try:
             rp = RobotFileParser()
-            rp.set_url(f"{self.base_url}/robots.txt")
-            rp.read()
+            rp.parse(self._get_with_validators(f"{self.base_url}/robots.txt").splitlines())
 
             # Check if our user agent can fetch the legislation pages
             user_agent = str(self.session.headers.get("User-Agent", "*"))
             can_fetch_legislation = rp.can_fetch(user_agent, f"{self.base_url}/legislation/")
-            can_fetch_all = rp.can_fetch(user_agent, f"{self.base_url}/legislation/all")
+            can_fetch_all = rp.can_fetch(user_agent, listing_url(self.base_url))
 
             if not can_fetch_legislation or not can_fetch_all:
                 print("⚠️  robots.txt disallows scraping /legislation/ pages")
@@ -115,170 +325,406 @@ class GALegislationScraper:
             print("  Proceeding with scraping (no explicit restrictions)")
             return True
 
-    def _load_cache(self) -> dict[str, dict[str, Any]]:
-        """Load cached bill details from file."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, encoding="utf-8") as f:
-                    return json.load(f)  # type: ignore[no-any-return]
-            except Exception as e:
-                print(f"Warning: Could not load cache: {e}")
-        return {}
+    @property
+    def cache(self) -> DetailCache:
+        """The detail cache, loaded on first use."""
+        if self._cache is None:
+            with self.metrics.timer("cache_load"):
+                self._cache = self._load_cache()
+        return self._cache
+
+    def _load_cache(self) -> DetailCache:
+        """Load cached bill details from the append-only cache log.
+
+        A legacy ``bill_details_cache.json`` is migrated on first use.
+        """
+        return DetailCache(
+            self.cache_file,
+            legacy_path=self.legacy_cache_file,
+            decode=BillDetails.from_dict,
+            encode=BillDetails.to_dict,
+        )
 
     def _save_cache(self) -> None:
-        """Save cached bill details to file."""
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Warning: Could not save cache: {e}")
+        """Flush buffered detail and HTTP cache records to disk."""
+        with self.metrics.timer("cache_flush"):
+            self.cache.flush()
+            if self.http_cache:
+                self.http_cache.flush()
 
-    def validate_bill_data(self, bill: dict) -> None:
+    def validate_bill_data(self, bill: Bill | dict) -> None:
         """Validate that bill data contains required fields and valid types.
 
         Args:
-            bill (dict): Bill data to validate.
+            bill (Bill | dict): Bill record or bill dict to validate.
 
         Raises:
             ValidationError: If required fields are missing or invalid.
         """
+        # Bill.get() reads the record's fields directly; fields with an unexpected
+        # shape are kept as-is in the record, so the checks below see them
+        missing = object()
         required_fields = ["doc_number", "caption", "sponsors", "detail_url"]
 
         for field in required_fields:
-            if field not in bill:
+            if bill.get(field, missing) is missing:
                 raise ValidationError(f"Missing required field: {field}")
 
         # Validate string fields
         string_fields = ["doc_number", "caption", "detail_url"]
         for field in string_fields:
-            if not isinstance(bill[field], str):
-                raise ValidationError(f"Field '{field}' must be a string, got {type(bill[field])}")
-            if not bill[field].strip():
+            value = bill.get(field)
+            if not isinstance(value, str):
+                raise ValidationError(f"Field '{field}' must be a string, got {type(value)}")
+            if not value.strip():
                 raise ValidationError(f"Field '{field}' cannot be empty")
 
-        # Validate array fields
+        # Validate array fields (a Bill holds them as tuples)
         array_fields = ["sponsors"]
         for field in array_fields:
-            if field in bill:
-                if not isinstance(bill[field], list):
-                    raise ValidationError(
-                        f"Field '{field}' must be an array, got {type(bill[field])}"
-                    )
-                if len(bill[field]) == 0:
-                    raise ValidationError(f"Field '{field}' cannot be empty")
-            else:
+            value = bill.get(field, missing)
+            if value is missing:
                 raise ValidationError(f"Missing required field: {field}")
+            if not isinstance(value, list | tuple):
+                raise ValidationError(f"Field '{field}' must be an array, got {type(value)}")
+            if len(value) == 0:
+                raise ValidationError(f"Field '{field}' cannot be empty")
 
         # Optional fields
-        if "committees" in bill:
-            if not isinstance(bill["committees"], list):
-                raise ValidationError(
-                    f"Field 'committees' must be an array, got {type(bill['committees'])}"
-                )
+        committees = bill.get("committees", missing)
+        if committees is not missing and not isinstance(committees, list | tuple):
+            raise ValidationError(f"Field 'committees' must be an array, got {type(committees)}")
 
         # Validate status_history if present
-        if "status_history" in bill and bill["status_history"]:
-            if not isinstance(bill["status_history"], list):
+        status_history = bill.get("status_history")
+        if status_history:
+            if not isinstance(status_history, list | tuple):
                 raise ValidationError("Field 'status_history' must be a list")
-            for item in bill["status_history"]:
+            for item in status_history:
+                if isinstance(item, StatusEvent):
+                    continue
                 if not isinstance(item, dict) or "date" not in item or "status" not in item:
                     raise ValidationError(
                         "Status history items must have 'date' and 'status' fields"
                     )
 
-    async def _fetch_with_semaphore(
+    async def _fetch_bill(
         self,
-        semaphore: asyncio.Semaphore,
         session: aiohttp.ClientSession,
-        bill_data: dict,
-        pages: list,
-    ) -> dict:
-        """Fetch bill detail with semaphore control for concurrency.
+        bill_data: Bill,
+        page_pool: PagePool | None,
+    ) -> Bill:
+        """Fetch the details for one bill stub.
 
         Args:
-            semaphore: Semaphore to control concurrent requests.
             session: aiohttp session.
-            bill_data: Bill dictionary with detail_url.
-            pages: Pool of Playwright pages to use.
+            bill_data: Bill record with detail_url.
+            page_pool: Pool of Playwright pages, or None in "http" mode.
 
         Returns:
-            Updated bill_data dictionary with details.
+            The same bill record, updated with its details.
         """
-        async with semaphore:
-            # Get a page from the pool (round-robin)
-            page_idx = hash(bill_data["doc_number"]) % len(pages)
-            page = pages[page_idx]
+        if bill_data.detail_url:
+            details = await self.fetch_bill_detail_async(
+                session, bill_data.detail_url, page_pool, listing_fingerprint(bill_data)
+            )
+            bill_data.apply_details(details)
 
-            detail_url = bill_data.get("detail_url", "")
-            if isinstance(detail_url, str) and detail_url:
-                details = await self.fetch_bill_detail_async(session, detail_url, page)
-                bill_data.update(details)
+        return bill_data
 
-                # Small delay to be respectful
-                await asyncio.sleep(self.request_delay)
+    async def _detail_worker(
+        self,
+        queue: asyncio.Queue,
+        session: aiohttp.ClientSession,
+        page_pool: PagePool | None,
+        sink: OrderedBillSink,
+    ) -> None:
+        """Drain bill stubs from the queue, fetching and validating their details.
 
-            return bill_data
+        Args:
+            queue: Queue of (sequence number, bill stub) pairs fed by the listing producer.
+            session: aiohttp session.
+            page_pool: Pool of Playwright pages, or None in "http" mode.
+            sink: Releases validated bills to the results and the writer in queue order.
+        """
+        while True:
+            seq, bill_data = await queue.get()
+            self.metrics.set_gauge("detail_queue_depth", queue.qsize())
+            result = None
+            try:
+                with self.metrics.timer("bill"):
+                    bill = await self._fetch_bill(session, bill_data, page_pool)
+                self.validate_bill_data(bill)
+                result = bill
+                self.stats["total_bills"] += 1
+            except ValidationError as e:
+                print(f"    Validation error for {bill_data.doc_number}: {e}")
+                self.metrics.increment("validation_errors")
+                self.stats["failed"] += 1
+            except Exception as e:
+                print(f"    Error fetching {bill_data.doc_number}: {e}")
+                self.stats["failed"] += 1
+            finally:
+                try:
+                    sink.finish(seq, result)
+                finally:
+                    queue.task_done()
 
-    async def fetch_bill_detail_async(self, session: aiohttp.ClientSession, url: str, page) -> dict:
+    async def fetch_bill_detail_async(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        page_pool: PagePool | None,
+        fingerprint: str | None = None,
+    ) -> BillDetails:
         """Fetch bill details with caching and concurrent requests.
 
+        In incremental mode a cached entry is only reused if the bill's listing row is
+        unchanged and the bill is either finished or was fetched within the cache TTL.
+
         Args:
             session: aiohttp session for async requests.
             url: Bill detail URL.
-            page: Playwright page object (reused for detail fetching).
+            page_pool: Pool of Playwright pages checked out for browser fetches.
+            fingerprint: Fingerprint of the bill's listing row (see listing_fingerprint).
 
         Returns:
-            Dictionary with first_reader_summary and status_history.
+            BillDetails: The cache entry with first_reader_summary and status_history.
         """
         # Check cache first
-        if url in self.cache:
-            self.stats["cached"] += 1
-            return self.cache[url]
-
-        # Fetch with retry logic
-        details = await self._fetch_with_retry(session, url, page)
-
-        # Save to cache
-        self.cache[url] = details
-        self._save_cache()
-        self.stats["fetched"] += 1
-
-        return details
+        with profile_tag("detail_cache"):
+            entry: BillDetails | None = self.cache.get(url)
+        if entry is not None:
+            if not self.incremental or not needs_refresh(
+                entry, fingerprint, self.cache_ttl_hours * 3600
+            ):
+                self.stats["cached"] += 1
+                return entry
+            self.stats["refreshed"] += 1
+
+        # Fetch with retry logic (counts the bill as fetched or, on 304, as cached)
+        with profile_tag("detail_fetch"):
+            details = await self._fetch_with_retry(session, url, page_pool)
+
+        # Save to cache (buffered append, flushed in batches); the bill shares the entry's
+        # interned strings and status history
+        with profile_tag("detail_cache"):
+            entry = BillDetails.from_dict(
+                details, fetched_at=int(time.time()), fingerprint=fingerprint
+            )
+            self.cache[url] = entry
+
+        return entry
 
     async def _fetch_with_retry(
-        self, session: aiohttp.ClientSession, url: str, page, max_retries: int = 3
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        page_pool: PagePool | None,
+        max_retries: int = 3,
     ) -> dict:
-        """Fetch bill detail with exponential backoff retry.
+        """Fetch bill details over plain HTTP, falling back to the browser if needed.
+
+        HTTP requests are retried by ``_fetch_detail_http``; only the browser fallback
+        is retried here, with exponential backoff. A browser page is only checked out
+        of the pool for the fallback.
 
         Args:
             session: aiohttp session.
             url: Bill detail URL.
-            page: Playwright page object.
-            max_retries: Maximum retry attempts.
+            page_pool: Pool of Playwright pages, or None when no browser is available.
+            max_retries: Maximum browser attempts.
 
         Returns:
             Dictionary with bill details.
         """
+        details = await self._fetch_detail_http(session, url)
+        if details is not None:
+            return details
+        if page_pool is None:
+            return empty_details()
+
         for attempt in range(max_retries):
             try:
-                # Use async Playwright for detail fetching
-                return await self._get_legislation_details_async(page, url)
+                return await self._fetch_detail_browser(url, page_pool)
             except TimeoutError:
+                self.metrics.increment("detail_timeouts")
                 if attempt < max_retries - 1:
                     wait_time = 2**attempt
                     print(f"    Timeout fetching {url}. Waiting {wait_time}s...")
+                    self.metrics.increment("detail_retries")
                     await asyncio.sleep(wait_time)
             except Exception as e:
                 if attempt < max_retries - 1:
                     wait_time = 2**attempt
+                    self.metrics.increment("detail_retries")
                     await asyncio.sleep(wait_time)
                 else:
                     print(f"    Error fetching {url}: {e}")
                     self.stats["failed"] += 1
-                    return {"first_reader_summary": "", "status_history": []}
+                    return empty_details()
 
         self.stats["failed"] += 1
-        return {"first_reader_summary": "", "status_history": []}
+        return empty_details()
+
+    async def _fetch_detail_http(
+        self, session: aiohttp.ClientSession, url: str, max_retries: int = 3
+    ) -> dict | None:
+        """Fetch bill details over plain HTTP, unless the run uses the browser for them.
+
+        Throttled, failed and timed-out requests are retried. Client errors (4xx other
+        than 429) are not: the page is missing or refused, so the bill fails at once.
+        Only pages that were served without their details count towards switching the
+        run to the browser; a bill whose HTTP requests keep failing uses the browser on
+        its own (except in "http" mode, where it fails).
+
+        Args:
+            session: aiohttp session.
+            url: Bill detail URL.
+            max_retries: Maximum HTTP attempts. Default 3.
+
+        Returns:
+            The bill details (empty if the bill failed), or None if the browser should
+            fetch them.
+        """
+        if self.detail_mode == "browser" or self._http_misses >= self.http_miss_limit:
+            return None
+
+        details, revalidated = None, False
+        for attempt in range(max_retries):
+            try:
+                details, revalidated = await self._get_legislation_details_http(session, url)
+                break
+            except (TimeoutError, aiohttp.ClientError) as e:
+                outcome = RequestOutcome()
+                if isinstance(e, aiohttp.ClientResponseError):
+                    outcome.status = e.status
+                    outcome.retry_after = e.headers.get("Retry-After") if e.headers else None
+                retryable = is_retryable(outcome.status)
+                if retryable and attempt < max_retries - 1:
+                    self.metrics.increment("detail_retries")
+                    await self.rate_limiter.backoff(attempt, outcome)
+                    continue
+                if not retryable or self.detail_mode == "http":
+                    print(f"    Error fetching {url}: {e}")
+                    self.stats["failed"] += 1
+                    return empty_details()
+                print(f"    HTTP fetch of {url} failed ({e}); using the browser")
+                return None
+
+        if details is not None:
+            self._http_misses = 0
+            self.stats["http_details"] += 1
+            # A 304 revalidation of a stored page counts as a cache hit
+            self.stats["cached" if revalidated else "fetched"] += 1
+            return details
+
+        if self.detail_mode == "http":
+            return empty_details()
+
+        # The page arrived but its details are rendered client-side
+        self._http_misses += 1
+        if self._http_misses == self.http_miss_limit:
+            print("  Detail pages are not server-rendered; using the browser for remaining bills")
+        return None
+
+    async def _fetch_detail_browser(self, url: str, page_pool: PagePool) -> dict:
+        """Fetch bill details with a page checked out of the pool.
+
+        Raises:
+            Exception: Navigation and page errors propagate, so the pool replaces the
+                page and the caller can retry.
+        """
+        async with page_pool.checkout() as page:
+            details = await self._get_legislation_details_async(page, url)
+        self.stats["browser_details"] += 1
+        self.stats["fetched"] += 1
+        return details
+
+    async def _get_legislation_details_http(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> tuple[dict | None, bool]:
+        """Fetch and parse a bill detail page without a browser.
+
+        Args:
+            session: aiohttp session.
+            url (str): URL of the bill's detail page.
+
+        Returns:
+            Tuple of the parsed details (None if the served HTML does not contain them,
+            i.e. the page is only populated by client-side JavaScript) and whether the
+            page was revalidated from the HTTP cache.
+        """
+        html_content, revalidated = await self._http_get(session, url)
+        details = await self._parse(parse_bill_details, html_content, self.parser)
+        return (details if has_details(details) else None), revalidated
+
+    async def _http_get(
+        self, session: aiohttp.ClientSession, url: str, conditional: bool = True
+    ) -> tuple[str, bool]:
+        """GET a page through the rate limiter, revalidating any stored copy.
+
+        Args:
+            session: aiohttp session.
+            url (str): URL to fetch.
+            conditional (bool): Send cache validators. Default True.
+
+        Returns:
+            Tuple of the response body and True if it came from the HTTP cache after a
+            304 Not Modified response.
+        """
+        headers = {}
+        if conditional and self.http_cache:
+            headers = self.http_cache.conditional_headers(url)
+
+        async with self.rate_limiter.request() as outcome:
+            with self.metrics.timer("http_get"):
+                async with session.get(url, headers=headers) as response:
+                    outcome.status = response.status
+                    outcome.retry_after = response.headers.get("Retry-After")
+                    if response.status == 304 and self.http_cache:
+                        self.metrics.increment("http_not_modified")
+                        with self.metrics.timer("http_cache_io"):
+                            body = self.http_cache.load_body(url)
+                    else:
+                        response.raise_for_status()
+                        body = await response.text()
+                        if self.http_cache:
+                            with self.metrics.timer("http_cache_io"):
+                                self.http_cache.store(url, response.headers, body)
+                        return body, False
+
+        if body is not None:
+            return body, True
+        # The stored body is gone; fetch the page again without validators
+        return await self._http_get(session, url, conditional=False)
+
+    def _get_with_validators(self, url: str, timeout: float = 30) -> str:
+        """GET a page with the requests session, revalidating any stored copy.
+
+        Args:
+            url (str): URL to fetch.
+            timeout (float): Request timeout in seconds.
+
+        Returns:
+            str: Response body, from the HTTP cache on 304 Not Modified.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+        response = self.session.get(url, timeout=timeout, headers=headers)
+
+        if response.status_code == 304 and self.http_cache:
+            body = self.http_cache.load_body(url)
+            if body is not None:
+                return body
+            response = self.session.get(url, timeout=timeout)
+
+        response.raise_for_status()
+        if self.http_cache:
+            self.http_cache.store(url, response.headers, response.text)
+        return response.text
 
     async def _get_legislation_details_async(self, page, url: str) -> dict:
         """Async wrapper for getting legislation details using Playwright.
@@ -289,73 +735,33 @@ class GALegislationScraper:
 
         Returns:
             Dict: Dictionary containing first_reader_summary and status_history.
+
+        Raises:
+            Exception: Navigation and page errors propagate, so the page pool replaces
+                the page and the caller can retry.
         """
+        # Navigate to detail page with shorter timeout to fail fast
+        async with self.rate_limiter.request() as outcome:
+            with self.metrics.timer("navigation"):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            if response is not None:
+                outcome.status = response.status
+                outcome.retry_after = response.headers.get("retry-after")
+
+        # Wait for content to load - wait for h2 headers that contain detail sections
         try:
-            # Navigate to detail page with shorter timeout to fail fast
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-            # Wait for content to load - wait for h2 headers that contain detail sections
-            try:
+            with self.metrics.timer("dom_wait"):
                 await page.wait_for_selector(
                     "h2", timeout=5000
                 )  # h2 contains "First Reader Summary" and "Status History"
-            except Exception:
-                pass  # Content might load without explicit h2 wait
+        except Exception:
+            pass  # Content might load without explicit h2 wait
 
-            # Get the rendered HTML
+        # Get the rendered HTML
+        with self.metrics.timer("content"):
             html_content = await page.content()
 
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            details = {"first_reader_summary": "", "status_history": []}
-
-            # Get First Reader Summary - find h2, then get next div sibling
-            summary_section = soup.find("h2", string=lambda x: x and "First Reader Summary" in x)
-            if summary_section:
-                # The content is in the next sibling div
-                content_div = summary_section.find_next_sibling("div")
-                if content_div:
-                    # Get all text from the div
-                    summary_text = content_div.get_text(strip=True)
-                    if summary_text:
-                        details["first_reader_summary"] = summary_text
-
-            # Get Status History - find h2, then find table inside next div
-            history_section = soup.find("h2", string=lambda x: x and "Status History" in x)
-            if history_section:
-                # The table is in the next sibling div
-                history_div = history_section.find_next_sibling("div")
-                if history_div:
-                    history_table = history_div.find("table")
-                    if history_table:
-                        # Skip header row (tr with th elements)
-                        history_rows = history_table.select("tbody tr")  # type: ignore[union-attr]
-                        for row in history_rows:
-                            cols = row.find_all("td")
-                            if len(cols) >= 2:
-                                date_str = cols[0].get_text(strip=True)
-                                # Convert MM/DD/YYYY to YYYY-MM-DD
-                                try:
-                                    from datetime import datetime
-
-                                    date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                                    formatted_date = date_obj.strftime("%Y-%m-%d")
-                                except ValueError:
-                                    formatted_date = date_str
-
-                                status_list: list[dict[str, str]] = details["status_history"]  # type: ignore[assignment]
-                                status_list.append(
-                                    {
-                                        "date": formatted_date,
-                                        "status": cols[1].get_text(strip=True),
-                                    }
-                                )
-
-            return details
-
-        except Exception as e:
-            print(f"  Warning: Could not get details from {url}: {e}")
-            return {"first_reader_summary": "", "status_history": []}
+        return await self._parse(parse_bill_details, html_content, self.parser)
 
     def test_connection(self) -> bool:
         """Test if we can connect to the website.
@@ -368,8 +774,7 @@ class GALegislationScraper:
         """
         print("Testing connection to www.legis.ga.gov...")
         try:
-            response = self.session.get(self.base_url, timeout=30)
-            response.raise_for_status()
+            self._get_with_validators(self.base_url, timeout=30)
             print("[OK] Connection successful!")
             return True
         except requests.exceptions.Timeout:
@@ -381,20 +786,208 @@ class GALegislationScraper:
             return False
 
     def scrape_and_save(
-        self, output_file: str = "ga_legislation.json", max_pages: int | None = None
-    ) -> list[dict]:
+        self,
+        output_file: str = "ga_legislation.json",
+        max_pages: int | None = None,
+        resume: bool = False,
+        collect: bool = True,
+        json_array: bool = True,
+    ) -> list[Bill]:
         """Main method to scrape all legislation and save to JSON.
 
         Orchestrates the entire scraping process: tests connection, scrapes pages,
-        and saves results to a JSON file.
+        and streams each bill to a JSON Lines file next to ``output_file`` (e.g.
+        ``ga_legislation.jsonl``) as soon as its details arrive.
 
         Args:
             output_file (str): Path to save the JSON file. Defaults to 'ga_legislation.json'.
             max_pages (int, optional): Maximum number of pages to scrape. None = all pages.
+            resume (bool): Continue an interrupted run from its checkpoint. Default False.
+            collect (bool): Also keep every bill in memory and return them. Pass False
+                to keep memory flat on large scrapes. Default True.
+            json_array (bool): Also stream the bills into ``output_file`` as a JSON
+                array for the frontend. Default True.
+
+        With ``deltas_dir`` set, the previous output is copied aside before it is
+        replaced and compared with the new one after the run. With ``store_file`` set, the output is
+        then loaded into the SQLite store.
 
         Returns:
-            List[Dict]: List of legislation records, each containing doc_number, caption,
-                committees, sponsors, detail_url, first_reader_summary, and status_history.
+            List[Bill]: Legislation records (empty if ``collect`` is False), each with
+                doc_number, caption, committees, sponsors, detail_url,
+                first_reader_summary, and status_history. ``Bill.to_dict()`` gives the
+                JSON form written to ``output_file``.
+
+        Raises:
+            SystemExit: Exits with code 1 if unable to connect to the website.
+        """
+        self._preflight()
+
+        print("\nStarting to scrape Georgia legislation...")
+        print(
+            f"Configuration: up to {self.max_concurrent} concurrent requests, "
+            f"{self.request_delay}s initial delay, up to {self.rate_limiter.max_rate} req/s"
+        )
+
+        output_path = Path(output_file) if json_array else Path(output_file).with_suffix(".jsonl")
+        previous = self._stash_previous_output(output_path) if self.deltas_dir else None
+
+        try:
+            with self._open_writer(output_file, json_array) as writer:
+                legislation_data = self._run(
+                    self.get_all_pages(max_pages, resume=resume, writer=writer, collect=collect)
+                )
+            self._report(writer)
+            if self.deltas_dir:
+                self._publish_delta(previous, output_path, self.deltas_dir, max_pages)
+        finally:
+            if previous is not None:
+                previous.unlink(missing_ok=True)
+        if self.store_file:
+            started = time.perf_counter()
+            stored = build_store(output_path, self.store_file)
+            print(
+                f"  Store: {stored} bills in {self.store_file} "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+        return legislation_data
+
+    async def scrape_and_save_async(
+        self,
+        output_file: str = "ga_legislation.json",
+        max_pages: int | None = None,
+        resume: bool = False,
+        json_array: bool = True,
+    ) -> int:
+        """Stream the listing's bills to ``output_file`` inside a running event loop.
+
+        Lets several scrapers (e.g. one per legislative session) share one event loop
+        and rate limiter. Bills are not kept in memory. The caches are closed
+        afterwards, so each scraper runs once.
+
+        Args:
+            output_file (str): Path of the JSON output. Defaults to 'ga_legislation.json'.
+            max_pages (int, optional): Maximum number of pages to scrape. None = all pages.
+            resume (bool): Continue an interrupted run from its checkpoint. Default False.
+            json_array (bool): Also write ``output_file`` as a JSON array. Default True.
+
+        Returns:
+            int: Number of unique bills saved.
+        """
+        try:
+            with self._open_writer(output_file, json_array) as writer:
+                await self.get_all_pages(max_pages, resume=resume, writer=writer, collect=False)
+        finally:
+            self._close_caches()
+        self._report(writer)
+        return writer.written
+
+    def list_sessions(self) -> list[LegislativeSession]:
+        """Load the listing page once and return the legislative sessions it offers.
+
+        Returns:
+            List of LegislativeSession, newest first (empty if none were recognized).
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            print("Error: Playwright is required to list legislative sessions.")
+            print("Install it with: pip install playwright")
+            return []
+        return asyncio.run(self._list_sessions_async())
+
+    async def _list_sessions_async(self) -> list[LegislativeSession]:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            context = await browser.new_context(
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            )
+            await self.resource_blocker.install(context)
+            page = await context.new_page()
+            captured: list = []
+            page.on("response", captured.append)
+            try:
+                await page.goto(
+                    listing_url(self.base_url), wait_until="domcontentloaded", timeout=60000
+                )
+                await asyncio.sleep(2)
+
+                # Sessions usually arrive as JSON for the SPA's session picker
+                for response in captured:
+                    if response.request.resource_type not in ("xhr", "fetch"):
+                        continue
+                    if "json" not in response.headers.get("content-type", ""):
+                        continue
+                    try:
+                        sessions = extract_sessions(await response.json())
+                    except Exception:
+                        continue
+                    if sessions:
+                        return sessions
+
+                # Otherwise read the picker's rendered options
+                options = await page.evaluate(SESSION_OPTIONS_JS)
+                return extract_sessions(options or [])
+            finally:
+                await page.close()
+                await context.close()
+                await browser.close()
+
+    def build_manifest(
+        self,
+        manifest_file: str = "scrape_manifest.json",
+        max_pages: int | None = None,
+        resume: bool = False,
+    ) -> list[dict]:
+        """Walk the listing only and write every bill stub to a work manifest.
+
+        Args:
+            manifest_file (str): Manifest path. Default 'scrape_manifest.json'.
+            max_pages (int, optional): Maximum number of pages to list. None = all pages.
+            resume (bool): Continue an interrupted listing from its checkpoint. Default False.
+
+        Returns:
+            List[Dict]: The deduplicated bill stubs written to the manifest.
+        """
+        self._preflight()
+
+        print("\nListing Georgia legislation for a sharded scrape...")
+        listed = self._run(self.get_all_pages(max_pages, fetch_details=False, resume=resume))
+        stubs = dedupe_bills([bill.to_dict() for bill in listed])
+        write_manifest(stubs, manifest_file)
+        print(f"\nWrote {len(stubs)} bills to manifest {manifest_file}")
+        return stubs
+
+    def scrape_shard(
+        self,
+        manifest_file: str,
+        shard_index: int,
+        num_shards: int,
+        output_file: str,
+        collect: bool = True,
+    ) -> list[Bill]:
+        """Fetch details for one shard of a work manifest and save the partial output.
+
+        Args:
+            manifest_file (str): Manifest written by ``build_manifest``.
+            shard_index (int): 0-based shard this worker handles.
+            num_shards (int): Total number of shards.
+            output_file (str): Partial output path for this shard.
+            collect (bool): Also keep the bills in memory and return them. Default True.
+
+        Returns:
+            List[Bill]: Legislation records of this shard (empty if ``collect`` is False).
+        """
+        stubs = select_shard(load_manifest(manifest_file), shard_index, num_shards)
+        print(f"\nShard {shard_index + 1}/{num_shards}: {len(stubs)} bills from {manifest_file}")
+
+        with self._open_writer(output_file, json_array=True) as writer:
+            legislation_data = self._run(
+                self.get_all_pages(bill_stubs=stubs, writer=writer, collect=collect)
+            )
+        self._report(writer)
+        return legislation_data
+
+    def _preflight(self) -> None:
+        """Test the connection and check robots.txt before scraping.
 
         Raises:
             SystemExit: Exits with code 1 if unable to connect to the website.
@@ -417,51 +1010,157 @@ class GALegislationScraper:
             # Don't exit - allow user to proceed, but warn them
             input("Press Enter to continue or Ctrl+C to cancel...")
 
-        print("\nStarting to scrape Georgia legislation...")
-        print(
-            f"Configuration: {self.max_concurrent} concurrent requests, {self.request_delay}s delay"
+    def _run(self, coro) -> list[Bill]:
+        """Run a scrape coroutine, closing the caches afterwards."""
+        try:
+            return asyncio.run(coro)
+        finally:
+            self._close_caches()
+
+    def _stage(self, name: str) -> AbstractContextManager:
+        """Mark a stage of the run for the profiler, if one is attached."""
+        return self.profiler.stage(name) if self.profiler else nullcontext()
+
+    def _close_caches(self) -> None:
+        if self._cache is not None:
+            self._cache.close()
+        if self.http_cache:
+            self.http_cache.close()
+
+    def _open_writer(self, output_file: str, json_array: bool) -> StreamingBillWriter:
+        """Open the streaming writer for ``output_file`` and its JSON Lines sibling."""
+        output_path = Path(output_file)
+        return StreamingBillWriter(
+            output_path.with_suffix(".jsonl"), output_path if json_array else None
         )
 
-        # Run async scraper
-        legislation_data = asyncio.run(self.get_all_pages(max_pages))
-
-        # Deduplicate by doc_number (pagination may create duplicates)
-        seen_doc_numbers = set()
-        unique_legislation = []
-        for bill in legislation_data:
-            doc_num = bill.get("doc_number")
-            if doc_num and doc_num not in seen_doc_numbers:
-                seen_doc_numbers.add(doc_num)
-                unique_legislation.append(bill)
-
-        # Save to JSON file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(unique_legislation, f, indent=2, ensure_ascii=False)
+    def _report(self, writer: StreamingBillWriter) -> None:
+        """Print output and run statistics."""
+        self.stats["saved"] = writer.written
+        outputs = [str(writer.jsonl_file)] + ([str(writer.json_file)] if writer.json_file else [])
 
         # Print statistics
         print("\nScraping complete!")
-        print(f"  Saved {len(unique_legislation)} unique items to {output_file}")
-        if len(legislation_data) > len(unique_legislation):
-            duplicates_removed = len(legislation_data) - len(unique_legislation)
-            print(f"  Removed {duplicates_removed} duplicate entries")
+        print(f"  Saved {writer.written} unique items to {' and '.join(outputs)}")
+        if writer.duplicates:
+            # Pagination may list a bill twice; only its first record is written
+            print(f"  Removed {writer.duplicates} duplicate entries")
         print(f"  Pages processed: {self.stats['pages_processed']}")
         print(
-            f"  Details: {self.stats['fetched']} fetched, {self.stats['cached']} cached, {self.stats['failed']} failed"
+            f"  Details: {self.stats['fetched']} fetched ({self.stats['refreshed']} refreshed), "
+            f"{self.stats['cached']} cached, {self.stats['failed']} failed"
+        )
+        print(
+            f"  Detail sources: {self.stats['http_details']} plain HTTP, {self.stats['browser_details']} browser"
+        )
+        limiter = self.rate_limiter.stats()
+        print(
+            f"  Rate limiter: ended at {limiter['rate']:.1f} req/s x {limiter['concurrency']} "
+            f"concurrent, {limiter['throttled']} throttled responses, "
+            f"{limiter['decreases']} backoffs"
         )
+        if self.page_pool_stats.get("checkouts"):
+            pool = self.page_pool_stats
+            print(
+                f"  Page pool: {pool['checkouts']:.0f} checkouts, {pool['created']:.0f} pages opened, "
+                f"{pool['recycled']:.0f} recycled, wait avg {pool['avg_wait'] * 1000:.0f}ms / "
+                f"max {pool['max_wait'] * 1000:.0f}ms"
+            )
+
+        blocking = self.resource_blocker.stats()
+        if blocking["blocked"]:
+            print(
+                f"  Resource blocking: {blocking['blocked']} browser requests aborted "
+                f"(~{blocking['estimated_bytes_saved'] / 1_000_000:.1f} MB saved), "
+                f"{blocking['allowed']} allowed"
+            )
+
+        self._export_metrics(limiter, blocking)
+
+    @staticmethod
+    def _stash_previous_output(output_path: Path) -> Path | None:
+        """Copy the output of the previous run aside so it survives being replaced.
 
-        return legislation_data
+        Returns:
+            Path of the copy, or None if there was no previous output.
+        """
+        stash = output_path.with_name(f"{output_path.stem}.previous{output_path.suffix}")
+        try:
+            shutil.copyfile(output_path, stash)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"  Warning: Could not keep {output_path} for deltas: {e}")
+            return None
+        return stash
+
+    def _publish_delta(
+        self, previous: Path | None, output_path: Path, deltas_dir: str, max_pages: int | None
+    ) -> None:
+        """Write the changes from the ``previous`` output file to the new one as the next delta."""
+        # A partial listing would look like every unlisted bill was removed
+        if max_pages is not None or not self.listing_complete:
+            print("  Deltas: skipped, the listing was not scraped to its end")
+            return
+        publish_delta(previous, output_path, deltas_dir)
+
+    def _export_metrics(self, limiter: dict, blocking: dict) -> None:
+        """Print where the time went and write the metrics report."""
+        for name in ("rate", "concurrency", "throttled", "decreases"):
+            self.metrics.set_gauge(f"rate_limiter_{name}", limiter[name])
+        for name, value in self.page_pool_stats.items():
+            self.metrics.set_gauge(f"page_pool_{name}", value)
+        self.metrics.set_gauge("blocked_requests", blocking["blocked"])
+
+        phases = sorted(self.metrics.phases.items(), key=lambda item: -item[1].sum)
+        if phases:
+            print(f"  Time by phase (wall {self.metrics.wall_seconds:.1f}s, phases overlap):")
+            for phase, histogram in phases[:6]:
+                print(
+                    f"    {phase}: {histogram.sum:.1f}s over {histogram.count}, "
+                    f"p50 {histogram.quantile(0.5) * 1000:.0f}ms / "
+                    f"p95 {histogram.quantile(0.95) * 1000:.0f}ms"
+                )
 
-    async def get_all_pages(self, max_pages: int | None = None) -> list[dict]:
-        """Scrape all pages of legislation using JavaScript pagination clicks.
+        if self.metrics_file:
+            try:
+                prom_file = self.metrics.write(self.metrics_file, self.stats)
+                print(f"  Metrics: {self.metrics_file} and {prom_file}")
+            except OSError as e:
+                print(f"  Warning: Could not write metrics to {self.metrics_file}: {e}")
 
-        Uses Playwright to click pagination buttons to navigate through all pages,
-        extracting bill information and details from each page using concurrent requests.
+    async def get_all_pages(
+        self,
+        max_pages: int | None = None,
+        bill_stubs: list[dict] | None = None,
+        fetch_details: bool = True,
+        resume: bool = False,
+        writer: StreamingBillWriter | None = None,
+        collect: bool = True,
+    ) -> list[Bill]:
+        """Scrape all pages of legislation and fetch each bill's details.
+
+        Bill listings come from the SPA's JSON search endpoint when it can be discovered
+        (``listing_mode`` "auto" or "api"), or by clicking through the rendered
+        pagination with Playwright. The listing pushes bill stubs into a bounded queue
+        that ``max_concurrent`` detail workers drain continuously.
 
         Args:
             max_pages (int, optional): Maximum number of pages to scrape. None = all pages.
+            bill_stubs (list, optional): Bills to fetch details for instead of walking the
+                listing, e.g. one shard of a work manifest.
+            fetch_details (bool): If False, only walk the listing and return the bill
+                stubs. Default True.
+            resume (bool): Continue the listing after the last page recorded in the
+                checkpoint instead of starting over. Default False.
+            writer (StreamingBillWriter, optional): Receives each bill as soon as its
+                details are validated.
+            collect (bool): Keep the bills in the returned list. Default True.
 
         Returns:
-            List[Dict]: List of legislation records.
+            List[Bill]: Compact legislation records (``Bill.to_dict()`` gives the JSON
+                form). Stubs are converted as they are queued, so repeated sponsor,
+                committee and status strings are shared between bills.
         """
         if not PLAYWRIGHT_AVAILABLE:
             print("Error: Playwright is required to scrape this website (it uses JavaScript).")
@@ -469,369 +1168,877 @@ class GALegislationScraper:
             print("Then run: playwright install")
             return []
 
-        all_legislation = []
+        all_legislation: list[Bill] = []
 
         connector = aiohttp.TCPConnector(
             limit=self.max_concurrent, limit_per_host=10, ttl_dns_cache=300
         )
         timeout = aiohttp.ClientTimeout(total=60)
 
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Reuse the browser-like headers; compression is negotiated by aiohttp itself
+        headers = {
+            key: str(value)
+            for key, value in self.session.headers.items()
+            if key in ("User-Agent", "Accept", "Accept-Language")
+        }
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=headers
+        ) as session:
             async with async_playwright() as p:
                 # Launch browser with headless mode
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                )
+                with self._stage("browser_setup"):
+                    browser = await p.chromium.launch(headless=True)
+                    context = await browser.new_context(
+                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                    )
+                    await self.resource_blocker.install(context)
 
-                # Create page pool for concurrent detail fetching
-                print(
-                    f"Creating pool of {self.page_pool_size} browser pages for concurrent fetching..."
-                )
-                detail_pages = [await context.new_page() for _ in range(self.page_pool_size)]
+                # Page pool for concurrent detail fetching (not needed in "http" mode);
+                # pages are opened on first use
+                page_pool = None
+                if fetch_details and self.detail_mode != "http" and self.page_pool_size > 0:
+                    print(f"Using a pool of up to {self.page_pool_size} browser pages for details")
+                    page_pool = PagePool(context, self.page_pool_size, self.page_max_uses)
 
                 # Use a single page for main navigation
                 page = await context.new_page()
 
+                self._parse_executor = self._start_parse_pool()
                 try:
-                    page_num = 1
-                    total_pages = None
-                    consecutive_failures = 0
-                    max_consecutive_failures = 3
-
-                    # Load initial page
-                    print("Loading legislation page...")
-                    url = f"{self.base_url}/legislation/all"
-                    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                    await asyncio.sleep(2)
-
-                    while True:
-                        if max_pages and page_num > max_pages:
-                            break
-
-                        if consecutive_failures >= max_consecutive_failures:
+                    # Checkpoints track listing progress, so they only apply when listing
+                    checkpoint = self.checkpoint if bill_stubs is None else None
+                    if checkpoint is not None:
+                        if resume and checkpoint.load() is not None:
                             print(
-                                f"\nStopping after {max_consecutive_failures} consecutive failed pages"
+                                f"Resuming from checkpoint: {len(checkpoint.bills)} bills listed "
+                                f"through page {checkpoint.last_page}"
+                                + (" (listing complete)" if checkpoint.complete else "")
                             )
-                            break
+                        else:
+                            checkpoint.reset()
+
+                    listing = None
+                    self.listing_complete = bool(checkpoint and checkpoint.complete)
+                    if bill_stubs is None and not self.listing_complete:
+                        with self._stage("listing_setup"):
+                            listing = await self._open_listing(page, session, max_pages)
+                        if listing is None:
+                            return []
+                    if checkpoint is not None:
+                        # Stubs listed before the interruption; their details are mostly cached
+                        bill_stubs = list(checkpoint.bills)
+                        self.stats["pages_processed"] = checkpoint.last_page
+
+                    # Listing producer feeds a bounded queue drained by detail workers,
+                    # so page turns and detail fetches overlap
+                    # Workers finish bills out of order; the sink restores listing order
+                    queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+                    sink = OrderedBillSink(all_legislation if collect else None, writer)
+                    workers = [
+                        asyncio.create_task(self._detail_worker(queue, session, page_pool, sink))
+                        for _ in range(self.max_concurrent if fetch_details else 0)
+                    ]
+
+                    async def enqueue(bills: list[dict]) -> None:
+                        for stub in bills:
+                            bill_data = Bill.from_dict(stub)
+                            if fetch_details:
+                                # Blocks while workers catch up
+                                await queue.put((sink.ticket(), bill_data))
+                                self.metrics.set_gauge("detail_queue_depth", queue.qsize())
+                            else:
+                                all_legislation.append(bill_data)
 
-                        if total_pages and page_num > total_pages:
-                            print(f"\nReached last page ({total_pages})")
-                            break
+                    try:
+                        if bill_stubs:
+                            print(f"Queueing {len(bill_stubs)} previously listed bills")
+                            await enqueue(bill_stubs)
 
-                        print(f"\nScraping page {page_num}...")
+                        if listing is not None:
+                            with self._stage("listing"):
+                                self._listing_stalled = False
+                                async for page_num, page_bills in listing:
+                                    await enqueue(page_bills)
 
-                        try:
-                            # Get the HTML after JavaScript has rendered
-                            html_content = await page.content()
-                            soup = BeautifulSoup(html_content, "html.parser")
-
-                            # Detect total pages from pagination info on first page
-                            if not total_pages:
-                                pagination_text = soup.get_text()
-                                match = re.search(r"(\d+)-(\d+)\s+of\s+(\d+)", pagination_text)
-                                if match:
-                                    total_results = int(match.group(3))
-                                    items_per_page = int(match.group(2)) - int(match.group(1)) + 1
-                                    total_pages = (
-                                        total_results + items_per_page - 1
-                                    ) // items_per_page
+                                    self.stats["pages_processed"] += 1
                                     print(
-                                        f"  Detected: {total_results} total bills across {total_pages} pages"
+                                        f"  ✓ Page {page_num} listed: {len(page_bills)} bills "
+                                        f"({queue.qsize()} waiting for details)"
                                     )
+                                    if checkpoint is not None:
+                                        checkpoint.record_page(page_num, page_bills)
+
+                            self.listing_complete = not self._listing_stalled
+                            if checkpoint is not None and self.listing_complete:
+                                checkpoint.mark_complete()
+
+                        # Details still being fetched after the listing ended
+                        with self._stage("detail_drain"):
+                            await queue.join()
+                        if checkpoint is not None and checkpoint.complete:
+                            checkpoint.clear()
+                    finally:
+                        for worker in workers:
+                            worker.cancel()
+                        await asyncio.gather(*workers, return_exceptions=True)
 
-                            # Find all legislation rows
-                            rows: Any = soup.select("table tbody tr")
-                            if not rows:
-                                rows_temp = soup.select("table tr")[
-                                    1:
-                                ]  # Skip header row if it exists
-                                rows = rows_temp
-
-                            if not rows:
-                                consecutive_failures += 1
-                                print(
-                                    f"  No rows found (attempt {consecutive_failures}/{max_consecutive_failures})"
-                                )
-                                await asyncio.sleep(2)
-                                # Try clicking next page anyway
-                                if total_pages and page_num < total_pages:
-                                    try:
-                                        await page.click(f'a:text("{page_num + 1}")', timeout=5000)
-                                        await asyncio.sleep(2)
-                                    except Exception:
-                                        pass
-                                page_num += 1
-                                continue
-
-                            consecutive_failures = 0  # Reset on success
-
-                            # Collect bill info and queue detail fetches
-                            page_bills = []
-                            for row in rows:
-                                try:
-                                    # Extract basic info
-                                    doc_number_elem = row.select_one("td:first-child a")
-                                    if not doc_number_elem:
-                                        continue
-
-                                    doc_number = doc_number_elem.text.strip().replace(" ", "")
-                                    href = doc_number_elem.get("href", "")
-                                    detail_url = self.base_url + (
-                                        href if isinstance(href, str) else str(href)
-                                    )
+                finally:
+                    with self._stage("cache_save"):
+                        self._save_cache()
 
-                                    tds = row.select("td")
-                                    if len(tds) < 4:
-                                        continue
+                    if self._parse_executor is not None:
+                        self._parse_executor.shutdown(wait=False, cancel_futures=True)
+                        self._parse_executor = None
 
-                                    caption_elem = tds[1].select_one("a")
-                                    caption = caption_elem.text.strip() if caption_elem else ""
+                    # Close all pages in the pool
+                    if page_pool is not None:
+                        await page_pool.close()
+                        self.page_pool_stats = page_pool.stats()
+                    await page.close()
+                    await context.close()
+                    await browser.close()
 
-                                    committees_list = []
-                                    for dd in tds[2].select("a"):
-                                        committees_list.append(dd.text.strip())
+        return all_legislation
 
-                                    sponsors_list = []
-                                    for sponsor in tds[3].select("a"):
-                                        sponsors_list.append(sponsor.text.strip())
-                                    print(f"  Found {doc_number}...")
+    async def _open_listing(
+        self, page, session: aiohttp.ClientSession, max_pages: int | None
+    ) -> AsyncIterator[tuple[int, list[dict]]] | None:
+        """Load the listing page and choose how to page through it.
 
-                                    bill_data = {
-                                        "doc_number": doc_number,
-                                        "caption": caption,
-                                        "committees": committees_list,
-                                        "sponsors": sponsors_list,
-                                        "detail_url": detail_url,
-                                    }
-                                    page_bills.append(bill_data)
+        Args:
+            page: Playwright page used for listing navigation.
+            session: aiohttp session for the listing API.
+            max_pages: Maximum number of pages to scrape. None = all pages.
 
-                                except Exception as e:
-                                    print(f"  Error processing row: {e}")
-                                    continue
+        Returns:
+            An iterator of (page number, bill stubs), or None if ``listing_mode`` is
+            "api" and no listing endpoint was found, or if ``session_id`` could only be
+            requested in the browser and the page shows another session.
+        """
+        # Load initial page, watching for the SPA's listing request
+        print("Loading legislation page...")
+        captured: list = []
+        on_response = captured.append
+        if self.listing_mode != "browser":
+            page.on("response", on_response)
+
+        url = listing_url(self.base_url, self.session_id)
+        with self.metrics.timer("listing_navigation"):
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        await asyncio.sleep(2)
+
+        if self.listing_mode != "browser":
+            page.remove_listener("response", on_response)
+            endpoint = await self._discover_listing_endpoint(captured)
+            checkpoint = self.checkpoint
+            if (
+                endpoint is not None
+                and self.listing_mode == "auto"
+                and checkpoint is not None
+                and checkpoint.source == "browser"
+                and checkpoint.last_page
+            ):
+                # E.g. the API failed part way last time; its page numbers don't apply
+                print("  Checkpoint was listed in the browser; resuming there")
+            elif endpoint is not None:
+                if self.session_id is not None:
+                    endpoint = endpoint_for_session(endpoint, self.session_id)
+                print(f"  Using listing API: {endpoint.method} {endpoint.url}")
+                start_page = self._resume_page(f"api:{self.listing_page_size}")
+                return self._iter_listing_api(session, endpoint, max_pages, start_page, page)
+            elif self.listing_mode == "api":
+                print("Error: Could not discover the legislation listing API")
+                return None
+            else:
+                print("  Listing API not found; paginating in the browser")
 
-                            # Fetch details concurrently with rate limiting
-                            print(
-                                f"  Fetching details for {len(page_bills)} bills in small batches (2-3 concurrent)..."
-                            )
+        # Without the API the session rides on a guessed URL parameter; make sure it took
+        if self.session_id is not None:
+            selected = await page.evaluate(SELECTED_OPTIONS_JS)
+            if self.session_id not in (selected or []):
+                print(
+                    f"Error: The listing page does not show session {self.session_id} and no "
+                    "listing API was found to select it"
+                )
+                return None
 
-                            # Process bills in very small batches to avoid overwhelming the server
-                            # Use smaller batch size than max_concurrent for more conservative rate limiting
-                            batch_size = min(2, self.max_concurrent)
-                            completed_bills = []
+        return self._iter_listing_browser(page, max_pages, self._resume_page("browser"))
 
-                            for batch_start in range(0, len(page_bills), batch_size):
-                                batch_end = min(batch_start + batch_size, len(page_bills))
-                                batch = page_bills[batch_start:batch_end]
+    def _resume_page(self, source: str) -> int:
+        """Return the listing page to start from, given how the listing is paged.
 
-                                print(
-                                    f"    Processing batch {batch_start // batch_size + 1} ({len(batch)} bills)..."
-                                )
+        Page numbers are only comparable between runs that page the listing the same
+        way, so a checkpoint from another source (API vs. browser, or a different API
+        page size) is discarded.
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return 1
+        if checkpoint.last_page and checkpoint.source != source:
+            print(
+                f"  Warning: Checkpoint was listed via {checkpoint.source}, now {source}; "
+                "listing from page 1"
+            )
+            checkpoint.reset(source)
+            return 1
+        checkpoint.source = source
+        if checkpoint.last_page:
+            print(f"  Resuming listing after page {checkpoint.last_page}")
+        return checkpoint.last_page + 1
+
+    def _start_parse_pool(self) -> ProcessPoolExecutor | None:
+        """Create the HTML parsing process pool, or None to parse inline."""
+        if self.parse_workers <= 0:
+            return None
+        print(f"Parsing HTML in {self.parse_workers} worker processes")
+        # "spawn" keeps workers from inheriting the event loop and browser driver state
+        return ProcessPoolExecutor(
+            max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+        )
 
-                                # Create semaphore for this batch
-                                semaphore = asyncio.Semaphore(batch_size)
+    async def _parse(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a pure parsing function in the process pool so the event loop stays free.
 
-                                # Create tasks for this batch only
-                                tasks = [
-                                    self._fetch_with_semaphore(
-                                        semaphore, session, bill_data, detail_pages
-                                    )
-                                    for bill_data in batch
-                                ]
+        Falls back to parsing inline when no pool is running or the pool broke (e.g. a
+        worker was killed).
+        """
+        with self.metrics.timer("parse"):
+            executor = self._parse_executor
+            if executor is None:
+                return func(*args)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                if self._parse_executor is executor:
+                    print("  Warning: Parsing process pool failed; parsing inline from now on")
+                    self._parse_executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                return func(*args)
 
-                                # Execute batch concurrently
-                                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                                completed_bills.extend(batch_results)
+    async def _discover_listing_endpoint(self, responses: list) -> ListingEndpoint | None:
+        """Find the listing JSON endpoint among responses captured while the SPA loaded.
 
-                                # Add delay between batches to avoid overwhelming server
-                                if batch_end < len(page_bills):
-                                    await asyncio.sleep(1.5)
+        Args:
+            responses: Playwright response objects seen during the initial page load.
 
-                            # Process results and validate
-                            for idx, result in enumerate(completed_bills):
-                                if isinstance(result, Exception):
-                                    print(
-                                        f"    Error fetching {page_bills[idx]['doc_number']}: {result}"
-                                    )
-                                    self.stats["failed"] += 1
-                                    continue
-
-                                # Type guard: result is now known to be dict
-                                if not isinstance(result, dict):
-                                    continue
-
-                                # Validate bill data before adding
-                                try:
-                                    self.validate_bill_data(result)
-                                    all_legislation.append(result)
-                                    self.stats["total_bills"] += 1
-                                except ValidationError as e:
-                                    print(f"    Validation error for {result['doc_number']}: {e}")
-                                    self.stats["failed"] += 1
-                                    continue
-
-                            self.stats["pages_processed"] += 1
-                            print(
-                                f"  ✓ Page {page_num} complete: {len(completed_bills)} bills processed"
+        Returns:
+            ListingEndpoint, or None if no captured request looks like the listing.
+        """
+        for response in responses:
+            request = response.request
+            if request.resource_type not in ("xhr", "fetch"):
+                continue
+            if "json" not in response.headers.get("content-type", ""):
+                continue
+
+            try:
+                payload = await response.json()
+            except Exception:
+                continue
+
+            endpoint = endpoint_from_request(
+                request.method,
+                request.url,
+                request.post_data,
+                await request.all_headers(),
+                payload,
+                self.base_url,
+            )
+            if endpoint is not None:
+                return endpoint
+
+        return None
+
+    async def _iter_listing_api(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: ListingEndpoint,
+        max_pages: int | None,
+        start_page: int = 1,
+        page=None,
+    ) -> AsyncIterator[tuple[int, list[dict]]]:
+        """Page through the listing JSON endpoint directly.
+
+        A page that still fails after its retries hands the rest of the listing to
+        browser pagination on ``page``, skipping the bills already listed.
+
+        Args:
+            session: aiohttp session.
+            endpoint: Listing endpoint captured from the SPA.
+            max_pages: Maximum number of API pages (of ``listing_page_size`` bills).
+            start_page: First page to request (1-based). Default 1.
+            page: Playwright page showing the first listing page, for the fallback.
+
+        Yields:
+            Tuples of (page number, bill stubs on that page).
+        """
+        page_index = start_page - 1
+        seen = page_index * self.listing_page_size
+        total_results = None
+
+        while not max_pages or page_index < max_pages:
+            print(f"\nScraping page {page_index + 1}...")
+            payload = await self._fetch_listing_api_page(session, endpoint, page_index)
+            if payload is None:
+                if page is None:
+                    self._listing_stalled = True
+                    return
+                print("  Listing API keeps failing; listing the remaining pages in the browser")
+                if self.checkpoint is not None:
+                    # The API's bills stay listed; the next saved page is a browser page
+                    # number, so a resume continues in the browser after it
+                    self.checkpoint.source = "browser"
+                    self.checkpoint.last_page = 0
+                async for item in self._iter_listing_browser(page, max_pages, skip_bills=seen):
+                    yield item
+                return
+
+            if total_results is None:
+                total_results = extract_total(payload)
+                if total_results is not None:
+                    total_pages = -(-total_results // self.listing_page_size)
+                    print(f"  Detected: {total_results} total bills across {total_pages} pages")
+
+            records = extract_records(payload)
+            if not records:
+                break
+
+            page_bills = []
+            for record in records:
+                bill_data = record_to_bill(record, self.base_url)
+                if bill_data is not None:
+                    print(f"  Found {bill_data['doc_number']}...")
+                    page_bills.append(bill_data)
+
+            yield page_index + 1, page_bills
+
+            seen += len(records)
+            page_index += 1
+            if total_results is not None and seen >= total_results:
+                break
+
+    async def _fetch_listing_api_page(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: ListingEndpoint,
+        page_index: int,
+        max_retries: int = 3,
+    ) -> Any | None:
+        """Fetch one listing API page, retrying throttled and failed requests.
+
+        Args:
+            session: aiohttp session.
+            endpoint: Listing endpoint captured from the SPA.
+            page_index: Zero-based page to request.
+            max_retries: Maximum attempts. Default 3.
+
+        Returns:
+            The decoded JSON response, or None if the page could not be fetched.
+        """
+        for attempt in range(max_retries):
+            try:
+                async with self.rate_limiter.request() as outcome:
+                    try:
+                        with self.metrics.timer("listing_api"):
+                            return await fetch_listing_page(
+                                session, endpoint, page_index, self.listing_page_size
                             )
+                    except aiohttp.ClientResponseError as e:
+                        outcome.status = e.status
+                        outcome.retry_after = e.headers.get("Retry-After") if e.headers else None
+                        raise
+            except (TimeoutError, aiohttp.ClientError, ValueError) as e:
+                if isinstance(e, ValueError) or not is_retryable(outcome.status):
+                    print(f"  Listing API page {page_index + 1} failed: {e}")
+                    return None
+                if attempt < max_retries - 1:
+                    print(f"  Listing API page {page_index + 1} failed ({e}); retrying...")
+                    self.metrics.increment("listing_retries")
+                    await self.rate_limiter.backoff(attempt, outcome)
+                else:
+                    print(f"  Listing API page {page_index + 1} failed {max_retries} times: {e}")
+        return None
 
-                            # Click next page if not at last page
-                            if total_pages is None or page_num < total_pages:
-                                next_page_num = page_num + 1
-                                try:
-                                    print(f"  Navigating to page {next_page_num}...")
-                                    # Get current bill count to detect when new content loads
-                                    old_content = await page.content()
-
-                                    # First, scroll to bottom to ensure pagination is visible
-                                    await page.evaluate(
-                                        "window.scrollTo(0, document.body.scrollHeight)"
-                                    )
-                                    await asyncio.sleep(0.5)
-
-                                    # Strategy 1: Try clicking the visible page number link first
-                                    clicked = False
-                                    try:
-                                        await page.click(
-                                            f'a:text-is("{next_page_num}")',
-                                            timeout=5000,
-                                            force=True,
-                                        )
-                                        clicked = True
-                                        print(f"    Clicked page {next_page_num} link directly")
-                                    except Exception:
-                                        pass
-
-                                    # Strategy 2: If page number not visible, try "Next" button or navigation arrow
-                                    if not clicked:
-                                        try:
-                                            # Try common "Next" button selectors
-                                            next_selectors = [
-                                                'a:has-text("Next")',
-                                                'a:has-text("›")',
-                                                'a:has-text("»")',
-                                                'button:has-text("Next")',
-                                                'a[aria-label*="Next"]',
-                                                'button[aria-label*="Next"]',
-                                                ".pagination a.next",
-                                                ".pagination-next",
-                                                'a[rel="next"]',
-                                            ]
-
-                                            for selector in next_selectors:
-                                                try:
-                                                    await page.click(selector, timeout=2000)
-                                                    clicked = True
-                                                    print(
-                                                        f"    Clicked next page using selector: {selector}"
-                                                    )
-                                                    break
-                                                except Exception:
-                                                    continue
-                                        except Exception as e:
-                                            print(f"    Next button strategies failed: {e}")
-
-                                    # Strategy 3: If still not clicked, check if page number is in visible pagination
-                                    if not clicked:
-                                        try:
-                                            # Get all visible page links
-                                            page_links = await page.locator('a[href*="page"]').all()
-                                            if not page_links:
-                                                page_links = await page.locator(
-                                                    ".pagination a"
-                                                ).all()
-
-                                            # Find the highest visible page number and click it if it's < next_page_num
-                                            highest_visible = 0
-                                            for link in page_links:
-                                                text = await link.inner_text()
-                                                if text.strip().isdigit():
-                                                    num = int(text.strip())
-                                                    if num > highest_visible:
-                                                        highest_visible = num
-
-                                            if highest_visible > page_num:
-                                                await page.click(
-                                                    f'a:text-is("{highest_visible}")', timeout=5000
-                                                )
-                                                clicked = True
-                                                print(
-                                                    f"    Clicked highest visible page: {highest_visible}"
-                                                )
-                                        except Exception as e:
-                                            print(f"    Fallback pagination strategy failed: {e}")
-
-                                    if not clicked:
-                                        raise Exception(
-                                            f"Could not navigate to page {next_page_num}"
-                                        )
-
-                                    # Wait for content to change
-                                    for attempt in range(15):
-                                        await asyncio.sleep(1)
-                                        new_content = await page.content()
-                                        if new_content != old_content:
-                                            print(f"    Page loaded after {attempt + 1}s")
-                                            break
-
-                                except Exception as e:
-                                    print(f"  Could not click page {next_page_num}: {e}")
-                                    if total_pages and page_num < total_pages:
-                                        # If we can't click but there are more pages, increment failure counter
-                                        consecutive_failures += 1
-                                    else:
-                                        # Otherwise we've reached the end
-                                        break
-                            else:
-                                break
+    async def _iter_listing_browser(
+        self, page, max_pages: int | None, start_page: int = 1, skip_bills: int = 0
+    ) -> AsyncIterator[tuple[int, list[dict]]]:
+        """Walk the rendered listing by clicking pagination links with Playwright.
+
+        Args:
+            page: Playwright page already showing the first listing page.
+            max_pages: Maximum number of pages to scrape. None = all pages.
+            start_page: First page to yield (1-based); earlier pages are skipped
+                without parsing (see ``_skip_to_page``). Default 1.
+            skip_bills: Number of leading bills that were already listed (e.g. by the
+                listing API before it failed); they are not yielded, and pages holding
+                only such bills are skipped once the page size is known. Default 0.
+
+        Yields:
+            Tuples of (page number, bill stubs on that page).
+        """
+        page_num = 1
+        if max_pages and start_page > max_pages:
+            return
+        if start_page > 1:
+            print(f"\nSkipping to page {start_page}...")
+            await self._skip_to_page(page, 1, start_page)
+            page_num = start_page
+        total_pages = None
+        consecutive_failures = 0
+        max_consecutive_failures = 3
+
+        while True:
+            if max_pages and page_num > max_pages:
+                break
+
+            if consecutive_failures >= max_consecutive_failures:
+                print(f"\nStopping after {max_consecutive_failures} consecutive failed pages")
+                self._listing_stalled = True
+                break
+
+            if total_pages and page_num > total_pages:
+                print(f"\nReached last page ({total_pages})")
+                break
+
+            print(f"\nScraping page {page_num}...")
+
+            try:
+                # Get the HTML after JavaScript has rendered
+                with self.metrics.timer("content"):
+                    html_content = await page.content()
+                page_bills, total_results, items_per_page = await self._parse(
+                    parse_listing_page, html_content, self.base_url, self.parser
+                )
 
-                            page_num += 1
+                # Detect total pages from pagination info on first page
+                if not total_pages and total_results is not None and items_per_page:
+                    total_pages = (total_results + items_per_page - 1) // items_per_page
+                    print(f"  Detected: {total_results} total bills across {total_pages} pages")
 
-                        except Exception as e:
+                if not page_bills:
+                    consecutive_failures += 1
+                    print(
+                        f"  No rows found (attempt {consecutive_failures}/{max_consecutive_failures})"
+                    )
+                    await asyncio.sleep(2)
+                    # Try clicking next page anyway
+                    if total_pages and page_num < total_pages:
+                        try:
+                            await page.click(f'a:text("{page_num + 1}")', timeout=5000)
+                            await asyncio.sleep(2)
+                        except Exception:
+                            pass
+                    page_num += 1
+                    continue
+
+                consecutive_failures = 0  # Reset on success
+
+                if items_per_page and skip_bills >= items_per_page:
+                    listed_pages = skip_bills // items_per_page
+                    if total_pages:
+                        listed_pages = min(listed_pages, total_pages - page_num)
+                    if listed_pages:
+                        print(f"  Skipping {listed_pages} pages listed already")
+                        await self._skip_to_page(page, page_num, page_num + listed_pages)
+                        skip_bills -= listed_pages * items_per_page
+                        page_num += listed_pages
+                        continue
+
+                already_listed = min(skip_bills, len(page_bills))
+                skip_bills -= already_listed
+                page_bills = page_bills[already_listed:]
+
+                for bill_data in page_bills:
+                    print(f"  Found {bill_data['doc_number']}...")
+
+                if page_bills:
+                    yield page_num, page_bills
+
+                # Click next page if not at last page
+                if total_pages is None or page_num < total_pages:
+                    next_page_num = page_num + 1
+                    try:
+                        with self.metrics.timer("page_turn"):
+                            await self._click_next_page(page, page_num, next_page_num)
+                    except Exception as e:
+                        print(f"  Could not click page {next_page_num}: {e}")
+                        if total_pages and page_num < total_pages:
+                            # If we can't click but there are more pages, increment failure counter
                             consecutive_failures += 1
-                            print(f"  Error on page {page_num}: {e}")
-                            await asyncio.sleep(5)
+                        else:
+                            # Otherwise we've reached the end
+                            break
+                else:
+                    break
 
-                finally:
-                    # Close all pages in the pool
-                    for detail_page in detail_pages:
-                        await detail_page.close()
-                    await page.close()
-                    await context.close()
-                    await browser.close()
+                page_num += 1
 
-        return all_legislation
+            except Exception as e:
+                consecutive_failures += 1
+                print(f"  Error on page {page_num}: {e}")
+                await asyncio.sleep(5)
+
+    async def _skip_to_page(self, page, page_num: int, target_page: int) -> None:
+        """Navigate from listing page ``page_num`` to ``target_page``.
+
+        The listing has no page URL to jump to, so each step clicks the farthest
+        visible page link that does not pass the target. Resuming deep into the listing
+        therefore takes about ``target_page`` / (links shown) page loads rather than one
+        per earlier page, or one per page if the pagination only offers "Next".
+
+        Args:
+            page: Playwright page showing listing page ``page_num``.
+            page_num: Current page number.
+            target_page: Page number to navigate to.
+
+        Raises:
+            Exception: If no pagination control could be clicked.
+        """
+        while page_num < target_page:
+            visible = await page.evaluate(PAGE_LINKS_JS)
+            next_page_num = max(
+                (n for n in visible if page_num < n <= target_page), default=page_num + 1
+            )
+            await self._click_next_page(page, page_num, next_page_num)
+            page_num = next_page_num
+
+    async def _click_next_page(self, page, page_num: int, next_page_num: int) -> None:
+        """Click through to the next listing page and wait for it to render.
 
+        Args:
+            page: Playwright page showing listing page ``page_num``.
+            page_num: Current page number.
+            next_page_num: Page number to navigate to.
+
+        Raises:
+            Exception: If no pagination control could be clicked.
+        """
+        print(f"  Navigating to page {next_page_num}...")
+        # Remember the first row's doc number to detect when new content renders
+        old_first_doc = await page.evaluate(FIRST_ROW_DOC_JS)
+
+        # First, scroll to bottom to ensure pagination is visible
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+        # Strategy 1: Try clicking the visible page number link first
+        clicked = False
+        try:
+            await page.click(
+                f'a:text-is("{next_page_num}")',
+                timeout=5000,
+                force=True,
+            )
+            clicked = True
+            print(f"    Clicked page {next_page_num} link directly")
+        except Exception:
+            pass
+
+        # Strategy 2: If page number not visible, try "Next" button or navigation arrow
+        if not clicked:
+            try:
+                # Try common "Next" button selectors
+                next_selectors = [
+                    'a:has-text("Next")',
+                    'a:has-text("›")',
+                    'a:has-text("»")',
+                    'button:has-text("Next")',
+                    'a[aria-label*="Next"]',
+                    'button[aria-label*="Next"]',
+                    ".pagination a.next",
+                    ".pagination-next",
+                    'a[rel="next"]',
+                ]
+
+                for selector in next_selectors:
+                    try:
+                        await page.click(selector, timeout=2000)
+                        clicked = True
+                        print(f"    Clicked next page using selector: {selector}")
+                        break
+                    except Exception:
+                        continue
+            except Exception as e:
+                print(f"    Next button strategies failed: {e}")
 
-# Usage
+        # Strategy 3: If still not clicked, check if page number is in visible pagination
+        if not clicked:
+            try:
+                # Get all visible page links
+                page_links = await page.locator('a[href*="page"]').all()
+                if not page_links:
+                    page_links = await page.locator(".pagination a").all()
+
+                # Find the highest visible page number and click it if it's < next_page_num
+                highest_visible = 0
+                for link in page_links:
+                    text = await link.inner_text()
+                    if text.strip().isdigit():
+                        num = int(text.strip())
+                        if num > highest_visible:
+                            highest_visible = num
+
+                if highest_visible > page_num:
+                    await page.click(f'a:text-is("{highest_visible}")', timeout=5000)
+                    clicked = True
+                    print(f"    Clicked highest visible page: {highest_visible}")
+            except Exception as e:
+                print(f"    Fallback pagination strategy failed: {e}")
+
+        if not clicked:
+            raise Exception(f"Could not navigate to page {next_page_num}")
+
+        # Wait for the first row to change, checked in the browser on every frame
+        started = time.monotonic()
+        try:
+            await page.wait_for_function(FIRST_ROW_CHANGED_JS, arg=old_first_doc, timeout=15000)
+            print(f"    Page loaded after {time.monotonic() - started:.2f}s")
+        except Exception:
+            print(f"    Warning: Page {next_page_num} did not change within 15s")
+
+
+# Usage: python -m backend.scraper [max_pages] [--workers N] (see --help)
 if __name__ == "__main__":
-    import os
+    import argparse
+    import atexit
+
+    from backend.archive import scrape_archive
+    from backend.sessions import select_sessions
+    from backend.sharding import merge_outputs, run_local_shards, shard_path
+
+    arg_parser = argparse.ArgumentParser(description="Scrape Georgia legislation")
+    arg_parser.add_argument(
+        "max_pages", nargs="?", type=int, help="Maximum listing pages (useful for testing)"
+    )
+    arg_parser.add_argument("--output", default="ga_legislation.json", help="Output JSON file")
+    arg_parser.add_argument(
+        "--resume", action="store_true", help="Continue an interrupted run from its checkpoint"
+    )
+    arg_parser.add_argument(
+        "--manifest", default="scrape_manifest.json", help="Work manifest for sharded runs"
+    )
+    arg_parser.add_argument(
+        "--list-only", action="store_true", help="Only write the work manifest of bill stubs"
+    )
+    arg_parser.add_argument(
+        "--shard-index", type=int, help="Fetch details for this 0-based shard of the manifest"
+    )
+    arg_parser.add_argument("--num-shards", type=int, help="Total number of shards")
+    arg_parser.add_argument(
+        "--workers", type=int, help="List, then scrape N shards in parallel local processes"
+    )
+    arg_parser.add_argument(
+        "--merge", nargs="+", metavar="FILE", help="Merge partial shard outputs into --output"
+    )
+    arg_parser.add_argument(
+        "--sessions",
+        metavar="SPEC",
+        help='Scrape past sessions into --archive-dir: "all", ids or years such as '
+        '"2023,2021", or "list" to print the available sessions',
+    )
+    arg_parser.add_argument("--archive-dir", default="archive", help="Root of the session archive")
+    arg_parser.add_argument(
+        "--parallel-sessions", type=int, default=2, help="Sessions scraped at the same time"
+    )
+    arg_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="auto",
+        default=os.getenv("SCRAPER_PROFILE") or None,
+        metavar="MODE",
+        help="Profile the run: auto, cprofile, yappi or sample (see backend/profiling.py)",
+    )
+    arg_parser.add_argument(
+        "--profile-dir",
+        default=os.getenv("SCRAPER_PROFILE_DIR", "profiles"),
+        help="Directory for profiling output",
+    )
+    arg_parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        default=os.getenv("SCRAPER_PROFILE_MEMORY", "").lower() in ("1", "true", "yes"),
+        help="Also take tracemalloc snapshots after each stage",
+    )
+    args = arg_parser.parse_args()
+
+    if args.merge:
+        merged = merge_outputs(args.merge, args.output)
+        print(f"Merged {merged} unique bills from {len(args.merge)} files into {args.output}")
+        sys.exit(0)
+
+    sharded = args.shard_index is not None
+    if sharded and not args.num_shards:
+        arg_parser.error("--shard-index requires --num-shards")
 
     # Read environment variables for CI/CD configuration
     max_concurrent = int(os.getenv("SCRAPER_CONCURRENCY", "5"))
     request_delay = float(os.getenv("SCRAPER_DELAY", "0.3"))
     page_pool_size = int(os.getenv("SCRAPER_PAGE_POOL", "5"))
+    detail_mode = os.getenv("SCRAPER_DETAIL_MODE", "auto")
+    listing_mode = os.getenv("SCRAPER_LISTING_MODE", "auto")
+    listing_page_size = int(os.getenv("SCRAPER_LISTING_PAGE_SIZE", "100"))
+    page_max_uses = int(os.getenv("SCRAPER_PAGE_MAX_USES", "50"))
+    max_rate = float(os.getenv("SCRAPER_MAX_RATE", "10"))
+    incremental = os.getenv("SCRAPER_INCREMENTAL", "").lower() in ("1", "true", "yes")
+    cache_ttl_hours = float(os.getenv("SCRAPER_CACHE_TTL_HOURS", "24"))
+    http_cache_dir = os.getenv("SCRAPER_HTTP_CACHE_DIR", "http_cache") or None
+    checkpoint_file = os.getenv("SCRAPER_CHECKPOINT_FILE", "scrape_checkpoint.json") or None
+    metrics_file = os.getenv("SCRAPER_METRICS_FILE", "scrape_metrics.json") or None
+    base_url = os.getenv("SCRAPER_BASE_URL", "https://www.legis.ga.gov")
+    deltas_dir = os.getenv("SCRAPER_DELTAS_DIR") or None
+    store_file = os.getenv("SCRAPER_STORE_FILE") or None
+    cache_file = "bill_details_cache.jsonl"
+    if sharded:
+        # Shards are stable per doc number, so per-shard caches stay warm between runs
+        cache_file = str(shard_path(cache_file, args.shard_index, args.num_shards))
+        if http_cache_dir:
+            http_cache_dir = str(shard_path(http_cache_dir, args.shard_index, args.num_shards))
+        if metrics_file:
+            metrics_file = str(shard_path(metrics_file, args.shard_index, args.num_shards))
+    parser = os.getenv("SCRAPER_PARSER", "auto")
+    parse_workers_env = os.getenv("SCRAPER_PARSE_WORKERS")
+    parse_workers = int(parse_workers_env) if parse_workers_env else None
+    block_resources_env = os.getenv("SCRAPER_BLOCK_RESOURCES")
+    blocked_resource_types = (
+        BLOCKED_RESOURCE_TYPES
+        if block_resources_env is None
+        else tuple(item.strip() for item in block_resources_env.split(",") if item.strip())
+    )
+    block_domains_env = os.getenv("SCRAPER_BLOCK_DOMAINS")
+    blocked_domains = (
+        BLOCKED_DOMAINS
+        if block_domains_env is None
+        else tuple(item.strip() for item in block_domains_env.split(",") if item.strip())
+    )
+
+    profiler = None
+    if args.profile:
+        try:
+            profiler = ScrapeProfiler(args.profile_dir, args.profile, memory=args.profile_memory)
+        except ValueError as e:
+            arg_parser.error(str(e))
+        profiler.start()
+        print(f"Profiling with {profiler.mode}, writing to {profiler.run_dir}/")
 
-    # Allow command line argument for max pages (useful for testing)
-    max_pages = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        def write_profile() -> None:
+            if profiler is not None:
+                print(f"\nProfile written to {profiler.stop()}/")
+
+        # Runs after every exit path below, including sys.exit()
+        atexit.register(write_profile)
 
     print(
-        f"Starting scraper with concurrency={max_concurrent}, delay={request_delay}s, page_pool={page_pool_size}"
+        f"Starting scraper with concurrency={max_concurrent}, delay={request_delay}s, page_pool={page_pool_size}, detail_mode={detail_mode}"
     )
+    scraper_kwargs: dict[str, Any] = {
+        "max_concurrent": max_concurrent,
+        "request_delay": request_delay,
+        "page_pool_size": page_pool_size,
+        "detail_mode": detail_mode,
+        "listing_mode": listing_mode,
+        "listing_page_size": listing_page_size,
+        "page_max_uses": page_max_uses,
+        "max_rate": max_rate,
+        "incremental": incremental,
+        "cache_ttl_hours": cache_ttl_hours,
+        "http_cache_dir": http_cache_dir,
+        "parser": parser,
+        "parse_workers": parse_workers,
+        "blocked_resource_types": blocked_resource_types,
+        "blocked_domains": blocked_domains,
+        "metrics_file": metrics_file,
+        "base_url": base_url,
+        "profiler": profiler,
+    }
+    output_file = args.output
+    json_array = os.getenv("SCRAPER_JSON_ARRAY", "1").lower() not in ("0", "false", "no")
+
+    if args.sessions:
+        # Each session gets its own scraper and caches; this one only finds the sessions
+        scraper = GALegislationScraper(
+            **{**scraper_kwargs, "http_cache_dir": None, "metrics_file": None},
+            checkpoint_file=None,
+        )
+        available = scraper.list_sessions()
+        if not available:
+            print("Error: Could not find the list of legislative sessions")
+            sys.exit(1)
+        if args.sessions == "list":
+            for legislative_session in available:
+                print(f"{legislative_session.id}\t{legislative_session.name}")
+            sys.exit(0)
+        try:
+            selected = select_sessions(available, args.sessions)
+        except ValueError as e:
+            arg_parser.error(str(e))
+
+        scraper._preflight()
+        print(
+            f"\nScraping {len(selected)} sessions into {args.archive_dir}/, "
+            f"{args.parallel_sessions} at a time"
+        )
+        saved_by_session = scrape_archive(
+            selected,
+            args.archive_dir,
+            parallel_sessions=args.parallel_sessions,
+            max_pages=args.max_pages,
+            resume=args.resume,
+            json_array=json_array,
+            scraper_kwargs=scraper_kwargs,
+        )
+        print(f"\n{'=' * 50}")
+        for legislative_session in selected:
+            saved = saved_by_session.get(legislative_session.id)
+            result = "failed" if saved is None else f"{saved} bills"
+            print(f"{legislative_session.name}: {result}")
+        print(f"{'=' * 50}")
+        sys.exit(0 if len(saved_by_session) == len(selected) else 1)
+
     scraper = GALegislationScraper(
-        max_concurrent=max_concurrent,
-        request_delay=request_delay,
-        page_pool_size=page_pool_size,
+        **scraper_kwargs,
+        cache_file=cache_file,
+        checkpoint_file=checkpoint_file,
+        deltas_dir=deltas_dir,
+        store_file=store_file,
     )
-    data = scraper.scrape_and_save("ga_legislation.json", max_pages=max_pages)
+    # Bills are streamed to disk, not kept; only a listing keeps its stubs
+    data: list[dict] = []
+    if sharded:
+        output_file = str(shard_path(args.output, args.shard_index, args.num_shards))
+        scraper.scrape_shard(
+            args.manifest, args.shard_index, args.num_shards, output_file, collect=False
+        )
+        total = scraper.stats["saved"]
+    elif args.list_only or args.workers:
+        data = scraper.build_manifest(args.manifest, max_pages=args.max_pages, resume=args.resume)
+        total = len(data)
+        if args.workers:
+            outputs = run_local_shards(args.manifest, args.workers, args.output)
+            total = merge_outputs(outputs, args.output)
+            data = []
+            if len(outputs) < args.workers:
+                print(f"Warning: Only {len(outputs)} of {args.workers} shards finished")
+    else:
+        scraper.scrape_and_save(
+            output_file,
+            max_pages=args.max_pages,
+            resume=args.resume,
+            collect=False,
+            json_array=json_array,
+        )
+        total = scraper.stats["saved"]
 
     # Print summary
     print(f"\n{'=' * 50}")
-    print(f"Total bills scraped: {len(data)}")
-    print("Output file: ga_legislation.json")
+    print(f"Total bills {'listed' if args.list_only else 'scraped'}: {total}")
+    print(f"Output file: {args.manifest if args.list_only else output_file}")
     print(f"{'=' * 50}")
 
     # Print a sample of the first item
+    jsonl_file = Path(output_file).with_suffix(".jsonl")
+    if not data and total and jsonl_file.exists():
+        with open(jsonl_file, encoding="utf-8") as f:
+            data = [json.loads(f.readline())]
     if data:
         print("\nSample of first item:")
         print(json.dumps(data[0], indent=2))
@@ -0,0 +1,143 @@
+"""Legislative sessions, for scraping past sessions into a multi-year archive.
+
+The listing SPA loads the available sessions as JSON alongside the first page of
+results. Sessions are recognized among those responses by records that carry an id
+and a name such as "2023-2024 Regular Session". A session is then selected by setting
+its id on the discovered listing endpoint. Without an endpoint it is requested as the
+``session`` query parameter of the listing URL, which is a guess: the scraper checks
+that the page's session picker shows it and fails the listing otherwise.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from backend.listing_api import (
+    ID_KEYS,
+    NAME_KEYS,
+    RECORD_KEYS,
+    ListingEndpoint,
+    first_key,
+)
+
+SESSION_KEYS = ("sessionId", "session", "sessionID", "legislativeSessionId", "sessionKey")
+SESSION_LIST_KEYS = ("sessions", *RECORD_KEYS)
+SESSION_NAME_PATTERN = re.compile(r"\b((?:19|20)\d{2})\b.*\bsession\b", re.IGNORECASE)
+
+# Query parameter naming the session in browser-paged listings (not confirmed by the
+# site; see GALegislationScraper._open_listing)
+SESSION_URL_PARAM = "session"
+
+
+@dataclass(frozen=True)
+class LegislativeSession:
+    """One legislative session as listed by the site."""
+
+    id: str
+    name: str
+    year: int
+
+    @property
+    def slug(self) -> str:
+        """Filesystem-safe name, e.g. "2023-2024-regular-session"."""
+        slug = re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+        return slug or f"session-{self.id}"
+
+
+def extract_sessions(payload: Any) -> list[LegislativeSession]:
+    """Return the sessions listed in a JSON response, or an empty list.
+
+    Args:
+        payload: Decoded JSON response.
+
+    Returns:
+        List of LegislativeSession, newest first.
+    """
+    records = payload
+    if isinstance(payload, dict):
+        key = first_key(payload, SESSION_LIST_KEYS)
+        records = payload[key] if key is not None else []
+    if not isinstance(records, list):
+        return []
+
+    sessions = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        id_key = first_key(record, ID_KEYS)
+        name_key = first_key(record, (*NAME_KEYS, "description"))
+        if id_key is None or name_key is None:
+            continue
+        match = SESSION_NAME_PATTERN.search(str(record[name_key]))
+        if not match:
+            continue
+        sessions.append(
+            LegislativeSession(
+                id=str(record[id_key]),
+                name=str(record[name_key]).strip(),
+                year=int(match.group(1)),
+            )
+        )
+    return sorted(sessions, key=lambda session: (session.year, session.id), reverse=True)
+
+
+def select_sessions(sessions: list[LegislativeSession], selection: str) -> list[LegislativeSession]:
+    """Pick sessions by a comma-separated list of ids or years, or "all".
+
+    Args:
+        sessions (list): Sessions discovered on the site, newest first.
+        selection (str): "all", or ids/years such as "1031,2021". A year selects every
+            session that starts in it (regular and special sessions alike).
+
+    Returns:
+        The selected sessions, newest first.
+
+    Raises:
+        ValueError: If an id or year matches no session.
+    """
+    if selection.strip().lower() == "all":
+        return list(sessions)
+
+    selected: list[LegislativeSession] = []
+    for item in (part.strip() for part in selection.split(",")):
+        if not item:
+            continue
+        matches = [s for s in sessions if s.id == item or str(s.year) == item]
+        if not matches:
+            raise ValueError(f"No legislative session matches {item!r}")
+        selected.extend(s for s in matches if s not in selected)
+    return sorted(selected, key=lambda session: (session.year, session.id), reverse=True)
+
+
+def endpoint_for_session(endpoint: ListingEndpoint, session_id: str) -> ListingEndpoint:
+    """Return a copy of the listing endpoint that lists ``session_id``.
+
+    The session parameter the SPA already sends is overwritten; if it sent none,
+    ``sessionId`` is added.
+    """
+    if endpoint.in_body:
+        body = dict(endpoint.body or {})
+        body[first_key(body, SESSION_KEYS) or SESSION_KEYS[0]] = _like(body, session_id)
+        return replace(endpoint, body=body)
+
+    parts = urlsplit(endpoint.url)
+    query = dict(parse_qsl(parts.query))
+    query[first_key(query, SESSION_KEYS) or SESSION_KEYS[0]] = session_id
+    return replace(endpoint, url=urlunsplit(parts._replace(query=urlencode(query))))
+
+
+def _like(body: dict, session_id: str) -> Any:
+    """Keep the JSON type the SPA used for the session id."""
+    key = first_key(body, SESSION_KEYS)
+    if key is not None and isinstance(body[key], int) and session_id.isdigit():
+        return int(session_id)
+    return session_id
+
+
+def listing_url(base_url: str, session_id: str | None = None) -> str:
+    """URL of the legislation listing, optionally for a specific session."""
+    url = f"{base_url}/legislation/all"
+    if session_id is None:
+        return url
+    return f"{url}?{urlencode({SESSION_URL_PARAM: session_id})}"
@@ -0,0 +1,163 @@
+"""Work manifests and deterministic shards for splitting a scrape across workers.
+
+The listing phase writes every bill stub to a manifest. Each worker (a local process
+or a separate CI job) loads the manifest, keeps the bills whose doc number hashes to
+its shard and writes a partial output file; ``merge_outputs`` then combines the
+partial files, deduplicating by ``doc_number``. Because the hash only depends on the
+doc number, a bill always lands on the same shard, so per-shard caches stay warm
+between runs with the same shard count.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+from backend.output import StreamingBillWriter, iter_bills
+
+MANIFEST_VERSION = 1
+
+
+def shard_of(doc_number: str, num_shards: int) -> int:
+    """Return the 0-based shard a bill belongs to.
+
+    Args:
+        doc_number (str): Bill identifier such as "HB123".
+        num_shards (int): Total number of shards.
+
+    Returns:
+        int: Shard index in ``range(num_shards)``.
+    """
+    return zlib.crc32(doc_number.encode("utf-8")) % num_shards
+
+
+def select_shard(bills: list[dict], shard_index: int, num_shards: int) -> list[dict]:
+    """Return the bills assigned to ``shard_index``, in manifest order.
+
+    Raises:
+        ValueError: If the shard index is outside ``range(num_shards)``.
+    """
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(f"shard_index must be in range({num_shards}), got {shard_index!r}")
+    return [bill for bill in bills if shard_of(bill["doc_number"], num_shards) == shard_index]
+
+
+def shard_path(path: str | Path, shard_index: int, num_shards: int) -> Path:
+    """Derive a per-shard file name, e.g. ``ga_legislation.shard-1-of-4.json``."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.shard-{shard_index + 1}-of-{num_shards}{path.suffix}")
+
+
+def write_manifest(bills: list[dict], path: str | Path) -> None:
+    """Atomically write the bill stubs found by the listing phase.
+
+    Args:
+        bills (list): Bill stubs (doc_number, caption, committees, sponsors, detail_url).
+        path: Manifest file to write.
+    """
+    path = Path(path)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created_at": time.time(),
+        "total_bills": len(bills),
+        "bills": bills,
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(path: str | Path) -> list[dict]:
+    """Read the bill stubs from a manifest.
+
+    Raises:
+        ValueError: If the file is not a manifest this version understands.
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path} is not a version {MANIFEST_VERSION} scrape manifest")
+    bills: list[dict] = manifest["bills"]
+    return bills
+
+
+def run_local_shards(
+    manifest_file: str | Path, num_shards: int, output_file: str | Path
+) -> list[Path]:
+    """Scrape every shard of a manifest in parallel worker processes.
+
+    Each worker is a ``python -m backend.scraper`` process with its own browser, rate
+    limiter and per-shard caches; scraper settings are passed on through the
+    environment.
+
+    Args:
+        manifest_file: Manifest written by the listing phase.
+        num_shards (int): Number of worker processes.
+        output_file: Final output path the shard files are named after.
+
+    Returns:
+        List[Path]: Partial outputs of the shards that finished successfully.
+    """
+    workers = []
+    for shard_index in range(num_shards):
+        command = [
+            sys.executable,
+            "-m",
+            "backend.scraper",
+            "--manifest",
+            str(manifest_file),
+            "--shard-index",
+            str(shard_index),
+            "--num-shards",
+            str(num_shards),
+            "--output",
+            str(output_file),
+        ]
+        workers.append((shard_index, subprocess.Popen(command)))
+
+    outputs = []
+    for shard_index, process in workers:
+        if process.wait() == 0:
+            outputs.append(shard_path(output_file, shard_index, num_shards))
+        else:
+            print(f"Warning: Shard {shard_index + 1}/{num_shards} exited with {process.returncode}")
+    return outputs
+
+
+def dedupe_bills(bills: list[dict]) -> list[dict]:
+    """Keep the first record for each doc number, dropping records without one."""
+    seen_doc_numbers = set()
+    unique = []
+    for bill in bills:
+        doc_num = bill.get("doc_number")
+        if doc_num and doc_num not in seen_doc_numbers:
+            seen_doc_numbers.add(doc_num)
+            unique.append(bill)
+    return unique
+
+
+def merge_outputs(paths: Sequence[str | Path], output_file: str | Path) -> int:
+    """Combine partial outputs into one file, keeping the first record per doc number.
+
+    Bills are streamed from the partial files into the output one at a time, so the
+    merge never holds the whole dataset.
+
+    Args:
+        paths (list): Partial output files (JSON arrays or JSON Lines), in priority order.
+        output_file: File to write the merged array to; its JSON Lines sibling is
+            written too.
+
+    Returns:
+        int: Number of merged, deduplicated bills.
+    """
+    output_path = Path(output_file)
+    with StreamingBillWriter(output_path.with_suffix(".jsonl"), output_path) as writer:
+        for path in paths:
+            for bill in iter_bills(path):
+                writer.write(bill)
+    return writer.written
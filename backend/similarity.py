@@ -0,0 +1,291 @@
+"""Precomputed "similar bills" for the frontend.
+
+For every bill this finds the ``top_k`` most similar other bills, so opening a bill is a
+lookup instead of a scan over the whole dataset. Similarity combines:
+
+- TF-IDF cosine over the caption and first reader summary (60%)
+- Jaccard overlap of sponsors (25%) and committees (15%)
+
+Scoring every pair would be quadratic, so only candidate pairs are scored. A pair is a
+candidate if MinHash/LSH puts the two bills' word sets into the same bucket in at least
+one band, or if the two bills share a sponsor. Buckets and sponsors with more than
+``MAX_BUCKET`` bills are not used to find candidates, because a few boilerplate
+phrases and prolific sponsors would otherwise pair up most of the dataset.
+
+The work is done with NumPy arrays. NumPy is optional (``pip install -e ".[artifacts]"``).
+Without it no neighbor file is written, and the frontend scores bills itself.
+
+Usage:
+    python -m backend.similarity [input_json] [doc_number]
+"""
+
+import json
+import re
+import sys
+import zlib
+from collections import defaultdict
+
+# Optional vectorized math
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+SIMILARITY_VERSION = 1
+DEFAULT_TOP_K = 5
+
+TEXT_WEIGHT = 0.6
+SPONSOR_WEIGHT = 0.25
+COMMITTEE_WEIGHT = 0.15
+# Neighbors scoring below this are dropped (score range 0-1)
+MIN_SCORE = 0.1
+
+# 32 bands of 2 rows: pairs with a word-set Jaccard of about 0.2 or more become candidates
+NUM_PERM = 64
+LSH_BANDS = 32
+MAX_BUCKET = 200
+# Signature value of bills without words; no real MinHash reaches it
+_EMPTY = (1 << 64) - 1
+# Bills hashed per batch; bounds the (NUM_PERM x tokens) work array
+_MINHASH_BATCH = 1000
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9]+")
+
+# Search stop words plus the boilerplate every Georgia bill caption repeats
+SIMILARITY_STOP_WORDS = frozenset(
+    "a an and are as at be by for from in into is it its of on or that the this to was "
+    "were with act bill amend provide relating other purposes so annotated article "
+    "chapter code conflicting date effective georgia laws official paragraph part "
+    "provisions repeal section subsection title".split()
+)
+
+
+def text_tokens(bill: dict) -> set[str]:
+    """Return the content words of a bill's caption and first reader summary."""
+    text = f"{bill.get('caption', '')} {bill.get('first_reader_summary', '')}".lower()
+    return {
+        token
+        for token in TOKEN_PATTERN.findall(text)
+        if len(token) > 2 and token not in SIMILARITY_STOP_WORDS
+    }
+
+
+def _name_set(value: object) -> set[str]:
+    names = value if isinstance(value, list) else [value]
+    return {str(name).strip().lower() for name in names if name and str(name).strip()}
+
+
+def minhash_signatures(token_sets: list[set[str]], num_perm: int = NUM_PERM) -> "np.ndarray":
+    """Return one MinHash signature row per token set (all-max for empty sets).
+
+    Tokens are hashed with CRC32 and a fixed seed, so signatures are stable across runs.
+    """
+    rng = np.random.default_rng(1)
+    # Multiply-shift hashing: (a * h + b) mod 2**64 with an odd a, keeping the high 32
+    # bits. uint64 arithmetic wraps, which is the mod; the shift keeps values below _EMPTY
+    a = rng.integers(0, 1 << 64, size=num_perm, dtype=np.uint64)[:, None] | np.uint64(1)
+    b = rng.integers(0, 1 << 64, size=num_perm, dtype=np.uint64)[:, None]
+    signatures = np.full((len(token_sets), num_perm), _EMPTY, dtype=np.uint64)
+
+    for start in range(0, len(token_sets), _MINHASH_BATCH):
+        batch = token_sets[start : start + _MINHASH_BATCH]
+        rows = [start + i for i, tokens in enumerate(batch) if tokens]
+        if not rows:
+            continue
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode()) for row in rows for token in token_sets[row]),
+            dtype=np.uint64,
+        )
+        offsets = np.cumsum([0] + [len(token_sets[row]) for row in rows[:-1]])
+        permuted = (a * hashes[None, :] + b) >> np.uint64(32)
+        signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=1).T
+    return signatures
+
+
+def _group_pairs(groups: list["np.ndarray"], count: int) -> "np.ndarray":
+    """Encode every pair within each group (of 2 to ``MAX_BUCKET`` bills) as ``i * count + j``."""
+    codes = []
+    pair_indices: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    for members in groups:
+        size = len(members)
+        if 1 < size <= MAX_BUCKET:
+            if size not in pair_indices:
+                pair_indices[size] = np.triu_indices(size, k=1)
+            first, second = pair_indices[size]
+            members = np.sort(members)
+            codes.append(members[first] * count + members[second])
+    return np.concatenate(codes) if codes else np.empty(0, dtype=np.int64)
+
+
+def lsh_candidates(signatures: "np.ndarray", bands: int = LSH_BANDS) -> "np.ndarray":
+    """Return the pair codes (see ``_group_pairs``) of bills matching in at least one band."""
+    count = len(signatures)
+    rows_per_band = signatures.shape[1] // bands
+    filled = np.flatnonzero(signatures[:, 0] != np.uint64(_EMPTY))
+    codes = []
+    for band in range(bands):
+        columns = signatures[filled, band * rows_per_band : (band + 1) * rows_per_band]
+        _, bucket_ids = np.unique(columns, axis=0, return_inverse=True)
+        bucket_ids = bucket_ids.reshape(-1)
+        order = np.argsort(bucket_ids, kind="stable")
+        boundaries = np.flatnonzero(np.diff(bucket_ids[order])) + 1
+        codes.append(_group_pairs(np.split(filled[order], boundaries), count))
+    return np.unique(np.concatenate(codes)) if codes else np.empty(0, dtype=np.int64)
+
+
+def set_matrix(sets: list[set[str]]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Encode sets as binary rows in CSR form: (indptr, sorted column indices, weights)."""
+    vocabulary = {item: i for i, item in enumerate(sorted(set().union(*sets)))}
+    indptr = np.zeros(len(sets) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(items) for items in sets])
+    indices = np.fromiter(
+        (vocabulary[item] for items in sets for item in sorted(items)),
+        dtype=np.int64,
+        count=int(indptr[-1]),
+    )
+    return indptr, indices, np.ones(len(indices))
+
+
+def tfidf_matrix(token_sets: list[set[str]]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Build L2-normalized TF-IDF rows in CSR form.
+
+    Token sets are binary, so a token's weight is its smoothed IDF before normalization.
+    """
+    indptr, indices, _ = set_matrix(token_sets)
+    document_frequency = np.bincount(indices)
+    idf = np.log((1 + len(token_sets)) / (1 + document_frequency)) + 1.0
+    weights = idf[indices]
+    row_of_entry = np.repeat(np.arange(len(token_sets)), np.diff(indptr))
+    norms = np.sqrt(np.bincount(row_of_entry, weights=weights**2, minlength=len(token_sets)))
+    weights = weights / np.where(norms > 0, norms, 1.0)[row_of_entry]
+    return indptr, indices, weights
+
+
+def pair_dots(
+    matrix: tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    first: "np.ndarray",
+    second: "np.ndarray",
+) -> "np.ndarray":
+    """Dot product of rows ``first[k]`` and ``second[k]`` for every pair ``k``.
+
+    Every entry of each ``second`` row is looked up in the ``first`` row by binary
+    search over ``row * columns + column`` keys, which are sorted in CSR order.
+    """
+    indptr, indices, weights = matrix
+    if not len(indices):
+        return np.zeros(len(second))
+    columns = int(indices.max()) + 1
+    row_of_entry = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    entry_keys = row_of_entry * columns + indices
+
+    lengths = np.diff(indptr)[second]
+    pair_of_entry = np.repeat(np.arange(len(second)), lengths)
+    starts = np.repeat(indptr[second] - np.cumsum(lengths) + lengths, lengths)
+    entries = starts + np.arange(int(lengths.sum()))
+
+    query_keys = first[pair_of_entry] * columns + indices[entries]
+    found = np.minimum(np.searchsorted(entry_keys, query_keys), len(entry_keys) - 1)
+    matched = entry_keys[found] == query_keys
+    products = np.where(matched, weights[found] * weights[entries], 0.0)
+    return np.bincount(pair_of_entry, weights=products, minlength=len(second))
+
+
+def pair_jaccard(sets: list[set[str]], first: "np.ndarray", second: "np.ndarray") -> "np.ndarray":
+    """Jaccard similarity of ``sets[first[k]]`` and ``sets[second[k]]`` for every pair ``k``."""
+    matrix = set_matrix(sets)
+    shared = pair_dots(matrix, first, second)
+    sizes = np.diff(matrix[0])
+    union = sizes[first] + sizes[second] - shared
+    similarity: np.ndarray = np.divide(shared, union, out=np.zeros(len(first)), where=union > 0)
+    return similarity
+
+
+def build_neighbors(
+    bills: list[dict], top_k: int = DEFAULT_TOP_K
+) -> dict[str, list[tuple[str, int]]]:
+    """Find the most similar bills for every bill.
+
+    Args:
+        bills (list): Scraped legislation records.
+        top_k (int): Neighbors kept per bill. Default 5.
+
+    Returns:
+        Dict: ``doc_number`` -> ``[(doc_number, score), ...]``, best first. Scores are
+        percentages. Bills without neighbors above ``MIN_SCORE`` are left out.
+    """
+    bills = [bill for bill in bills if bill.get("doc_number")]
+    count = len(bills)
+    if count < 2:
+        return {}
+
+    token_sets = [text_tokens(bill) for bill in bills]
+    sponsors = [_name_set(bill.get("sponsors")) for bill in bills]
+    committees = [_name_set(bill.get("committees")) for bill in bills]
+
+    bills_by_sponsor: dict[str, list[int]] = defaultdict(list)
+    for position, names in enumerate(sponsors):
+        for name in names:
+            bills_by_sponsor[name].append(position)
+    sponsor_groups = [np.array(members) for members in bills_by_sponsor.values()]
+    codes = np.union1d(
+        lsh_candidates(minhash_signatures(token_sets)), _group_pairs(sponsor_groups, count)
+    )
+    if not len(codes):
+        return {}
+
+    first, second = codes // count, codes % count
+    scores = (
+        TEXT_WEIGHT * pair_dots(tfidf_matrix(token_sets), first, second)
+        + SPONSOR_WEIGHT * pair_jaccard(sponsors, first, second)
+        + COMMITTEE_WEIGHT * pair_jaccard(committees, first, second)
+    )
+
+    # Every pair counts for both bills; keep each bill's top_k by score
+    keep = scores >= MIN_SCORE
+    source = np.concatenate([first[keep], second[keep]])
+    target = np.concatenate([second[keep], first[keep]])
+    pair_scores = np.concatenate([scores[keep], scores[keep]])
+    order = np.lexsort((target, -pair_scores, source))
+    source, target, pair_scores = source[order], target[order], pair_scores[order]
+    _, group_starts, group_sizes = np.unique(source, return_index=True, return_counts=True)
+    top = np.arange(len(source)) - np.repeat(group_starts, group_sizes) < top_k
+
+    neighbors: dict[str, list[tuple[str, int]]] = defaultdict(list)
+    for i, j, score in zip(
+        source[top].tolist(), target[top].tolist(), pair_scores[top].tolist(), strict=True
+    ):
+        neighbors[bills[i]["doc_number"]].append(
+            (bills[j]["doc_number"], min(100, round(score * 100)))
+        )
+    return dict(neighbors)
+
+
+def build_similarity_index(bills: list[dict], top_k: int = DEFAULT_TOP_K) -> dict:
+    """Return the neighbor file written as ``similar.json``."""
+    return {
+        "version": SIMILARITY_VERSION,
+        "k": top_k,
+        "neighbors": build_neighbors(bills, top_k),
+    }
+
+
+if __name__ == "__main__":
+    input_file = sys.argv[1] if len(sys.argv) > 1 else "ga_legislation.json"
+    if not NUMPY_AVAILABLE:
+        print("Error: NumPy is required to compute bill similarity.")
+        print("Install it with: pip install numpy")
+        sys.exit(1)
+
+    with open(input_file, encoding="utf-8") as f:
+        bills = json.load(f)
+
+    neighbors = build_neighbors(bills)
+    print(f"Neighbors for {len(neighbors)} of {len(bills)} bills")
+    captions = {bill.get("doc_number"): bill.get("caption", "") for bill in bills}
+    shown = sys.argv[2:] or list(neighbors)[:3]
+    for doc_number in shown:
+        print(f"\n{doc_number}: {captions.get(doc_number, '')[:90]}")
+        for other, score in neighbors.get(doc_number, []):
+            print(f"  {score:>3}%  {other}: {captions.get(other, '')[:80]}")
@@ -0,0 +1,409 @@
+"""Indexed SQLite store of the scraped bills with a small query API.
+
+The scraper's JSON output has to be loaded and scanned in full to answer any question
+about it. This writes the same bills into a SQLite database with normalized tables::
+
+    bills            doc_number, caption, summaries, latest status and the full record
+    sponsors         name (as scraped) and normalized "First Last" name
+    bill_sponsors    bill -> sponsor, in listing order
+    committees       name
+    bill_committees  bill -> committee
+    status_events    bill, position, date (ISO), status
+    bills_fts        full-text index over caption and summaries (FTS5)
+
+so lookups by sponsor, committee, status date and text use indexes and only decode the
+matching records. Without FTS5 in the local SQLite build, text search falls back to
+scanning every bill.
+
+Usage:
+    python -m backend.store build [input_json_or_jsonl] [bills.db]
+    python -m backend.store search bills.db "school safety"
+    python -m backend.store sponsor bills.db "Jane Doe"
+    python -m backend.store committee bills.db "Judiciary"
+    python -m backend.store dates bills.db 2025-01-01 2025-01-31 [status]
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from backend.analytics import normalize_sponsor_name
+from backend.output import iter_bills
+
+STORE_VERSION = 1
+COMMANDS = ("build", "search", "sponsor", "committee", "dates")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS bills (
+    id INTEGER PRIMARY KEY,
+    doc_number TEXT NOT NULL UNIQUE,
+    caption TEXT NOT NULL DEFAULT '',
+    first_reader_summary TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    latest_date TEXT,
+    latest_status TEXT,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sponsors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    normalized TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS sponsors_normalized ON sponsors (normalized);
+CREATE TABLE IF NOT EXISTS bill_sponsors (
+    bill_id INTEGER NOT NULL REFERENCES bills (id) ON DELETE CASCADE,
+    sponsor_id INTEGER NOT NULL REFERENCES sponsors (id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (sponsor_id, bill_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS committees (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS bill_committees (
+    bill_id INTEGER NOT NULL REFERENCES bills (id) ON DELETE CASCADE,
+    committee_id INTEGER NOT NULL REFERENCES committees (id),
+    PRIMARY KEY (committee_id, bill_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS status_events (
+    bill_id INTEGER NOT NULL REFERENCES bills (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (bill_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS status_events_date ON status_events (date, status);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bills_fts USING fts5(
+    caption, first_reader_summary, summary,
+    content='bills', content_rowid='id', tokenize='porter unicode61'
+);
+"""
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _fts5_available() -> bool:
+    try:
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        connection.close()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+
+def _as_list(value: object) -> list[str]:
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [str(value).strip()] if value and str(value).strip() else []
+
+
+def _row_id(cursor: sqlite3.Cursor) -> int:
+    """Return the rowid of the row the cursor just inserted."""
+    row_id = cursor.lastrowid
+    assert row_id is not None  # Set by every INSERT
+    return row_id
+
+
+def _fts_query(text: str) -> str | None:
+    """Quote every word of ``text`` so FTS5 operators in user input are taken literally."""
+    tokens = SEARCH_TOKEN_PATTERN.findall(text)
+    if not tokens:
+        return None
+    # The last word also matches as a prefix, like the frontend's search
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class BillStore:
+    """SQLite database of bills, sponsors, committees and status events."""
+
+    def __init__(self, path: str | Path = "ga_legislation.db"):
+        """Open (and create if needed) the store.
+
+        Args:
+            path (str): Database file. Default "ga_legislation.db".
+        """
+        self.path = Path(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self.full_text = FTS5_AVAILABLE
+        if self.full_text:
+            self.connection.executescript(FTS_SCHEMA)
+
+    def __enter__(self) -> "BillStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def replace_all(self, bills: Iterable[dict]) -> int:
+        """Replace the stored bills with ``bills`` in one transaction.
+
+        Args:
+            bills (Iterable): Legislation records; may be a generator streaming a file,
+                so the whole output never has to be in memory.
+
+        Returns:
+            int: Number of bills stored (later duplicates of a doc number win).
+        """
+        with self.connection:
+            for table in ("status_events", "bill_committees", "bill_sponsors", "bills"):
+                self.connection.execute(f"DELETE FROM {table}")
+            self.connection.execute("DELETE FROM sponsors")
+            self.connection.execute("DELETE FROM committees")
+
+            sponsor_ids: dict[str, int] = {}
+            committee_ids: dict[str, int] = {}
+            for bill in bills:
+                if bill.get("doc_number"):
+                    self._insert(bill, sponsor_ids, committee_ids)
+
+            if self.full_text:
+                self.connection.execute("INSERT INTO bills_fts (bills_fts) VALUES ('rebuild')")
+            count = self.count()
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(STORE_VERSION)), ("updated_at", str(time.time()))],
+            )
+        self.connection.execute("PRAGMA optimize")
+        return count
+
+    def _insert(
+        self, bill: dict, sponsor_ids: dict[str, int], committee_ids: dict[str, int]
+    ) -> None:
+        cursor = self.connection.cursor()
+        history = bill.get("status_history") or []
+        latest = max(history, key=lambda entry: entry.get("date") or "") if history else {}
+        cursor.execute(
+            "INSERT OR REPLACE INTO bills (doc_number, caption, first_reader_summary, summary, "
+            "latest_date, latest_status, record) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                bill["doc_number"],
+                bill.get("caption") or "",
+                bill.get("first_reader_summary") or "",
+                bill.get("summary") or "",
+                latest.get("date"),
+                latest.get("status"),
+                json.dumps(bill, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+        bill_id = _row_id(cursor)
+
+        sponsors = []
+        for position, name in enumerate(_as_list(bill.get("sponsors"))):
+            if name not in sponsor_ids:
+                cursor.execute(
+                    "INSERT INTO sponsors (name, normalized) VALUES (?, ?)",
+                    (name, normalize_sponsor_name(name)),
+                )
+                sponsor_ids[name] = _row_id(cursor)
+            sponsors.append((bill_id, sponsor_ids[name], position))
+        cursor.executemany(
+            "INSERT OR IGNORE INTO bill_sponsors (bill_id, sponsor_id, position) VALUES (?, ?, ?)",
+            sponsors,
+        )
+
+        committees = []
+        for name in _as_list(bill.get("committees")):
+            key = name.lower()
+            if key not in committee_ids:
+                cursor.execute("INSERT INTO committees (name) VALUES (?)", (name,))
+                committee_ids[key] = _row_id(cursor)
+            committees.append((bill_id, committee_ids[key]))
+        cursor.executemany(
+            "INSERT OR IGNORE INTO bill_committees (bill_id, committee_id) VALUES (?, ?)",
+            committees,
+        )
+
+        cursor.executemany(
+            "INSERT INTO status_events (bill_id, position, date, status) VALUES (?, ?, ?, ?)",
+            [
+                (bill_id, position, entry.get("date") or "", entry.get("status") or "")
+                for position, entry in enumerate(history)
+            ],
+        )
+
+    def _records(self, query: str, params: Iterable[object]) -> list[dict]:
+        return [json.loads(row["record"]) for row in self.connection.execute(query, tuple(params))]
+
+    def count(self) -> int:
+        """Number of stored bills."""
+        row = self.connection.execute("SELECT COUNT(*) FROM bills").fetchone()
+        assert row is not None  # COUNT(*) always returns a row
+        count: int = row[0]
+        return count
+
+    def get(self, doc_number: str) -> dict | None:
+        """Return the bill with ``doc_number``, or None."""
+        records = self._records("SELECT record FROM bills WHERE doc_number = ?", (doc_number,))
+        return records[0] if records else None
+
+    def by_sponsor(self, name: str) -> list[dict]:
+        """Bills sponsored by ``name``, as scraped ("DOE, JANE") or as "Jane Doe".
+
+        Names are compared case-insensitively after normalization.
+        """
+        return self._records(
+            "SELECT b.record FROM sponsors s "
+            "JOIN bill_sponsors bs ON bs.sponsor_id = s.id "
+            "JOIN bills b ON b.id = bs.bill_id "
+            "WHERE s.normalized = ? GROUP BY b.id ORDER BY b.doc_number",
+            (normalize_sponsor_name(name),),
+        )
+
+    def by_committee(self, name: str) -> list[dict]:
+        """Bills referred to committee ``name`` (case-insensitive)."""
+        return self._records(
+            "SELECT b.record FROM committees c "
+            "JOIN bill_committees bc ON bc.committee_id = c.id "
+            "JOIN bills b ON b.id = bc.bill_id "
+            "WHERE c.name = ? ORDER BY b.doc_number",
+            (name.strip(),),
+        )
+
+    def by_status_date(
+        self, start: str | None = None, end: str | None = None, status: str | None = None
+    ) -> list[dict]:
+        """Bills with a status event dated between ``start`` and ``end`` (inclusive).
+
+        Args:
+            start (str, optional): First date, "YYYY-MM-DD". None = no lower bound.
+            end (str, optional): Last date, "YYYY-MM-DD". None = no upper bound.
+            status (str, optional): Only count events whose status contains this text
+                (case-insensitive), e.g. "signed".
+
+        Returns:
+            List[Dict]: The matching bills, most recent event first.
+        """
+        conditions = []
+        params: list[object] = []
+        if start:
+            conditions.append("e.date >= ?")
+            params.append(start)
+        if end:
+            conditions.append("e.date <= ?")
+            params.append(end)
+        if status:
+            conditions.append("e.status LIKE ?")
+            params.append(f"%{status}%")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._records(
+            "SELECT b.record FROM status_events e JOIN bills b ON b.id = e.bill_id "
+            f"{where} GROUP BY b.id ORDER BY MAX(e.date) DESC, b.doc_number",
+            params,
+        )
+
+    def search(self, text: str, limit: int = 50) -> list[dict]:
+        """Full-text search of captions and summaries, best matches first.
+
+        Args:
+            text (str): Words to find; every word must match, the last also as a prefix.
+            limit (int): Maximum number of bills. Default 50.
+
+        Returns:
+            List[Dict]: The matching bills.
+        """
+        query = _fts_query(text)
+        if query is None:
+            return []
+        if self.full_text:
+            return self._records(
+                "SELECT b.record FROM bills_fts JOIN bills b ON b.id = bills_fts.rowid "
+                "WHERE bills_fts MATCH ? ORDER BY bm25(bills_fts, 5.0, 1.0, 1.0) LIMIT ?",
+                (query, limit),
+            )
+
+        tokens = [token.lower() for token in SEARCH_TOKEN_PATTERN.findall(text)]
+        conditions = ["instr(lower(caption || ' ' || first_reader_summary || ' ' || summary), ?)"]
+        return self._records(
+            f"SELECT record FROM bills WHERE {' AND '.join(conditions * len(tokens))} "
+            "ORDER BY doc_number LIMIT ?",
+            [*tokens, limit],
+        )
+
+    def sponsors(self) -> list[tuple[str, int]]:
+        """Normalized sponsor names with their bill counts, most bills first."""
+        rows = self.connection.execute(
+            "SELECT s.normalized, COUNT(DISTINCT bs.bill_id) AS bills FROM sponsors s "
+            "JOIN bill_sponsors bs ON bs.sponsor_id = s.id "
+            "GROUP BY s.normalized ORDER BY bills DESC, s.normalized"
+        )
+        return [(row[0], row[1]) for row in rows]
+
+    def committees(self) -> list[tuple[str, int]]:
+        """Committee names with their bill counts, most bills first."""
+        rows = self.connection.execute(
+            "SELECT c.name, COUNT(*) AS bills FROM committees c "
+            "JOIN bill_committees bc ON bc.committee_id = c.id "
+            "GROUP BY c.id ORDER BY bills DESC, c.name"
+        )
+        return [(row[0], row[1]) for row in rows]
+
+
+def build_store(input_file: str | Path, store_file: str | Path) -> int:
+    """Write the bills of a JSON or JSON Lines output file into ``store_file``.
+
+    Returns:
+        int: Number of bills stored.
+    """
+    if not FTS5_AVAILABLE:
+        print("Warning: SQLite was built without FTS5; text search will scan every bill")
+    with BillStore(store_file) as store:
+        return store.replace_all(iter_bills(input_file))
+
+
+def _print_bills(bills: list[dict], started: float) -> None:
+    for bill in bills:
+        history = bill.get("status_history") or []
+        latest = history[-1] if history else {}
+        print(
+            f"{bill['doc_number']:>8}  {latest.get('date', ''):10}  {bill.get('caption', '')[:80]}"
+        )
+    print(f"{len(bills)} bills in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    if command not in COMMANDS or (command != "build" and len(sys.argv) < 4):
+        print(__doc__.split("Usage:")[1].rstrip())
+        sys.exit(1)
+
+    if command == "build":
+        input_file = sys.argv[2] if len(sys.argv) > 2 else "ga_legislation.json"
+        store_file = sys.argv[3] if len(sys.argv) > 3 else "ga_legislation.db"
+        started = time.perf_counter()
+        count = build_store(input_file, store_file)
+        print(f"Stored {count} bills in {store_file} ({time.perf_counter() - started:.1f}s)")
+        sys.exit(0)
+
+    with BillStore(sys.argv[2]) as store:
+        started = time.perf_counter()
+        if command == "search":
+            results = store.search(sys.argv[3])
+        elif command == "sponsor":
+            results = store.by_sponsor(sys.argv[3])
+        elif command == "committee":
+            results = store.by_committee(sys.argv[3])
+        else:
+            end = sys.argv[4] if len(sys.argv) > 4 else None
+            status = sys.argv[5] if len(sys.argv) > 5 else None
+            results = store.by_status_date(sys.argv[3], end, status)
+        _print_bills(results, started)
@@ -3,6 +3,18 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { Moon, Sun, Upload, HelpCircle } from 'lucide-react'
 import type { Bill, FilterState } from './types'
 import { getBillIssue, getLatestStatus, getSponsorNames } from './utils'
+import {
+  loadAnalytics,
+  loadBillDetail,
+  loadBillIndex,
+  loadFullDataset,
+  loadSearchIndex,
+  loadSimilarityIndex,
+  searchBillPositions,
+  type Analytics,
+  type SearchIndex,
+  type SimilarityIndex,
+} from './dataLoader'
 import { translations, type Language } from './i18n/translations'
 import Header from './components/Header.tsx'
 import Stats from './components/Stats.tsx'
@@ -48,6 +60,13 @@ function App() {
   })
   const [bills, setBills] = useState<Bill[]>([])
   const [loading, setLoading] = useState(false)
+  // False while only the lightweight index is loaded (no summaries or full history)
+  const [fullDataLoaded, setFullDataLoaded] = useState(false)
+  const [searchIndex, setSearchIndex] = useState<SearchIndex | null>(null)
+  // Precomputed similar bills; without it the bill modal scores bills itself
+  const [similarityIndex, setSimilarityIndex] = useState<SimilarityIndex | null>(null)
+  // Precomputed dashboard aggregates for the whole deployed dataset
+  const [analytics, setAnalytics] = useState<Analytics | null>(null)
   const [currentPage, setCurrentPage] = useState(() => {
     const page = urlParams.get('page')
     return page ? Number.parseInt(page, 10) : 1
@@ -147,13 +166,20 @@ function App() {
     if (isProduction) {
       setLoading(true)
       const basePath = import.meta.env.BASE_URL || '/'
-      fetch(`${basePath}ga_legislation.json`)
-        .then((res) => {
-          if (!res.ok) throw new Error('Failed to load data')
-          return res.json()
+      // Paint from the small index first, then swap in the full dataset
+      loadBillIndex(basePath)
+        .then((index) => {
+          if (index) {
+            setBills(index)
+            setLoading(false)
+          }
+          loadSimilarityIndex(basePath).then(setSimilarityIndex)
+          loadAnalytics(basePath).then(setAnalytics)
+          return loadFullDataset(basePath)
         })
         .then((data) => {
           setBills(data)
+          setFullDataLoaded(true)
           setLoading(false)
         })
         .catch((error) => {
@@ -164,6 +190,26 @@ function App() {
     }
   }, [])
 
+  // Summary search before the full dataset arrives uses the prebuilt search index
+  useEffect(() => {
+    if (filters.summarySearch && !fullDataLoaded && !searchIndex && import.meta.env.PROD) {
+      loadSearchIndex(import.meta.env.BASE_URL || '/')
+        .then(setSearchIndex)
+        .catch((error) => console.error('Error loading search index:', error))
+    }
+  }, [filters.summarySearch, fullDataLoaded, searchIndex])
+
+  // Bills from the index lack their summary and full history; load them on open
+  useEffect(() => {
+    if (!selectedBill || fullDataLoaded || selectedBill.first_reader_summary !== undefined) return
+    const docNumber = selectedBill.doc_number
+    loadBillDetail(import.meta.env.BASE_URL || '/', docNumber).then((detail) => {
+      if (detail) {
+        setSelectedBill((current) => (current?.doc_number === docNumber ? detail : current))
+      }
+    })
+  }, [selectedBill, fullDataLoaded])
+
   // Sync state to URL for shareable links
   useEffect(() => {
     const params = new URLSearchParams()
@@ -233,6 +279,9 @@ function App() {
       try {
         const data = JSON.parse(e.target?.result as string)
         setBills(data)
+        setFullDataLoaded(true)
+        setSimilarityIndex(null)
+        setAnalytics(null)
         setCurrentPage(1)
       } catch (error) {
         console.error('Error parsing JSON:', error)
@@ -298,7 +347,14 @@ function App() {
     }
 
     // Summary search
-    if (filters.summarySearch) {
+    if (filters.summarySearch && !fullDataLoaded) {
+      // Only the index is loaded; positions in the search index refer to it
+      const positions = searchIndex ? searchBillPositions(searchIndex, filters.summarySearch) : null
+      if (positions) {
+        const matching = new Set([...positions].map((position) => bills[position]?.doc_number))
+        result = result.filter((bill) => matching.has(bill.doc_number))
+      }
+    } else if (filters.summarySearch) {
       const summaryLower = filters.summarySearch.toLowerCase()
       result = result.filter((bill) => {
         const summary = bill.first_reader_summary || bill.summary || ''
@@ -355,7 +411,7 @@ function App() {
 
 
     return result
-  }, [bills, filters])
+  }, [bills, filters, fullDataLoaded, searchIndex])
 
   const paginatedBills = useMemo(() => {
     const start = (currentPage - 1) * ITEMS_PER_PAGE
@@ -554,10 +610,14 @@ function App() {
               t={t}
             />
 
-            {/* Analytics Tabs */}
+            {/* Analytics Tabs; the precomputed aggregates cover every bill, so they are only
+                used while no filter narrows the list */}
             {!loading && bills.length > 0 && (
               <AnalyticsTabs 
                 bills={filteredBills}
+                analytics={
+                  analytics && filteredBills.length === analytics.count ? analytics : undefined
+                }
                 darkMode={darkMode}
                 t={t}
                 onFilterByWord={(word) => {
@@ -610,6 +670,9 @@ function App() {
               key="bill-modal"
               bill={selectedBill}
               allBills={bills}
+              similarBills={
+                similarityIndex ? similarityIndex.neighbors[selectedBill.doc_number] || [] : undefined
+              }
               onClose={() => setSelectedBill(null)}
               isFavorited={favorites.includes(selectedBill.doc_number)}
               onToggleFavorite={() => toggleFavorite(selectedBill.doc_number)}
@@ -682,6 +745,7 @@ function App() {
         <RepresentativeProfile
           sponsorName={selectedRepresentative || ''}
           allBills={bills}
+          sponsorAnalytics={analytics?.sponsors}
           isOpen={selectedRepresentative !== null}
           onClose={() => setSelectedRepresentative(null)}
           onSelectBill={(bill) => {
@@ -0,0 +1,197 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import {
+  applyDelta,
+  shardKey,
+  tokenize,
+  searchBillPositions,
+  loadAnalytics,
+  loadBillIndex,
+  loadBillDetail,
+  loadFullDataset,
+  loadSimilarityIndex,
+  type BillDelta,
+  type SearchIndex,
+} from '../dataLoader'
+
+function mockFetch(responses: Record<string, unknown>) {
+  const fetchMock = vi.fn(async (url: string) => {
+    if (url in responses) {
+      return { ok: true, json: async () => responses[url] } as Response
+    }
+    return { ok: false, json: async () => ({}) } as Response
+  })
+  vi.stubGlobal('fetch', fetchMock)
+  return fetchMock
+}
+
+afterEach(() => {
+  vi.unstubAllGlobals()
+})
+
+describe('shardKey', () => {
+  it('should group bills by chamber and hundred', () => {
+    expect(shardKey('HB 1234')).toBe('HB-12')
+    expect(shardKey('SB5')).toBe('SB-0')
+    expect(shardKey('hr 199')).toBe('HR-1')
+  })
+
+  it('should fall back for unexpected doc numbers', () => {
+    expect(shardKey('Resolution')).toBe('other')
+  })
+})
+
+describe('tokenize', () => {
+  it('should drop stop words, duplicates and single characters', () => {
+    expect(tokenize('A bill relating to the Sales Tax, tax, and X')).toEqual(['sales', 'tax'])
+  })
+})
+
+describe('searchBillPositions', () => {
+  const index: SearchIndex = {
+    version: 1,
+    tokens: { tax: [0, 2], sales: [0], property: [1, 2], hb1: [0] },
+  }
+
+  it('should intersect the postings of every query token', () => {
+    expect(searchBillPositions(index, 'sales tax')).toEqual(new Set([0]))
+  })
+
+  it('should match the last token as a prefix', () => {
+    expect(searchBillPositions(index, 'prop')).toEqual(new Set([1, 2]))
+  })
+
+  it('should return null when nothing is searchable', () => {
+    expect(searchBillPositions(index, 'the')).toBeNull()
+  })
+})
+
+describe('loaders', () => {
+  const bill = {
+    doc_number: 'HB 1',
+    caption: 'Test Bill',
+    sponsors: [],
+    committees: [],
+    status_history: [],
+    first_reader_summary: 'Summary',
+  }
+
+  it('should return null when no index is deployed', async () => {
+    mockFetch({})
+    expect(await loadBillIndex('/')).toBeNull()
+  })
+
+  it('should load the index bills', async () => {
+    mockFetch({ '/data/index.json': { version: 1, generated_at: 0, count: 1, bills: [bill] } })
+    expect(await loadBillIndex('/')).toEqual([bill])
+  })
+
+  it('should fall back to the pretty-printed dataset', async () => {
+    mockFetch({ '/ga_legislation.json': [bill] })
+    expect(await loadFullDataset('/')).toEqual([bill])
+  })
+
+  it('should fetch each detail shard once', async () => {
+    const fetchMock = mockFetch({ '/data/bills/HB-0.json': { 'HB 1': bill } })
+    expect(await loadBillDetail('/', 'HB 1')).toEqual(bill)
+    expect(await loadBillDetail('/', 'HB 2')).toBeNull()
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+  })
+
+  it('should load the analytics if deployed', async () => {
+    mockFetch({ '/data/analytics.json': { version: 1, count: 1, words: [['school', 3]] } })
+    expect((await loadAnalytics('/'))?.words).toEqual([['school', 3]])
+
+    mockFetch({})
+    expect(await loadAnalytics('/')).toBeNull()
+  })
+
+  it('should load the similarity index if deployed', async () => {
+    const similar = { version: 1, k: 5, neighbors: { 'HB 1': [['HB 2', 42]] } }
+    mockFetch({ '/data/similar.json': similar })
+    expect(await loadSimilarityIndex('/')).toEqual(similar)
+
+    mockFetch({})
+    expect(await loadSimilarityIndex('/')).toBeNull()
+  })
+})
+
+describe('applyDelta', () => {
+  const history = [
+    { date: '2025-01-10', status: 'Introduced' },
+    { date: '2025-01-12', status: 'Committee' },
+  ]
+  const bills = [
+    { doc_number: 'HB 1', caption: 'Old', sponsors: [], committees: [], status_history: history },
+    { doc_number: 'HB 2', caption: 'Gone', sponsors: [], committees: [], status_history: [] },
+    {
+      doc_number: 'HB 3',
+      caption: 'Same',
+      sponsors: [],
+      committees: [],
+      status_history: [],
+      summary: 'Dropped',
+    },
+  ]
+
+  it('should add, remove and change bills', () => {
+    const added = { ...bills[1], doc_number: 'HB 4', caption: 'New' }
+    const delta: BillDelta = {
+      version: 2,
+      from: 1,
+      added: [added],
+      removed: ['HB 2'],
+      changed: {
+        'HB 1': {
+          caption: 'Updated',
+          status_history: {
+            start: 2,
+            delete: 0,
+            insert: [{ date: '2025-02-01', status: 'Passed' }],
+          },
+        },
+        'HB 3': { summary: null },
+      },
+    }
+
+    const result = applyDelta(bills, delta)
+
+    expect(result.map((bill) => bill.doc_number)).toEqual(['HB 1', 'HB 3', 'HB 4'])
+    expect(result[0].caption).toBe('Updated')
+    expect(result[0].status_history.map((entry) => entry.status)).toEqual([
+      'Introduced',
+      'Committee',
+      'Passed',
+    ])
+    expect(result[1]).not.toHaveProperty('summary')
+    // The input is left untouched
+    expect(bills[0].status_history).toHaveLength(2)
+    expect(bills[2].summary).toBe('Dropped')
+  })
+
+  it('should replace the middle of a history', () => {
+    const delta: BillDelta = {
+      version: 2,
+      from: 1,
+      added: [],
+      removed: [],
+      changed: {
+        'HB 1': {
+          status_history: { start: 1, delete: 1, insert: [{ date: 'x', status: 'Fixed' }] },
+        },
+      },
+    }
+    expect(applyDelta(bills, delta)[0].status_history).toEqual([
+      history[0],
+      { date: 'x', status: 'Fixed' },
+    ])
+  })
+
+  it('should download the full dataset without a cached copy', async () => {
+    const fetchMock = mockFetch({
+      '/data/deltas/manifest.json': { format: 1, version: 3, count: 1, deltas: [] },
+      '/data/ga_legislation.min.json': [bills[0]],
+    })
+    expect(await loadFullDataset('/')).toEqual([bills[0]])
+    expect(fetchMock).not.toHaveBeenCalledWith('/data/deltas/000003.json')
+  })
+})
@@ -2,6 +2,7 @@ import { motion } from 'framer-motion'
 import { BarChart3, TrendingUp, Cloud, Grid3X3 } from 'lucide-react'
 import { useState } from 'react'
 import type { Bill } from '../types'
+import type { Analytics } from '../dataLoader'
 import type { Translation } from '../i18n/translations'
 import { TimelineVisualization } from './TimelineVisualization.tsx'
 import { ChartsView } from './ChartsView.tsx'
@@ -9,6 +10,8 @@ import { WordCloudView } from './WordCloudView.tsx'
 
 interface AnalyticsTabsProps {
   bills: Bill[]
+  // Precomputed aggregates matching `bills`; charts compute their own when absent
+  analytics?: Analytics
   darkMode: boolean
   t: Translation
   onFilterByWord?: (word: string) => void
@@ -16,7 +19,13 @@ interface AnalyticsTabsProps {
 
 type TabType = 'overview' | 'timeline' | 'charts' | 'wordcloud'
 
-export default function AnalyticsTabs({ bills, darkMode, t, onFilterByWord }: AnalyticsTabsProps) {
+export default function AnalyticsTabs({
+  bills,
+  analytics,
+  darkMode,
+  t,
+  onFilterByWord,
+}: AnalyticsTabsProps) {
   const [activeTab, setActiveTab] = useState<TabType>('overview')
 
   const tabs = [
@@ -165,11 +174,17 @@ export default function AnalyticsTabs({ bills, darkMode, t, onFilterByWord }: An
         )}
 
         {activeTab === 'charts' && (
-          <ChartsView bills={bills} darkMode={darkMode} t={t} />
+          <ChartsView bills={bills} analytics={analytics} darkMode={darkMode} t={t} />
         )}
 
         {activeTab === 'wordcloud' && (
-          <WordCloudView bills={bills} darkMode={darkMode} t={t} onFilterByWord={onFilterByWord} />
+          <WordCloudView
+            bills={bills}
+            analytics={analytics}
+            darkMode={darkMode}
+            t={t}
+            onFilterByWord={onFilterByWord}
+          />
         )}
       </motion.div>
     </div>
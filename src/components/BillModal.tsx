@@ -2,6 +2,7 @@ import { motion } from 'framer-motion'
 import { X, Heart, Download, Calendar, Users, Building } from 'lucide-react'
 import type { LucideIcon } from 'lucide-react'
 import type { Bill } from '../types'
+import type { SimilarBill } from '../dataLoader'
 import { formatDate, exportToCSV, exportToJSON, getLatestStatus, getSponsorNames } from '../utils'
 import ShareButtons from './ShareButtons'
 import { BillSimilarity } from './BillSimilarity'
@@ -11,6 +12,8 @@ import type { Translation } from '../i18n/translations'
 interface BillModalProps {
   bill: Bill
   allBills: Bill[]
+  // Precomputed neighbors of this bill; undefined scores bills in the browser
+  similarBills?: SimilarBill[]
   onClose: () => void
   isFavorited: boolean
   onToggleFavorite: () => void
@@ -23,6 +26,7 @@ interface BillModalProps {
 export default function BillModal({
   bill,
   allBills,
+  similarBills,
   onClose,
   isFavorited,
   onToggleFavorite,
@@ -324,6 +328,7 @@ export default function BillModal({
             <BillSimilarity
               currentBill={bill}
               allBills={allBills}
+              similarBills={similarBills}
               onSelectBill={(newBill) => {
                 onClose()
                 setTimeout(() => onSelectBill(newBill), 100)
@@ -335,6 +340,7 @@ export default function BillModal({
             <RelatedBills
               currentBill={bill}
               allBills={allBills}
+              similarBills={similarBills}
               darkMode={darkMode}
               onSelectBill={(newBill) => {
                 onClose()
@@ -2,101 +2,119 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { Sparkles, Users, Tag, FileText } from 'lucide-react'
 import { useState, useMemo } from 'react'
 import type { Bill } from '../types'
+import type { SimilarBill } from '../dataLoader'
 import { generateBillTags } from '../utils'
 
 interface BillSimilarityProps {
   currentBill: Bill
   allBills: Bill[]
+  // Precomputed neighbors from similar.json; when absent every bill is scored here
+  similarBills?: SimilarBill[]
   onSelectBill: (bill: Bill) => void
   darkMode: boolean
 }
 
-interface SimilarBill {
+interface ScoredBill {
   bill: Bill
   score: number
   reasons: string[]
 }
 
-export function BillSimilarity({ currentBill, allBills, onSelectBill, darkMode }: BillSimilarityProps) {
-  const [expanded, setExpanded] = useState(false)
+function asList(value: string | string[]): string[] {
+  return Array.isArray(value) ? value : [value]
+}
 
-  // Calculate similarity scores
-  const similarBills = useMemo(() => {
-    const results: SimilarBill[] = []
+/** Words of a caption long enough to say something about its topic. */
+function captionWords(caption: string): string[] {
+  return caption
+    .toLowerCase()
+    .split(/\W+/)
+    .filter(w => w.length > 4) // Only significant words
+}
 
-    for (const bill of allBills) {
-      if (bill.doc_number === currentBill.doc_number) continue
+function compareBills(
+  currentBill: Bill,
+  currentTags: string[],
+  currentWords: Set<string>,
+  bill: Bill
+): ScoredBill {
+  let score = 0
+  const reasons: string[] = []
 
-      let score = 0
-      const reasons: string[] = []
+  // Compare sponsors (highest weight)
+  const currentSponsors = asList(currentBill.sponsors)
+  const sharedSponsors = asList(bill.sponsors).filter(s => currentSponsors.includes(s))
+  if (sharedSponsors.length > 0) {
+    score += sharedSponsors.length * 40
+    reasons.push(`Shared sponsor${sharedSponsors.length > 1 ? 's' : ''}: ${sharedSponsors[0]}`)
+  }
 
-      // Compare sponsors (highest weight)
-      const currentSponsors = Array.isArray(currentBill.sponsors) 
-        ? currentBill.sponsors 
-        : [currentBill.sponsors]
-      const billSponsors = Array.isArray(bill.sponsors) 
-        ? bill.sponsors 
-        : [bill.sponsors]
-      
-      const sharedSponsors = currentSponsors.filter(s => billSponsors.includes(s))
-      if (sharedSponsors.length > 0) {
-        score += sharedSponsors.length * 40
-        reasons.push(`Shared sponsor${sharedSponsors.length > 1 ? 's' : ''}: ${sharedSponsors[0]}`)
-      }
+  // Compare tags
+  const billTags = generateBillTags(bill)
+  const sharedTags = currentTags.filter(tag => billTags.includes(tag))
+  if (sharedTags.length > 0) {
+    score += sharedTags.length * 20
+    reasons.push(`${sharedTags.length} shared tag${sharedTags.length > 1 ? 's' : ''}`)
+  }
 
-      // Compare tags
-      const currentTags = generateBillTags(currentBill)
-      const billTags = generateBillTags(bill)
-      const sharedTags = currentTags.filter(tag => billTags.includes(tag))
-      if (sharedTags.length > 0) {
-        score += sharedTags.length * 20
-        reasons.push(`${sharedTags.length} shared tag${sharedTags.length > 1 ? 's' : ''}`)
-      }
+  // Compare caption text (simple word matching)
+  const sharedWords = captionWords(bill.caption).filter(w => currentWords.has(w))
+  if (sharedWords.length > 3) {
+    score += Math.min(sharedWords.length * 5, 30)
+    reasons.push('Similar topics')
+  }
 
-      // Compare caption text (simple word matching)
-      const currentWords = new Set(
-        currentBill.caption
-          .toLowerCase()
-          .split(/\W+/)
-          .filter(w => w.length > 4) // Only significant words
-      )
-      const billWords = bill.caption
-        .toLowerCase()
-        .split(/\W+/)
-        .filter(w => w.length > 4)
-      
-      const sharedWords = billWords.filter(w => currentWords.has(w))
-      if (sharedWords.length > 3) {
-        score += Math.min(sharedWords.length * 5, 30)
-        reasons.push('Similar topics')
-      }
+  // Compare committees
+  const currentCommittees = asList(currentBill.committees)
+  const sharedCommittees = asList(bill.committees).filter(c => currentCommittees.includes(c))
+  if (sharedCommittees.length > 0) {
+    score += sharedCommittees.length * 15
+    reasons.push(`Same committee: ${sharedCommittees[0]}`)
+  }
 
-      // Compare committees
-      const currentCommittees = Array.isArray(currentBill.committees)
-        ? currentBill.committees
-        : [currentBill.committees]
-      const billCommittees = Array.isArray(bill.committees)
-        ? bill.committees
-        : [bill.committees]
-      
-      const sharedCommittees = currentCommittees.filter(c => billCommittees.includes(c))
-      if (sharedCommittees.length > 0) {
-        score += sharedCommittees.length * 15
-        reasons.push(`Same committee: ${sharedCommittees[0]}`)
-      }
+  // Compare status
+  if (currentBill.status_history[0]?.status === bill.status_history[0]?.status) {
+    score += 5
+  }
 
-      // Compare status
-      if (currentBill.status_history[0]?.status === bill.status_history[0]?.status) {
-        score += 5
-      }
+  return { bill, score, reasons }
+}
+
+export function BillSimilarity({
+  currentBill,
+  allBills,
+  similarBills: neighbors,
+  onSelectBill,
+  darkMode,
+}: BillSimilarityProps) {
+  const [expanded, setExpanded] = useState(false)
 
-      if (score > 20) {
-        results.push({ bill, score, reasons })
+  // Calculate similarity scores
+  const similarBills = useMemo(() => {
+    const currentTags = generateBillTags(currentBill)
+    const currentWords = new Set(captionWords(currentBill.caption))
+
+    // Precomputed: only the neighbors are compared, for their reasons
+    if (neighbors) {
+      const byDocNumber = new Map(allBills.map(bill => [bill.doc_number, bill]))
+      return neighbors.flatMap(([docNumber, score]) => {
+        const bill = byDocNumber.get(docNumber)
+        if (!bill) return []
+        return [{ ...compareBills(currentBill, currentTags, currentWords, bill), score }]
+      })
+    }
+
+    const results: ScoredBill[] = []
+    for (const bill of allBills) {
+      if (bill.doc_number === currentBill.doc_number) continue
+      const result = compareBills(currentBill, currentTags, currentWords, bill)
+      if (result.score > 20) {
+        results.push(result)
       }
     }
 
     return results.sort((a, b) => b.score - a.score).slice(0, 5)
-  }, [currentBill, allBills])
+  }, [currentBill, allBills, neighbors])
 
   if (similarBills.length === 0) return null
 
@@ -1,5 +1,6 @@
 import { motion } from 'framer-motion'
 import type { Bill } from '../types'
+import type { Analytics } from '../dataLoader'
 import type { Translation } from '../i18n/translations'
 import { useMemo, useState } from 'react'
 import { PieChart, Pie, Cell, BarChart, Bar, LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts'
@@ -8,15 +9,25 @@ import { Download } from 'lucide-react'
 
 interface ChartsViewProps {
   bills: Bill[]
+  // Precomputed aggregates matching `bills`; computed from `bills` when absent
+  analytics?: Analytics
   darkMode: boolean
   t: Translation
 }
 
-export function ChartsView({ bills, darkMode }: ChartsViewProps) {
+function formatIssue(issue: string): string {
+  return issue.split('-').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join(' ')
+}
+
+export function ChartsView({ bills, analytics, darkMode }: ChartsViewProps) {
   const [activeChart, setActiveChart] = useState<'status' | 'sponsors' | 'issues' | 'activity'>('status')
 
   // Bills by Status (Pie Chart)
   const statusData = useMemo(() => {
+    if (analytics) {
+      return Object.entries(analytics.statuses).map(([name, value]) => ({ name, value }))
+    }
+
     const statusCount: Record<string, number> = {}
     
     bills.forEach(bill => {
@@ -40,10 +51,17 @@ export function ChartsView({ bills, darkMode }: ChartsViewProps) {
     })
     
     return Object.entries(statusCount).map(([name, value]) => ({ name, value }))
-  }, [bills])
+  }, [bills, analytics])
 
   // Top Sponsors (Bar Chart)
   const sponsorsData = useMemo(() => {
+    if (analytics) {
+      return Object.entries(analytics.sponsors)
+        .map(([name, sponsor]) => ({ name, count: sponsor.bills.length }))
+        .sort((a, b) => b.count - a.count)
+        .slice(0, 10)
+    }
+
     const sponsorCount: Record<string, number> = {}
     
     bills.forEach(bill => {
@@ -57,16 +75,23 @@ export function ChartsView({ bills, darkMode }: ChartsViewProps) {
       .sort((a, b) => b[1] - a[1])
       .slice(0, 10)
       .map(([name, count]) => ({ name, count }))
-  }, [bills])
+  }, [bills, analytics])
 
   // Issue Areas (Bar Chart)
   const issuesData = useMemo(() => {
+    if (analytics) {
+      return Object.entries(analytics.issues).map(([issue, count]) => ({
+        name: formatIssue(issue),
+        count,
+      }))
+    }
+
     const issueCount: Record<string, number> = {}
     
     bills.forEach(bill => {
       const issue = getBillIssue(bill)
       if (issue) {
-        const formatted = issue.split('-').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join(' ')
+        const formatted = formatIssue(issue)
         issueCount[formatted] = (issueCount[formatted] || 0) + 1
       } else {
         issueCount['General'] = (issueCount['General'] || 0) + 1
@@ -76,10 +101,17 @@ export function ChartsView({ bills, darkMode }: ChartsViewProps) {
     return Object.entries(issueCount)
       .sort((a, b) => b[1] - a[1])
       .map(([name, count]) => ({ name, count }))
-  }, [bills])
+  }, [bills, analytics])
 
   // Activity Over Time (Line Chart)
   const activityData = useMemo(() => {
+    if (analytics) {
+      // Already sorted by month
+      return Object.entries(analytics.months)
+        .slice(-12)
+        .map(([month, count]) => ({ month, count }))
+    }
+
     const monthCount: Record<string, number> = {}
     
     bills.forEach(bill => {
@@ -98,7 +130,7 @@ export function ChartsView({ bills, darkMode }: ChartsViewProps) {
       .sort((a, b) => a[0].localeCompare(b[0]))
       .slice(-12) // Last 12 months
       .map(([month, count]) => ({ month, count }))
-  }, [bills])
+  }, [bills, analytics])
 
   const COLORS = darkMode 
     ? ['#f97316', '#fb923c', '#fdba74', '#fcd34d', '#60a5fa', '#a78bfa', '#34d399', '#f472b6']
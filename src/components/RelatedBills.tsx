@@ -1,12 +1,15 @@
 import { motion } from 'framer-motion'
 import { FileText, Tag } from 'lucide-react'
 import type { Bill } from '../types'
+import type { SimilarBill } from '../dataLoader'
 import { useMemo } from 'react'
 import { generateBillTags, getBillIssue, getSponsorNames } from '../utils'
 
 interface RelatedBillsProps {
   currentBill: Bill
   allBills: Bill[]
+  // Precomputed neighbors from similar.json; when absent every bill is scored here
+  similarBills?: SimilarBill[]
   darkMode: boolean
   onSelectBill: (bill: Bill) => void
   maxBills?: number
@@ -15,6 +18,7 @@ interface RelatedBillsProps {
 export default function RelatedBills({ 
   currentBill, 
   allBills, 
+  similarBills,
   darkMode, 
   onSelectBill,
   maxBills = 5 
@@ -24,6 +28,20 @@ export default function RelatedBills({
     const currentSponsors = new Set(getSponsorNames(currentBill))
     const currentIssue = getBillIssue(currentBill)
 
+    if (similarBills) {
+      const byDocNumber = new Map(allBills.map(bill => [bill.doc_number, bill]))
+      return similarBills
+        .flatMap(([docNumber, score]) => {
+          const bill = byDocNumber.get(docNumber)
+          return bill ? [{ bill, score }] : []
+        })
+        .slice(0, maxBills)
+        .map(item => ({
+          ...item,
+          matchReasons: getMatchReasons(currentBill, item.bill, currentTags, currentSponsors, currentIssue)
+        }))
+    }
+
     // Score each bill based on similarity
     const scoredBills = allBills
       .filter(bill => bill.doc_number !== currentBill.doc_number)
@@ -66,7 +84,7 @@ export default function RelatedBills({
       }))
 
     return scoredBills
-  }, [currentBill, allBills, maxBills])
+  }, [currentBill, allBills, similarBills, maxBills])
 
   if (relatedBills.length === 0) {
     return null
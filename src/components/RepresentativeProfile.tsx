@@ -1,27 +1,51 @@
 import { motion, AnimatePresence } from 'framer-motion'
 import { X, User, FileText, CheckCircle, Clock, BarChart2 } from 'lucide-react'
 import type { Bill } from '../types'
+import type { SponsorAnalytics } from '../dataLoader'
 import { useMemo } from 'react'
 import { getSponsorNames, getLatestStatus, getBillIssue } from '../utils'
 
 interface RepresentativeProfileProps {
   sponsorName: string
   allBills: Bill[]
+  // Precomputed rollups by normalized sponsor name; computed from `allBills` when absent
+  sponsorAnalytics?: Record<string, SponsorAnalytics>
   isOpen: boolean
   onClose: () => void
   onSelectBill: (bill: Bill) => void
   darkMode: boolean
 }
 
+function formatIssue(issue: string): string {
+  return issue.split('-').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join(' ')
+}
+
 export default function RepresentativeProfile({
   sponsorName,
   allBills,
+  sponsorAnalytics,
   isOpen,
   onClose,
   onSelectBill,
   darkMode
 }: RepresentativeProfileProps) {
   const sponsorStats = useMemo(() => {
+    const rollupName = sponsorAnalytics
+      ? Object.keys(sponsorAnalytics).find(name => name.toLowerCase() === sponsorName.toLowerCase())
+      : undefined
+    if (sponsorAnalytics && rollupName) {
+      const rollup = sponsorAnalytics[rollupName]
+      const byDocNumber = new Map(allBills.map(bill => [bill.doc_number, bill]))
+      const total = rollup.passed + rollup.pending + rollup.failed
+      return {
+        bills: rollup.bills.flatMap(docNumber => byDocNumber.get(docNumber) ?? []),
+        statusCounts: { passed: rollup.passed, pending: rollup.pending, failed: rollup.failed, total },
+        successRate: total > 0 ? ((rollup.passed / total) * 100).toFixed(1) : '0',
+        topIssues: rollup.issues.map(([issue, count]) => ({ name: formatIssue(issue), count })),
+        frequentCoSponsors: rollup.cosponsors.map(([name, count]) => ({ name, count })),
+      }
+    }
+
     // Find all bills sponsored by this person
     const sponsoredBills = allBills.filter(bill => {
       const sponsors = getSponsorNames(bill)
@@ -59,10 +83,7 @@ export default function RepresentativeProfile({
     const topIssues = Object.entries(issueCount)
       .sort((a, b) => b[1] - a[1])
       .slice(0, 5)
-      .map(([issue, count]) => ({
-        name: issue.split('-').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join(' '),
-        count
-      }))
+      .map(([issue, count]) => ({ name: formatIssue(issue), count }))
 
     // Co-sponsors
     const coSponsorCount: Record<string, number> = {}
@@ -89,7 +110,7 @@ export default function RepresentativeProfile({
       topIssues,
       frequentCoSponsors
     }
-  }, [sponsorName, allBills])
+  }, [sponsorName, allBills, sponsorAnalytics])
 
   if (!isOpen) return null
 
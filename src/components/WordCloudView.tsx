@@ -1,21 +1,32 @@
 import { motion } from 'framer-motion'
 import type { Bill } from '../types'
+import type { Analytics } from '../dataLoader'
 import type { Translation } from '../i18n/translations'
 import { useMemo } from 'react'
 import { TagCloud } from 'react-tagcloud'
 
 interface WordCloudViewProps {
   bills: Bill[]
+  // Precomputed word counts matching `bills`; counted from `bills` when absent
+  analytics?: Analytics
   darkMode: boolean
   t: Translation
   onFilterByWord?: (word: string) => void
 }
 
-export function WordCloudView({ bills, darkMode, onFilterByWord }: WordCloudViewProps) {
+function capitalize(word: string): string {
+  return word.charAt(0).toUpperCase() + word.slice(1)
+}
+
+export function WordCloudView({ bills, analytics, darkMode, onFilterByWord }: WordCloudViewProps) {
   const wordData = useMemo(() => {
+    if (analytics) {
+      return analytics.words.map(([value, count]) => ({ value: capitalize(value), count }))
+    }
+
     const wordCount: Record<string, number> = {}
     
-    // Common stop words to exclude
+    // Common stop words to exclude (must match WORD_CLOUD_STOP_WORDS in backend/analytics.py)
     const stopWords = new Set([
       'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
       'by', 'from', 'as', 'is', 'was', 'are', 'be', 'been', 'has', 'have', 'had', 'will',
@@ -48,10 +59,10 @@ export function WordCloudView({ bills, darkMode, onFilterByWord }: WordCloudView
       .sort((a, b) => b[1] - a[1])
       .slice(0, 50)
       .map(([value, count]) => ({
-        value: value.charAt(0).toUpperCase() + value.slice(1),
+        value: capitalize(value),
         count,
       }))
-  }, [bills])
+  }, [bills, analytics])
 
   const customRenderer = (tag: { value: string; count: number }, size: number, color: string) => {
     return (
@@ -115,6 +115,35 @@ describe('RelatedBills', () => {
     expect(container.firstChild).toBeInTheDocument()
   })
 
+  it('should show precomputed similar bills without scoring the others', () => {
+    render(
+      <RelatedBills
+        currentBill={currentBill}
+        allBills={allBills}
+        similarBills={[['SB 1', 35]]}
+        onSelectBill={vi.fn()}
+        darkMode={false}
+      />
+    )
+
+    expect(screen.getByText('SB 1')).toBeInTheDocument()
+    expect(screen.queryByText('HB 2')).not.toBeInTheDocument()
+  })
+
+  it('should render nothing when a bill has no precomputed neighbors', () => {
+    const { container } = render(
+      <RelatedBills
+        currentBill={currentBill}
+        allBills={allBills}
+        similarBills={[]}
+        onSelectBill={vi.fn()}
+        darkMode={false}
+      />
+    )
+
+    expect(container.firstChild).toBeNull()
+  })
+
   it('should return null when no related bills found', () => {
     const isolatedBill = createMockBill({
       doc_number: 'SR 99',
@@ -200,4 +200,31 @@ describe('RepresentativeProfile', () => {
     
     expect(onSelectBill).toHaveBeenCalled()
   })
+
+  it('should use the precomputed sponsor rollup when available', () => {
+    render(
+      <RepresentativeProfile
+        sponsorName="John Smith"
+        allBills={mockBills}
+        sponsorAnalytics={{
+          'John Smith': {
+            bills: ['HB 2'],
+            passed: 0,
+            pending: 1,
+            failed: 0,
+            issues: [],
+            cosponsors: [['Jane Doe', 1]],
+          },
+        }}
+        isOpen={true}
+        onClose={vi.fn()}
+        onSelectBill={vi.fn()}
+        darkMode={false}
+      />
+    )
+
+    expect(screen.getByText('HB 2')).toBeInTheDocument()
+    expect(screen.queryByText('SB 1')).not.toBeInTheDocument()
+    expect(screen.getByText(/Jane Doe/)).toBeInTheDocument()
+  })
 })
@@ -0,0 +1,300 @@
+import type { Bill } from './types'
+
+// Files written by `python -m backend.artifacts` into the deployed data/ directory
+const DATA_DIR = 'data'
+
+export interface BillIndex {
+  version: number
+  generated_at: number
+  count: number
+  bills: Bill[]
+}
+
+export interface SearchIndex {
+  version: number
+  tokens: Record<string, number[]>
+}
+
+/** A similar bill's doc number and its similarity score in percent. */
+export type SimilarBill = [docNumber: string, score: number]
+
+export interface SimilarityIndex {
+  version: number
+  k: number
+  neighbors: Record<string, SimilarBill[]>
+}
+
+/** Per-sponsor rollup, keyed by normalized "First Last" name. */
+export interface SponsorAnalytics {
+  bills: string[]
+  passed: number
+  pending: number
+  failed: number
+  issues: [issue: string, count: number][]
+  cosponsors: [name: string, count: number][]
+}
+
+/** Dashboard aggregates written by backend/analytics.py. */
+export interface Analytics {
+  version: number
+  generated_at: number
+  count: number
+  words: [word: string, count: number][]
+  statuses: Record<string, number>
+  issues: Record<string, number>
+  committees: Record<string, number>
+  months: Record<string, number>
+  sponsors: Record<string, SponsorAnalytics>
+}
+
+/** One entry of data/deltas/manifest.json (written by backend/deltas.py). */
+export interface DeltaEntry {
+  version: number
+  from: number
+  file: string
+}
+
+export interface DeltaManifest {
+  format: number
+  version: number
+  count: number
+  deltas: DeltaEntry[]
+}
+
+/** Splice of a bill's status_history, like Array.prototype.splice(start, delete, ...insert). */
+export interface HistorySplice {
+  start: number
+  delete: number
+  insert: Bill['status_history']
+}
+
+/** Changes from version `from` to `version`, keyed by doc number. */
+export interface BillDelta {
+  version: number
+  from: number
+  added: Bill[]
+  removed: string[]
+  changed: Record<string, Record<string, unknown>>
+}
+
+interface CachedDataset {
+  version: number
+  bills: Bill[]
+}
+
+// Must match DELTAS_VERSION and SPLICED_FIELDS in backend/deltas.py
+const DELTAS_FORMAT = 1
+const SPLICED_FIELDS = new Set(['status_history'])
+const DATASET_DB = 'ga-legislation'
+const DATASET_STORE = 'dataset'
+const DATASET_KEY = 'bills'
+
+// Must match SEARCH_STOP_WORDS in backend/artifacts.py
+const SEARCH_STOP_WORDS = new Set(
+  (
+    'a an and are as at be by for from in into is it its of on or that the this to was ' +
+    'were with act bill amend provide relating other purposes'
+  ).split(' ')
+)
+
+const shardCache = new Map<string, Promise<Record<string, Bill>>>()
+
+async function fetchJson<T>(url: string): Promise<T> {
+  const res = await fetch(url)
+  if (!res.ok) throw new Error(`Failed to load ${url}`)
+  return res.json()
+}
+
+/** Detail shard a bill is stored in, e.g. "HB-12" for "HB 1234" (mirrors shard_key). */
+export function shardKey(docNumber: string): string {
+  const match = /^([A-Za-z]+)\s*(\d+)/.exec(docNumber)
+  if (!match) return 'other'
+  return `${match[1].toUpperCase()}-${Math.floor(Number.parseInt(match[2], 10) / 100)}`
+}
+
+/** Lowercase search tokens, without stop words and single characters (mirrors tokenize). */
+export function tokenize(text: string): string[] {
+  const tokens = text.toLowerCase().match(/[a-z0-9]+/g) || []
+  return [...new Set(tokens)].filter((token) => token.length > 1 && !SEARCH_STOP_WORDS.has(token))
+}
+
+/**
+ * Positions (in the bill index) of bills containing every query token. The last token
+ * also matches as a prefix so results update while typing. Returns null when the query
+ * has no searchable tokens.
+ */
+export function searchBillPositions(index: SearchIndex, query: string): Set<number> | null {
+  const queryTokens = tokenize(query)
+  if (queryTokens.length === 0) return null
+
+  let result: Set<number> | null = null
+  for (const [i, token] of queryTokens.entries()) {
+    const matches = new Set<number>(index.tokens[token] || [])
+    if (i === queryTokens.length - 1) {
+      for (const [key, positions] of Object.entries(index.tokens)) {
+        if (key.startsWith(token)) {
+          for (const position of positions) matches.add(position)
+        }
+      }
+    }
+    const previous: Set<number> | null = result
+    result = previous === null ? matches : new Set([...previous].filter((p) => matches.has(p)))
+  }
+  return result
+}
+
+/** Lightweight bill records for the first paint, or null if no index was deployed. */
+export async function loadBillIndex(basePath: string): Promise<Bill[] | null> {
+  try {
+    const index = await fetchJson<BillIndex>(`${basePath}${DATA_DIR}/index.json`)
+    return index.bills
+  } catch {
+    return null
+  }
+}
+
+/** Return `bills` with `delta` applied; new bills are appended (mirrors apply_delta). */
+export function applyDelta(bills: Bill[], delta: BillDelta): Bill[] {
+  const removed = new Set(delta.removed)
+  const result: Bill[] = []
+  for (const bill of bills) {
+    if (removed.has(bill.doc_number)) continue
+    const changes = delta.changed[bill.doc_number]
+    if (!changes) {
+      result.push(bill)
+      continue
+    }
+    const updated: Record<string, unknown> = { ...bill }
+    for (const [field, value] of Object.entries(changes)) {
+      if (value === null) {
+        delete updated[field]
+      } else if (SPLICED_FIELDS.has(field) && !Array.isArray(value)) {
+        const splice = value as HistorySplice
+        const history = [...((updated[field] as Bill['status_history']) || [])]
+        history.splice(splice.start, splice.delete, ...splice.insert)
+        updated[field] = history
+      } else {
+        updated[field] = value
+      }
+    }
+    result.push(updated as unknown as Bill)
+  }
+  return result.concat(delta.added)
+}
+
+function openDatasetDb(): Promise<IDBDatabase> {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(DATASET_DB, 1)
+    request.onupgradeneeded = () => request.result.createObjectStore(DATASET_STORE)
+    request.onsuccess = () => resolve(request.result)
+    request.onerror = () => reject(request.error)
+  })
+}
+
+async function readCachedDataset(): Promise<CachedDataset | null> {
+  if (typeof indexedDB === 'undefined') return null
+  const db = await openDatasetDb()
+  return new Promise((resolve, reject) => {
+    const request = db.transaction(DATASET_STORE).objectStore(DATASET_STORE).get(DATASET_KEY)
+    request.onsuccess = () => resolve((request.result as CachedDataset | undefined) || null)
+    request.onerror = () => reject(request.error)
+  })
+}
+
+async function saveCachedDataset(dataset: CachedDataset): Promise<void> {
+  if (typeof indexedDB === 'undefined') return
+  const db = await openDatasetDb()
+  db.transaction(DATASET_STORE, 'readwrite').objectStore(DATASET_STORE).put(dataset, DATASET_KEY)
+}
+
+/**
+ * Bring a cached dataset up to the manifest's version by applying the missing deltas.
+ * Returns null when the cache is missing, too old or does not add up.
+ */
+async function updateCachedDataset(
+  basePath: string,
+  manifest: DeltaManifest
+): Promise<Bill[] | null> {
+  const cached = await readCachedDataset()
+  if (!cached) return null
+  if (cached.version === manifest.version) {
+    return cached.bills.length === manifest.count ? cached.bills : null
+  }
+
+  const chain = manifest.deltas.filter((entry) => entry.version > cached.version)
+  if (chain.length !== manifest.version - cached.version || chain[0]?.from !== cached.version) {
+    return null
+  }
+  const deltas = await Promise.all(
+    chain.map((entry) => fetchJson<BillDelta>(`${basePath}${DATA_DIR}/deltas/${entry.file}`))
+  )
+  const bills = deltas.reduce(applyDelta, cached.bills)
+  if (bills.length !== manifest.count) return null
+  saveCachedDataset({ version: manifest.version, bills }).catch(() => {})
+  return bills
+}
+
+/**
+ * The complete dataset. A copy kept in IndexedDB is updated with the published change
+ * deltas; otherwise the minified bundle (or the pretty-printed file) is downloaded.
+ */
+export async function loadFullDataset(basePath: string): Promise<Bill[]> {
+  const manifest = await fetchJson<DeltaManifest>(
+    `${basePath}${DATA_DIR}/deltas/manifest.json`
+  ).catch(() => null)
+  const usable = manifest?.format === DELTAS_FORMAT ? manifest : null
+
+  if (usable) {
+    const updated = await updateCachedDataset(basePath, usable).catch(() => null)
+    if (updated) return updated
+  }
+
+  let bills: Bill[]
+  try {
+    bills = await fetchJson<Bill[]>(`${basePath}${DATA_DIR}/ga_legislation.min.json`)
+  } catch {
+    bills = await fetchJson<Bill[]>(`${basePath}ga_legislation.json`)
+  }
+  if (usable && bills.length === usable.count) {
+    saveCachedDataset({ version: usable.version, bills }).catch(() => {})
+  }
+  return bills
+}
+
+export function loadSearchIndex(basePath: string): Promise<SearchIndex> {
+  return fetchJson<SearchIndex>(`${basePath}${DATA_DIR}/search.json`)
+}
+
+/** Precomputed dashboard aggregates, or null if none were deployed. */
+export async function loadAnalytics(basePath: string): Promise<Analytics | null> {
+  try {
+    return await fetchJson<Analytics>(`${basePath}${DATA_DIR}/analytics.json`)
+  } catch {
+    return null
+  }
+}
+
+/** Precomputed similar bills per doc number, or null if none were deployed. */
+export async function loadSimilarityIndex(basePath: string): Promise<SimilarityIndex | null> {
+  try {
+    return await fetchJson<SimilarityIndex>(`${basePath}${DATA_DIR}/similar.json`)
+  } catch {
+    return null
+  }
+}
+
+/** Full record of one bill from its detail shard; shards are fetched once and cached. */
+export async function loadBillDetail(basePath: string, docNumber: string): Promise<Bill | null> {
+  const key = shardKey(docNumber)
+  let shard = shardCache.get(key)
+  if (!shard) {
+    shard = fetchJson<Record<string, Bill>>(`${basePath}${DATA_DIR}/bills/${key}.json`)
+    shardCache.set(key, shard)
+    shard.catch(() => shardCache.delete(key))
+  }
+  try {
+    return (await shard)[docNumber] || null
+  } catch {
+    return null
+  }
+}
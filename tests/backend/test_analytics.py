@@ -0,0 +1,183 @@
+"""Tests for the dashboard analytics, checked against the rules in src/utils.ts and the components."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from backend.analytics import (
+    ISSUE_KEYWORDS,
+    WORD_CLOUD_STOP_WORDS,
+    bill_issue,
+    build_analytics,
+    cloud_words,
+    month_key,
+    normalize_sponsor_name,
+    outcome,
+    status_category,
+)
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+BILLS = [
+    {
+        "doc_number": "HB 1",
+        "caption": "Firearms; school safety and the gun violence fund",
+        "sponsors": ["SMITH, JOHN", "doe, jane"],
+        "committees": ["Judiciary"],
+        "first_reader_summary": "Creates a school safety grant.",
+        "status_history": [
+            {"date": "2025-01-10", "status": "House Hopper"},
+            {"date": "2025-02-03", "status": "House Passed/Adopted"},
+        ],
+    },
+    {
+        "doc_number": "HB 2",
+        "caption": "Medicaid; expand school nurse coverage",
+        "sponsors": ["Smith, John"],
+        "committees": ["Health", "Appropriations"],
+        "status_history": [
+            {"date": "2025-02-20", "status": "Vetoed by Governor"},
+            {"date": "2025-01-15", "status": "House Hopper"},
+        ],
+    },
+    {
+        "doc_number": "SR 3",
+        "caption": "Honoring 2025 champions",
+        "sponsors": [],
+        "committees": [],
+        "status_history": [{"date": "3/4/2025", "status": "Senate Read and Referred"}],
+    },
+]
+
+
+def test_issue_keywords_match_utils_ts():
+    source = (SRC / "utils.ts").read_text(encoding="utf-8")
+    block = re.search(r"issueKeywords[^=]*= \{(.*?)\n\}", source, re.S)
+    assert block is not None
+
+    issues = {
+        (quoted or bare): re.findall(r"'([^']*)'", keywords)
+        for quoted, bare, keywords in re.findall(
+            r"(?:'([^']+)'|(\w+)):\s*\[(.*?)\]", block.group(1), re.S
+        )
+    }
+    # Order matters: the first matching issue wins
+    assert list(issues.items()) == list(ISSUE_KEYWORDS.items())
+
+
+def test_stop_words_match_word_cloud_view():
+    source = (SRC / "components" / "WordCloudView.tsx").read_text(encoding="utf-8")
+    block = re.search(r"stopWords = new Set\(\[(.*?)\]\)", source, re.S)
+    assert block is not None
+    assert set(re.findall(r"'([^']*)'", block.group(1))) == WORD_CLOUD_STOP_WORDS
+
+
+@pytest.mark.parametrize(
+    ("bill", "expected"),
+    [
+        # gun-control is listed first, so it wins over gun-violence and education
+        ({"caption": "School gun violence"}, "gun-control"),
+        ({"caption": "Budget", "first_reader_summary": "Medicaid funding"}, "healthcare"),
+        ({"caption": "Roads", "committees": ["Education"]}, "education"),
+        ({"caption": "Roads", "committees": "Natural Resources and Environment"}, "environment"),
+        ({"caption": "Honoring a citizen"}, "general"),
+    ],
+)
+def test_bill_issue(bill, expected):
+    assert bill_issue(bill) == expected
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        ("House Hopper", "Other"),
+        ("Senate Read and Referred", "Other"),
+        ("House First Readers - Introduced", "Introduced"),
+        ("House Committee Favorably Reported", "In Committee"),
+        ("Senate Passed/Adopted", "Passed"),
+        ("Effective Date - Signed by Governor", "Signed/Enacted"),
+        ("Vetoed by Governor", "Vetoed/Failed"),
+    ],
+)
+def test_status_category_uses_the_last_entry(status, expected):
+    history = [{"date": "2025-01-01", "status": "Introduced"}, {"status": status}]
+    assert status_category(history) == expected
+
+
+def test_status_category_without_history():
+    assert status_category([]) == "Unknown"
+
+
+def test_outcome_uses_the_latest_dated_status():
+    history = [
+        {"date": "2025-03-01", "status": "Vetoed by Governor"},
+        {"date": "2025-01-01", "status": "House Passed/Adopted"},
+    ]
+    assert outcome(history) == "failed"
+    assert outcome(history[1:]) == "passed"
+    assert outcome([{"date": "2025-01-01", "status": "Senate Rejected"}]) == "failed"
+    assert outcome([{"date": "2025-01-01", "status": "House Hopper"}]) == "pending"
+    assert outcome([]) == "pending"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("SMITH, JOHN", "John Smith"),
+        ("  de la cruz, mary ann ", "Mary Ann De La Cruz"),
+        ("jane DOE", "Jane Doe"),
+        ("   ", ""),
+    ],
+)
+def test_normalize_sponsor_name(name, expected):
+    assert normalize_sponsor_name(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        ("2025-01-10", "2025-01"),
+        ("2025-01-10T12:00:00", "2025-01"),
+        ("3/4/2025", "2025-03"),
+        ("", None),
+    ],
+)
+def test_month_key(date, expected):
+    assert month_key(date) == expected
+
+
+def test_cloud_words_skip_short_words_stop_words_and_numbers():
+    bill = {"caption": "Code section; the 2025 state-wide tax, tax!", "summary": "Revise tax code"}
+    assert list(cloud_words(bill)) == ["state-wide", "revise"]
+
+
+def test_build_analytics():
+    analytics = build_analytics(iter(BILLS))
+
+    assert analytics["count"] == 3
+    # ChartsView takes the last entry as listed, not the latest by date
+    assert analytics["statuses"] == {"Passed": 1, "Other": 2}
+    assert analytics["issues"] == {"gun-control": 1, "healthcare": 1, "general": 1}
+    assert analytics["committees"] == {"Judiciary": 1, "Health": 1, "Appropriations": 1}
+    assert analytics["months"] == {"2025-01": 2, "2025-02": 2, "2025-03": 1}
+    assert analytics["words"][0] == ("school", 3)
+
+    assert analytics["sponsors"] == {
+        "John Smith": {
+            "bills": ["HB 1", "HB 2"],
+            "passed": 1,
+            "pending": 0,
+            "failed": 1,
+            "issues": [("gun-control", 1), ("healthcare", 1)],
+            "cosponsors": [("Jane Doe", 1)],
+        },
+        "Jane Doe": {
+            "bills": ["HB 1"],
+            "passed": 1,
+            "pending": 0,
+            "failed": 0,
+            "issues": [("gun-control", 1)],
+            "cosponsors": [("John Smith", 1)],
+        },
+    }
@@ -0,0 +1,129 @@
+"""Tests for the frontend data artifacts, checked against what src/dataLoader.ts reads."""
+
+import gzip
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from backend.artifacts import (
+    BROTLI_AVAILABLE,
+    SEARCH_STOP_WORDS,
+    build_artifacts,
+    shard_key,
+)
+
+DATA_LOADER = Path(__file__).resolve().parents[2] / "src" / "dataLoader.ts"
+
+BILLS = [
+    {
+        "doc_number": "HB 1234",
+        "caption": "Education; provide funding for school nutrition",
+        "sponsors": ["Smith, John 12th"],
+        "committees": ["Education"],
+        "first_reader_summary": "A BILL to fund cafeterias.",
+        "status_history": [
+            {"date": "2025-01-10", "status": "House Hopper"},
+            {"date": "2025-01-11", "status": "House First Readers"},
+            {"date": "2025-02-01", "status": "House Passed/Adopted"},
+        ],
+    },
+    {
+        "doc_number": "HB 1299",
+        "caption": "Motor vehicles; revise speed limits",
+        "sponsors": ["Doe, Jane 34th"],
+        "committees": ["Transportation"],
+        "status_history": [{"date": "2025-01-12", "status": "House Hopper"}],
+    },
+    {"doc_number": "SR 5", "caption": "Honoring a school", "sponsors": [], "committees": []},
+]
+
+
+def load(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def search(tokens, query):
+    """Positions matching every query token, the last one as a prefix (searchBillPositions)."""
+    words = [
+        word
+        for word in dict.fromkeys(re.findall(r"[a-z0-9]+", query.lower()))
+        if len(word) > 1 and word not in SEARCH_STOP_WORDS
+    ]
+    result = None
+    for i, word in enumerate(words):
+        matches = set(tokens.get(word, []))
+        if i == len(words) - 1:
+            matches.update(p for key, ps in tokens.items() if key.startswith(word) for p in ps)
+        result = matches if result is None else result & matches
+    return result
+
+
+@pytest.mark.parametrize(
+    ("doc_number", "expected"),
+    [("HB 1234", "HB-12"), ("HB1299", "HB-12"), ("sr5", "SR-0"), ("HB 100", "HB-1"), ("", "other")],
+)
+def test_shard_key(doc_number, expected):
+    assert shard_key(doc_number) == expected
+
+
+def test_frontend_mirrors_shard_key_and_stop_words():
+    source = DATA_LOADER.read_text(encoding="utf-8")
+
+    assert r"/^([A-Za-z]+)\s*(\d+)/" in source
+    stop_words = re.search(r"SEARCH_STOP_WORDS = new Set\(\s*\((.*?)\)\.split", source, re.S)
+    assert stop_words is not None
+    assert set("".join(re.findall(r"'([^']*)'", stop_words.group(1))).split()) == SEARCH_STOP_WORDS
+
+
+def test_artifacts_round_trip(tmp_path):
+    manifest = build_artifacts(BILLS, tmp_path)
+
+    # loadFullDataset
+    assert load(tmp_path / "ga_legislation.min.json") == BILLS
+
+    # loadBillIndex: one summary per bill, history reduced to its first and last entries
+    index = load(tmp_path / "index.json")
+    assert index["count"] == len(BILLS)
+    assert [bill["doc_number"] for bill in index["bills"]] == ["HB 1234", "HB 1299", "SR 5"]
+    assert index["bills"][0]["status_history"] == [
+        BILLS[0]["status_history"][0],
+        BILLS[0]["status_history"][-1],
+    ]
+    assert "first_reader_summary" not in index["bills"][0]
+
+    # loadBillDetail: bills/<shardKey>.json maps doc numbers to full records
+    for bill in BILLS:
+        shard = load(tmp_path / "bills" / f"{shard_key(bill['doc_number'])}.json")
+        assert shard[bill["doc_number"]] == bill
+    assert sorted(path.stem for path in (tmp_path / "bills").glob("*.json")) == manifest["shards"]
+    assert manifest["shards"] == ["HB-12", "SR-0"]
+
+    # searchBillPositions: positions refer to index.json
+    tokens = load(tmp_path / "search.json")["tokens"]
+    assert search(tokens, "school") == {0, 2}
+    assert search(tokens, "cafeteria") == {0}
+    assert search(tokens, "hb1299") == {1}
+    assert search(tokens, "smith educ") == {0}
+    assert "the" not in tokens and "a" not in tokens
+
+
+def test_compressed_copies_match(tmp_path):
+    manifest = build_artifacts(BILLS, tmp_path)
+
+    raw = (tmp_path / "index.json").read_bytes()
+    assert gzip.decompress((tmp_path / "index.json.gz").read_bytes()) == raw
+    assert manifest["sizes"]["index"]["raw"] == len(raw)
+    if BROTLI_AVAILABLE:
+        import brotli
+
+        assert brotli.decompress((tmp_path / "index.json.br").read_bytes()) == raw
+
+
+def test_stale_shards_are_removed(tmp_path):
+    build_artifacts(BILLS, tmp_path)
+
+    build_artifacts(BILLS[:1], tmp_path)
+
+    assert [path.stem for path in (tmp_path / "bills").glob("*.json")] == ["HB-12"]
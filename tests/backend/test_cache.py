@@ -0,0 +1,177 @@
+"""Tests for the append-only detail cache."""
+
+import json
+import threading
+import time
+
+from backend.cache import DetailCache
+from backend.models import BillDetails
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_values_survive_a_reopen(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = DetailCache(path)
+    cache["a"] = {"first_reader_summary": "A"}
+    cache["b"] = {"first_reader_summary": "B"}
+    cache.close()
+
+    reopened = DetailCache(path)
+    assert len(reopened) == 2
+    assert reopened["a"] == {"first_reader_summary": "A"}
+    assert reopened.get("missing", "default") == "default"
+
+
+def test_truncated_tail_is_skipped_and_compacted(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    path.write_text(
+        '{"key": "a", "value": {"n": 1}}\n'
+        '{"key": "b", "value": {"n": 2}}\n'
+        '{"key": "c", "value": {"n"',
+        encoding="utf-8",
+    )
+
+    cache = DetailCache(path)
+
+    assert "c" not in cache
+    assert cache["b"] == {"n": 2}
+    assert read_records(path) == [
+        {"key": "a", "value": {"n": 1}},
+        {"key": "b", "value": {"n": 2}},
+    ]
+
+
+def test_damaged_record_is_skipped(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    path.write_text(
+        '{"key": "a", "value": 1}\nnot json\n{"value": 2}\n{"key": "b", "value": 3}\n',
+        encoding="utf-8",
+    )
+
+    cache = DetailCache(path)
+
+    assert (cache["a"], cache["b"]) == (1, 3)
+    assert len(read_records(path)) == 2
+
+
+def test_migrates_legacy_json_document(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    legacy_path = tmp_path / "cache.json"
+    legacy = {
+        "https://example.test/1": {"first_reader_summary": "One", "status_history": []},
+        "https://example.test/2": {"first_reader_summary": "Two"},
+    }
+    legacy_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    cache = DetailCache(path, legacy_path=legacy_path)
+
+    assert cache["https://example.test/2"] == {"first_reader_summary": "Two"}
+    assert {record["key"]: record["value"] for record in read_records(path)} == legacy
+
+
+def test_legacy_document_is_ignored_once_log_exists(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    path.write_text('{"key": "a", "value": 1}\n', encoding="utf-8")
+    legacy_path = tmp_path / "cache.json"
+    legacy_path.write_text(json.dumps({"b": 2}), encoding="utf-8")
+
+    cache = DetailCache(path, legacy_path=legacy_path)
+
+    assert "b" not in cache
+    assert cache["a"] == 1
+
+
+def test_close_compacts_superseded_records(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = DetailCache(path, flush_every=1)
+    for n in range(5):
+        cache["a"] = n
+    cache["b"] = 0
+    cache.flush()
+    assert len(read_records(path)) == 6
+
+    cache.close()
+
+    assert read_records(path) == [{"key": "a", "value": 4}, {"key": "b", "value": 0}]
+
+
+def test_flush_batches_records(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = DetailCache(path, flush_every=3, flush_interval=3600)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert not path.exists()
+
+    cache["c"] = 3
+    cache.flush()
+
+    assert len(read_records(path)) == 3
+
+
+def test_batches_are_written_off_the_calling_thread(tmp_path, monkeypatch):
+    path = tmp_path / "cache.jsonl"
+    cache = DetailCache(path, flush_every=2, flush_interval=3600)
+    release = threading.Event()
+    fsync_threads = []
+
+    def slow_fsync(fd):
+        fsync_threads.append(threading.current_thread())
+        release.wait(5)
+
+    monkeypatch.setattr("backend.cache.os.fsync", slow_fsync)
+
+    # Filling two batches returns while the first fsync is still blocked
+    started = time.monotonic()
+    for n in range(4):
+        cache[str(n)] = n
+    assert time.monotonic() - started < 1
+
+    release.set()
+    cache.close()
+
+    assert threading.current_thread() not in fsync_threads
+    assert [record["key"] for record in read_records(path)] == ["0", "1", "2", "3"]
+
+
+def test_failed_write_is_retried_with_the_next_batch(tmp_path, monkeypatch):
+    path = tmp_path / "cache.jsonl"
+    cache = DetailCache(path, flush_every=1)
+    real_open = open
+    failures = [OSError("disk full")]
+
+    def flaky_open(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", flaky_open)
+    cache["a"] = 1
+    cache.flush()
+    assert not path.exists()
+
+    cache["b"] = 2
+    cache.flush()
+
+    assert read_records(path) == [{"key": "a", "value": 1}, {"key": "b", "value": 2}]
+
+
+def test_decode_and_encode_keep_the_disk_format(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    legacy_path = tmp_path / "cache.json"
+    entry = {"first_reader_summary": "One", "status_history": [], "fetched_at": 1.5}
+    legacy_path.write_text(json.dumps({"a": entry}), encoding="utf-8")
+    hooks = {"decode": BillDetails.from_dict, "encode": BillDetails.to_dict}
+
+    cache = DetailCache(path, legacy_path=legacy_path, flush_every=1, **hooks)
+    assert cache["a"] == BillDetails("One", (), 1.5)
+    cache["b"] = BillDetails("Two", fingerprint="f")
+    cache.close()
+
+    assert read_records(path) == [
+        {"key": "a", "value": entry},
+        {"key": "b", "value": {"first_reader_summary": "Two", "fingerprint": "f"}},
+    ]
+    assert DetailCache(path, **hooks)["b"] == BillDetails("Two", fingerprint="f")
@@ -0,0 +1,263 @@
+"""Tests for listing checkpoints."""
+
+import asyncio
+import json
+
+from backend.checkpoint import ScrapeCheckpoint
+
+
+def stubs(page, count=2):
+    return [{"doc_number": f"HB {page}{n}", "detail_url": f"/{page}/{n}"} for n in range(count)]
+
+
+def test_resume_restores_progress(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.reset("api")
+    checkpoint.record_page(1, stubs(1))
+    checkpoint.record_page(2, stubs(2))
+
+    resumed = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    state = resumed.load()
+
+    assert state is not None and state["bill_count"] == 4
+    assert resumed.source == "api"
+    assert resumed.last_page == 2
+    assert not resumed.complete
+    assert resumed.bills == stubs(1) + stubs(2)
+    assert checkpoint.bills_path.name == "scrape_checkpoint.bills.jsonl"
+
+
+def test_sidecar_only_gets_new_stubs(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.record_page(1, stubs(1))
+    checkpoint.record_page(2, stubs(2))
+    checkpoint.mark_complete()
+
+    lines = checkpoint.bills_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == stubs(1) + stubs(2)
+
+
+def test_mark_complete(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.record_page(1, stubs(1))
+    checkpoint.mark_complete()
+
+    resumed = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    resumed.load()
+    assert resumed.complete
+
+
+def test_saves_every_n_pages(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json", every_pages=2)
+    checkpoint.record_page(1, stubs(1))
+    assert not checkpoint.path.exists()
+
+    checkpoint.record_page(2, stubs(2))
+    assert json.loads(checkpoint.path.read_text(encoding="utf-8"))["last_page"] == 2
+
+
+def test_interrupted_save_is_ignored_and_overwritten(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.record_page(1, stubs(1))
+    # Stubs appended by a save that died before writing the checkpoint document
+    with open(checkpoint.bills_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"doc_number": "orphan"}) + '\n{"doc_')
+
+    resumed = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    resumed.load()
+    assert resumed.bills == stubs(1)
+
+    resumed.record_page(2, stubs(2))
+    lines = resumed.bills_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == stubs(1) + stubs(2)
+
+
+def test_incomplete_sidecar_is_not_used(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.record_page(1, stubs(1))
+    checkpoint.bills_path.write_text(json.dumps(stubs(1)[0]) + "\n", encoding="utf-8")
+
+    assert ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json").load() is None
+
+
+def test_other_versions_are_not_used(tmp_path):
+    path = tmp_path / "scrape_checkpoint.json"
+    path.write_text(json.dumps({"version": 1, "last_page": 3, "bills": []}), encoding="utf-8")
+
+    assert ScrapeCheckpoint(path).load() is None
+
+
+def test_damaged_checkpoint_is_not_used(tmp_path):
+    path = tmp_path / "scrape_checkpoint.json"
+    path.write_text('{"version": 2, "last_page"', encoding="utf-8")
+
+    assert ScrapeCheckpoint(path).load() is None
+
+
+def test_clear_removes_both_files(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "scrape_checkpoint.json")
+    checkpoint.record_page(1, stubs(1))
+
+    checkpoint.clear()
+
+    assert not checkpoint.path.exists()
+    assert not checkpoint.bills_path.exists()
+    assert ScrapeCheckpoint(checkpoint.path).load() is None
+
+
+def make_scraper(tmp_path, monkeypatch):
+    from backend.scraper import GALegislationScraper
+
+    monkeypatch.chdir(tmp_path)
+    return GALegislationScraper(checkpoint_file=str(tmp_path / "scrape_checkpoint.json"))
+
+
+def test_listing_resumes_after_the_last_page(tmp_path, monkeypatch):
+    scraper = make_scraper(tmp_path, monkeypatch)
+    assert scraper.checkpoint is not None
+    scraper.checkpoint.reset("browser")
+    scraper.checkpoint.record_page(3, stubs(3))
+
+    assert scraper._resume_page("browser") == 4
+    assert scraper.checkpoint.bills == stubs(3)
+
+
+def test_listing_from_another_source_starts_over(tmp_path, monkeypatch):
+    scraper = make_scraper(tmp_path, monkeypatch)
+    assert scraper.checkpoint is not None
+    scraper.checkpoint.reset("api:100")
+    scraper.checkpoint.record_page(3, stubs(3))
+
+    assert scraper._resume_page("browser") == 1
+    assert scraper.checkpoint.source == "browser"
+    assert scraper.checkpoint.bills == []
+
+
+BROWSER_PAGE_SIZE = 3
+BROWSER_PAGES = 15
+
+
+def browser_bills(page_num):
+    first = (page_num - 1) * BROWSER_PAGE_SIZE + 1
+    return [
+        {"doc_number": f"HB {n}", "detail_url": f"/legislation/{n}"}
+        for n in range(first, first + BROWSER_PAGE_SIZE)
+    ]
+
+
+class FakeListingPage:
+    """Listing page showing links to the two pages before and four after the current one."""
+
+    def __init__(self):
+        self.current = 1
+        self.clicks = []
+
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.current = 1
+
+    async def content(self):
+        return str(self.current)
+
+    async def evaluate(self, script):
+        from backend.scraper import PAGE_LINKS_JS
+
+        assert script == PAGE_LINKS_JS
+        return list(range(max(1, self.current - 2), min(BROWSER_PAGES, self.current + 4) + 1))
+
+
+def listing_scraper(tmp_path, monkeypatch, api_pages=0):
+    """Scraper whose listing API serves ``api_pages`` pages of two bills, then fails."""
+    from backend import scraper as scraper_module
+    from backend.listing_api import ListingEndpoint
+
+    scraper = make_scraper(tmp_path, monkeypatch)
+    scraper.listing_page_size = 2
+    page = FakeListingPage()
+
+    async def parse(parser, html, *args):
+        return browser_bills(int(html)), BROWSER_PAGES * BROWSER_PAGE_SIZE, BROWSER_PAGE_SIZE
+
+    async def click_next_page(page_, page_num, next_page_num):
+        assert page.current == page_num
+        page.clicks.append(next_page_num)
+        page.current = next_page_num
+
+    async def fetch_api_page(session, endpoint, page_index):
+        if page_index >= api_pages:
+            return None
+        first = page_index * 2 + 1
+        return [{"legislationId": n, "documentNumber": f"HB {n}"} for n in (first, first + 1)]
+
+    async def discover(captured):
+        return ListingEndpoint("GET", "https://example.test/api/legislation")
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(scraper, "_parse", parse)
+    monkeypatch.setattr(scraper, "_click_next_page", click_next_page)
+    monkeypatch.setattr(scraper, "_fetch_listing_api_page", fetch_api_page)
+    monkeypatch.setattr(scraper, "_discover_listing_endpoint", discover)
+    monkeypatch.setattr(scraper_module.asyncio, "sleep", no_sleep)
+    return scraper, page
+
+
+def list_pages(scraper, page, stop_after=None):
+    """List like ``scrape_all`` does, recording pages; optionally stop part way."""
+
+    async def run():
+        listing = await scraper._open_listing(page, None, None)
+        listed = []
+        async for page_num, page_bills in listing:
+            scraper.checkpoint.record_page(page_num, page_bills)
+            listed.append((page_num, [bill["doc_number"] for bill in page_bills]))
+            if len(listed) == stop_after:
+                break
+        return listed
+
+    return asyncio.run(run())
+
+
+def test_browser_resume_jumps_through_visible_page_links(tmp_path, monkeypatch):
+    scraper, page = listing_scraper(tmp_path, monkeypatch)
+    scraper.listing_mode = "browser"
+    scraper.checkpoint.reset("browser")
+    scraper.checkpoint.record_page(11, browser_bills(11))
+
+    listed = list_pages(scraper, page)
+
+    assert [page_num for page_num, _ in listed] == [12, 13, 14, 15]
+    # Jumps to the farthest visible link instead of clicking through every page
+    assert page.clicks == [5, 9, 12, 13, 14, 15]
+
+
+def test_api_failure_continues_in_the_browser_and_resumes_there(tmp_path, monkeypatch):
+    scraper, page = listing_scraper(tmp_path, monkeypatch, api_pages=4)
+    scraper.checkpoint.reset()
+
+    listed = list_pages(scraper, page, stop_after=6)
+
+    # Bills 1-8 came from the API; the browser skips the pages holding them
+    assert listed == [
+        (1, ["HB1", "HB2"]),
+        (2, ["HB3", "HB4"]),
+        (3, ["HB5", "HB6"]),
+        (4, ["HB7", "HB8"]),
+        (3, ["HB 9"]),
+        (4, ["HB 10", "HB 11", "HB 12"]),
+    ]
+    assert page.clicks == [3, 4]
+
+    # The resumed run continues after browser page 4 even though the API is back
+    resumed, page = listing_scraper(tmp_path, monkeypatch, api_pages=20)
+    assert resumed.checkpoint.load() is not None
+    assert (resumed.checkpoint.source, resumed.checkpoint.last_page) == ("browser", 4)
+    assert len(resumed.checkpoint.bills) == 12
+
+    assert [page_num for page_num, _ in list_pages(resumed, page)] == list(range(5, 16))
@@ -0,0 +1,139 @@
+"""Tests for the versioned output deltas."""
+
+import json
+
+import pytest
+
+from backend.deltas import (
+    apply_delta,
+    apply_splice,
+    diff_outputs,
+    history_splice,
+    load_deltas_manifest,
+    publish_delta,
+)
+
+
+def event(day, status):
+    return {"date": f"1/{day}/2025", "status": status}
+
+
+PREVIOUS: list[dict] = [
+    {"doc_number": "HB 1", "caption": "One", "status_history": [event(1, "Filed")]},
+    {"doc_number": "HB 2", "caption": "Two", "sponsors": ["Smith"]},
+    {"doc_number": "HB 3", "caption": "Three"},
+]
+CURRENT: list[dict] = [
+    {
+        "doc_number": "HB 1",
+        "caption": "One",
+        "status_history": [event(1, "Filed"), event(2, "Read")],
+    },
+    {"doc_number": "HB 2", "caption": "Two, amended"},
+    {"doc_number": "HB 4", "caption": "Four"},
+]
+
+
+def read_manifest(deltas_dir):
+    manifest = load_deltas_manifest(deltas_dir)
+    assert manifest is not None
+    return manifest
+
+
+def write_output(path, bills):
+    if path.suffix == ".jsonl":
+        path.write_text("".join(json.dumps(bill) + "\n" for bill in bills), encoding="utf-8")
+    else:
+        path.write_text(json.dumps(bills, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "expected"),
+    [
+        ([1, 2], [1, 2, 3], {"start": 2, "delete": 0, "insert": [3]}),
+        ([2, 3], [1, 2, 3], {"start": 0, "delete": 0, "insert": [1]}),
+        ([1, 2, 3], [1, 4, 3], {"start": 1, "delete": 1, "insert": [4]}),
+        ([1, 1], [1, 1, 1], {"start": 2, "delete": 0, "insert": [1]}),
+        ([1, 2], [], {"start": 0, "delete": 2, "insert": []}),
+    ],
+)
+def test_history_splice(old, new, expected):
+    splice = history_splice(old, new)
+
+    assert splice == expected
+    assert apply_splice(old, splice) == new
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_diff_outputs(tmp_path, suffix):
+    previous = write_output(tmp_path / f"previous{suffix}", PREVIOUS)
+    current = write_output(tmp_path / f"current{suffix}", CURRENT)
+
+    delta, count = diff_outputs(previous, current)
+
+    assert count == 3
+    assert delta["added"] == [CURRENT[2]]
+    assert delta["removed"] == ["HB 3"]
+    assert delta["changed"] == {
+        "HB 1": {"status_history": {"start": 1, "delete": 0, "insert": [event(2, "Read")]}},
+        "HB 2": {"caption": "Two, amended", "sponsors": None},
+    }
+    assert apply_delta(PREVIOUS, delta) == CURRENT
+
+
+def test_publish_delta_versions(tmp_path):
+    deltas_dir = tmp_path / "deltas"
+    previous = write_output(tmp_path / "previous.json", PREVIOUS)
+    current = write_output(tmp_path / "current.json", CURRENT)
+
+    # The first run only starts a baseline
+    assert publish_delta(None, previous, deltas_dir) is None
+    manifest = read_manifest(deltas_dir)
+    assert (manifest["version"], manifest["count"], manifest["deltas"]) == (1, 3, [])
+
+    entry = publish_delta(previous, current, deltas_dir)
+    assert entry is not None
+    assert (entry["version"], entry["added"], entry["removed"], entry["changed"]) == (2, 1, 1, 2)
+
+    delta = json.loads((deltas_dir / entry["file"]).read_text(encoding="utf-8"))
+    assert delta["from"] == 1
+    assert apply_delta(PREVIOUS, delta) == CURRENT
+    assert read_manifest(deltas_dir)["deltas"] == [entry]
+
+    # Unchanged data publishes nothing
+    assert publish_delta(current, current, deltas_dir) is None
+    assert read_manifest(deltas_dir)["version"] == 2
+
+
+def test_publish_delta_prunes_old_deltas(tmp_path, monkeypatch):
+    monkeypatch.setattr("backend.deltas.MAX_DELTAS", 2)
+    deltas_dir = tmp_path / "deltas"
+    previous = write_output(tmp_path / "v1.json", PREVIOUS)
+    publish_delta(None, previous, deltas_dir)
+
+    bills = PREVIOUS
+    for i in range(3):
+        bills = [dict(bills[0], caption=f"One v{i}"), *bills[1:]]
+        current = write_output(tmp_path / f"v{i + 2}.json", bills)
+        publish_delta(previous, current, deltas_dir)
+        previous = current
+
+    manifest = read_manifest(deltas_dir)
+    assert [entry["version"] for entry in manifest["deltas"]] == [3, 4]
+    assert sorted(path.name for path in deltas_dir.iterdir()) == [
+        "000003.json",
+        "000004.json",
+        "manifest.json",
+    ]
+
+
+def test_publish_delta_skips_unreadable_output(tmp_path):
+    deltas_dir = tmp_path / "deltas"
+    previous = write_output(tmp_path / "previous.json", PREVIOUS)
+    publish_delta(None, previous, deltas_dir)
+    broken = tmp_path / "current.json"
+    broken.write_text('[{"doc_number": "HB 1"}', encoding="utf-8")
+
+    assert publish_delta(previous, broken, deltas_dir) is None
+    assert read_manifest(deltas_dir)["version"] == 1
@@ -0,0 +1,156 @@
+"""Tests for fetching bill details over HTTP with the browser fallback."""
+
+import asyncio
+from collections import Counter
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.parsing import empty_details
+
+DETAIL = (
+    "<html><body><h2>First Reader Summary</h2><div><p>A BILL</p></div>"
+    "<h2>Status History</h2><div><table><tbody>"
+    "<tr><td>1/13/2025</td><td>House Hopper</td></tr>"
+    "</tbody></table></div></body></html>"
+)
+EMPTY_SHELL = "<html><body><div id='app'></div></body></html>"
+
+
+class Site:
+    """Serves detail pages that fail with a scripted sequence of statuses."""
+
+    def __init__(self, **scripts):
+        self.scripts = {path: list(statuses) for path, statuses in scripts.items()}
+        self.requests = Counter()
+
+    async def handle(self, request):
+        path = request.match_info["path"]
+        self.requests[path] += 1
+        script = self.scripts[path]
+        status = script.pop(0) if len(script) > 1 else script[0]
+        if status != 200:
+            return web.Response(status=status)
+        body = EMPTY_SHELL if path == "shell" else DETAIL
+        return web.Response(text=body, content_type="text/html")
+
+
+class FakePool:
+    """Page pool whose pages fail a given number of times before loading details."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def checkout(self):
+        self.checkouts += 1
+        yield object()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Skip the whole-second backoff sleeps; shorter ones (request pacing) still run."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args):
+        if delay < 1:
+            return await real_sleep(delay, *args)
+        delays.append(delay)
+
+    monkeypatch.setattr("backend.scraper.asyncio.sleep", fake_sleep)
+    return delays
+
+
+def make_scraper(tmp_path, monkeypatch, detail_mode, pool=None):
+    from backend.scraper import GALegislationScraper
+
+    monkeypatch.chdir(tmp_path)
+    scraper = GALegislationScraper(detail_mode=detail_mode, request_delay=0, http_cache_dir=None)
+
+    async def backoff(attempt, outcome):
+        scraper.metrics.increment("test_backoffs")
+
+    async def browser_details(page, url):
+        if pool.failures:
+            pool.failures -= 1
+            raise RuntimeError("page crashed")
+        return {"first_reader_summary": "From the browser", "status_history": []}
+
+    monkeypatch.setattr(scraper.rate_limiter, "backoff", backoff)
+    monkeypatch.setattr(scraper, "_get_legislation_details_async", browser_details)
+    return scraper
+
+
+def fetch(scraper, site, path, pool=None):
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{path}", site.handle)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            return await scraper._fetch_with_retry(session, str(server.make_url(f"/{path}")), pool)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("detail_mode", ["auto", "http"])
+@pytest.mark.parametrize("status", [404, 403, 410])
+def test_client_errors_fail_fast(tmp_path, monkeypatch, detail_mode, status):
+    pool = FakePool()
+    scraper = make_scraper(tmp_path, monkeypatch, detail_mode, pool)
+    site = Site(missing=[status])
+
+    assert fetch(scraper, site, "missing", pool) == empty_details()
+    assert site.requests["missing"] == 1
+    assert pool.checkouts == 0
+    assert scraper.stats["failed"] == 1
+
+
+def test_server_errors_are_retried_over_http_only(tmp_path, monkeypatch):
+    scraper = make_scraper(tmp_path, monkeypatch, "http")
+    site = Site(flaky=[503, 500, 200], broken=[500])
+
+    assert fetch(scraper, site, "flaky")["first_reader_summary"] == "A BILL"
+    assert fetch(scraper, site, "broken") == empty_details()
+
+    # Three HTTP attempts each, never multiplied by an outer retry loop
+    assert site.requests == {"flaky": 3, "broken": 3}
+    assert scraper.metrics.counters["test_backoffs"] == 4
+    assert (scraper.stats["fetched"], scraper.stats["failed"]) == (1, 1)
+
+
+def test_failed_http_falls_back_to_the_browser_once(tmp_path, monkeypatch, sleeps):
+    pool = FakePool(failures=1)
+    scraper = make_scraper(tmp_path, monkeypatch, "auto", pool)
+    site = Site(broken=[500])
+
+    details = fetch(scraper, site, "broken", pool)
+
+    assert details["first_reader_summary"] == "From the browser"
+    # The browser retry does not repeat the HTTP attempts
+    assert site.requests["broken"] == 3
+    assert pool.checkouts == 2
+    assert sleeps == [1]
+
+
+def test_pages_without_details_use_the_browser(tmp_path, monkeypatch):
+    pool = FakePool()
+    scraper = make_scraper(tmp_path, monkeypatch, "auto", pool)
+    site = Site(shell=[200])
+
+    assert fetch(scraper, site, "shell", pool)["first_reader_summary"] == "From the browser"
+    assert site.requests["shell"] == 1
+    assert scraper._http_misses == 1
+
+
+def test_browser_retries_are_bounded(tmp_path, monkeypatch, sleeps):
+    pool = FakePool(failures=5)
+    scraper = make_scraper(tmp_path, monkeypatch, "browser", pool)
+
+    assert asyncio.run(scraper._fetch_with_retry(None, "/bill", pool)) == empty_details()
+    assert pool.checkouts == 3
+    assert sleeps == [1, 2]
+    assert scraper.stats["failed"] == 1
@@ -0,0 +1,187 @@
+"""Tests for conditional requests through the HTTP cache."""
+
+import asyncio
+import os
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.http_cache import HttpCache
+
+URL = "https://example.test/legislation/1"
+
+
+def test_conditional_headers_for_stored_response(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, "<h2>")
+
+    assert cache.conditional_headers(URL) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert cache.load_body(URL) == "<h2>"
+
+
+def test_validators_survive_a_reopen(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": '"v1"'}, "body")
+    cache.close()
+
+    reopened = HttpCache(tmp_path)
+    assert reopened.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+    assert reopened.load_body(URL) == "body"
+
+
+def test_directory_is_created_on_the_first_store(tmp_path):
+    cache = HttpCache(tmp_path / "http_cache")
+    cache.close()
+    assert not (tmp_path / "http_cache").exists()
+
+    cache = HttpCache(tmp_path / "http_cache")
+    cache.store(URL, {"ETag": '"v1"'}, "body")
+    cache.close()
+    assert HttpCache(tmp_path / "http_cache").load_body(URL) == "body"
+
+
+def test_close_prunes_unindexed_and_expired_bodies(tmp_path):
+    cache = HttpCache(tmp_path, max_age_days=1)
+    for i in range(3):
+        cache.store(f"{URL}{i}", {"ETag": f'"v{i}"'}, f"body {i}")
+    orphan = cache.bodies_dir / "orphan.html.gz"
+    orphan.write_bytes(b"")
+    two_days_ago = time.time() - 2 * 24 * 3600
+    for i in (1, 2):
+        os.utime(cache._body_path(f"{URL}{i}"), (two_days_ago, two_days_ago))
+    # Revalidating a body (a 304) keeps it
+    assert cache.load_body(f"{URL}2") == "body 2"
+    cache.close()
+
+    assert sorted(cache.bodies_dir.iterdir()) == sorted(
+        [cache._body_path(f"{URL}0"), cache._body_path(f"{URL}2")]
+    )
+    reopened = HttpCache(tmp_path, max_age_days=1)
+    assert reopened.conditional_headers(f"{URL}1") == {}
+    assert f"{URL}1" not in reopened.index
+    assert reopened.conditional_headers(f"{URL}2") == {"If-None-Match": '"v2"'}
+
+
+def test_response_without_validators_is_not_stored(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"Content-Type": "text/html"}, "body")
+
+    assert cache.conditional_headers(URL) == {}
+    assert cache.load_body(URL) is None
+
+
+def test_no_validators_without_a_stored_body(tmp_path):
+    cache = HttpCache(tmp_path)
+    cache.store(URL, {"ETag": '"v1"'}, "body")
+    cache._body_path(URL).unlink()
+
+    assert cache.conditional_headers(URL) == {}
+    assert cache.load_body(URL) is None
+
+
+class Site:
+    """Serves one page with an ETag and answers matching validators with 304."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.body = "<html><h2>First Reader Summary</h2></html>"
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        return web.Response(text=self.body, content_type="text/html", headers={"ETag": self.etag})
+
+
+class LastModifiedSite(Site):
+    """Serves one page validated only by ``Last-Modified``."""
+
+    LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    async def handle(self, request):
+        self.requests.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == self.LAST_MODIFIED:
+            return web.Response(status=304)
+        headers = {"Last-Modified": self.LAST_MODIFIED}
+        return web.Response(text=self.body, content_type="text/html", headers=headers)
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    from backend.scraper import GALegislationScraper
+
+    monkeypatch.chdir(tmp_path)
+    return GALegislationScraper(http_cache_dir=str(tmp_path / "http_cache"), request_delay=0)
+
+
+def fetch_twice(scraper, site, between=None):
+    async def run():
+        app = web.Application()
+        app.router.add_get("/page", site.handle)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            url = str(server.make_url("/page"))
+            first = await scraper._http_get(session, url)
+            if between is not None:
+                between(url)
+            second = await scraper._http_get(session, url)
+        return first, second
+
+    return asyncio.run(run())
+
+
+def test_304_is_answered_from_the_cache(scraper):
+    site = Site()
+
+    first, second = fetch_twice(scraper, site)
+
+    assert first == (site.body, False)
+    assert second == (site.body, True)
+    assert site.requests == [None, '"v1"']
+
+
+def test_304_for_last_modified_is_answered_from_the_cache(scraper):
+    site = LastModifiedSite()
+
+    first, second = fetch_twice(scraper, site)
+
+    assert first == (site.body, False)
+    assert second == (site.body, True)
+    assert site.requests == [None, LastModifiedSite.LAST_MODIFIED]
+
+
+def test_scraper_does_not_create_the_cache_directory_up_front(scraper, tmp_path):
+    assert not (tmp_path / "http_cache").exists()
+
+
+def test_changed_page_replaces_the_stored_body(scraper):
+    site = Site()
+    urls = []
+
+    def change(url):
+        urls.append(url)
+        site.etag, site.body = '"v2"', "<html>new</html>"
+
+    _, second = fetch_twice(scraper, site, between=change)
+
+    assert second == ("<html>new</html>", False)
+    assert scraper.http_cache.conditional_headers(urls[0]) == {"If-None-Match": '"v2"'}
+    assert scraper.http_cache.load_body(urls[0]) == "<html>new</html>"
+
+
+def test_unreadable_body_is_fetched_again_without_validators(scraper):
+    site = Site()
+
+    def corrupt(url):
+        scraper.http_cache._body_path(url).write_bytes(b"not gzip")
+
+    _, second = fetch_twice(scraper, site, between=corrupt)
+
+    assert second == (site.body, False)
+    assert site.requests == [None, '"v1"', None]
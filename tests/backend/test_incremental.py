@@ -0,0 +1,139 @@
+"""Tests for the incremental refresh rules."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.incremental import is_final, listing_fingerprint, needs_refresh
+from backend.models import Bill, BillDetails, StatusEvent
+
+STUB = {
+    "doc_number": "HB1",
+    "caption": "Education; provide for funding",
+    "committees": ["Education"],
+    "sponsors": ["Smith, John 12th"],
+    "detail_url": "https://example.test/legislation/1",
+}
+ACTIVE = [
+    {"date": "2025-01-10", "status": "House Hopper"},
+    {"date": "2025-01-11", "status": "House First Readers"},
+]
+FINAL = [*ACTIVE, {"date": "2025-05-01", "status": "Effective Date"}]
+DAY = 24 * 3600
+
+
+def events(history):
+    return tuple(StatusEvent(item["date"], item["status"]) for item in history)
+
+
+def entry(history, age, fingerprint=None):
+    return BillDetails(
+        "A BILL", events(history), time.time() - age, fingerprint or listing_fingerprint(STUB)
+    )
+
+
+@pytest.mark.parametrize(
+    ("history", "expected"),
+    [
+        (FINAL, True),
+        ([*ACTIVE, {"date": "2025-04-20", "status": "Signed by Governor"}], True),
+        ([*ACTIVE, {"date": "2025-05-13", "status": "Vetoed"}], True),
+        # The latest event decides, whatever the list order
+        ([FINAL[-1], *ACTIVE], True),
+        (ACTIVE, False),
+        ([], False),
+    ],
+)
+def test_is_final(history, expected):
+    assert is_final(events(history)) is expected
+
+
+def test_fingerprint_tracks_listing_row_only():
+    fingerprint = listing_fingerprint(STUB)
+
+    assert listing_fingerprint({**STUB, "detail_url": "/other"}) == fingerprint
+    assert listing_fingerprint({**STUB, "sponsors": ["Doe, Jane 34th"]}) != fingerprint
+    assert listing_fingerprint({**STUB, "caption": "Amended"}) != fingerprint
+    assert listing_fingerprint(Bill.from_dict(STUB)) == fingerprint
+
+
+def test_fresh_active_bill_is_kept():
+    assert not needs_refresh(entry(ACTIVE, age=60), listing_fingerprint(STUB), DAY)
+
+
+def test_stale_active_bill_is_refreshed():
+    assert needs_refresh(entry(ACTIVE, age=2 * DAY), listing_fingerprint(STUB), DAY)
+
+
+def test_final_bill_is_never_stale():
+    assert not needs_refresh(entry(FINAL, age=365 * DAY), listing_fingerprint(STUB), DAY)
+
+
+def test_changed_listing_row_is_refreshed_even_if_final():
+    changed = listing_fingerprint({**STUB, "caption": "Amended"})
+
+    assert needs_refresh(entry(FINAL, age=60), changed, DAY)
+
+
+def test_entry_without_fetch_time_is_stale():
+    cached = entry(ACTIVE, age=0)
+    cached.fetched_at = None
+
+    assert needs_refresh(cached, listing_fingerprint(STUB), DAY)
+
+
+def test_entry_without_fingerprint_is_refreshed():
+    cached = entry(FINAL, age=60)
+    cached.fingerprint = None
+
+    assert needs_refresh(cached, listing_fingerprint(STUB), DAY)
+
+
+@pytest.fixture
+def fetched():
+    return []
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch, fetched):
+    from backend.scraper import GALegislationScraper
+
+    monkeypatch.chdir(tmp_path)
+    scraper = GALegislationScraper(incremental=True, cache_ttl_hours=24)
+
+    async def fetch(session, url, page_pool):
+        fetched.append(url)
+        return {"first_reader_summary": "Fetched", "status_history": ACTIVE}
+
+    monkeypatch.setattr(scraper, "_fetch_with_retry", fetch)
+    return scraper
+
+
+def detail(scraper, url):
+    coroutine = scraper.fetch_bill_detail_async(None, url, None, listing_fingerprint(STUB))
+    return asyncio.run(coroutine)
+
+
+def test_missing_cache_entry_is_fetched_and_cached(scraper, fetched):
+    url = STUB["detail_url"]
+
+    assert detail(scraper, url).first_reader_summary == "Fetched"
+    assert fetched == [url]
+    assert scraper.cache[url].fingerprint == listing_fingerprint(STUB)
+
+    # The second lookup is answered from the fresh cache entry
+    detail(scraper, url)
+    assert fetched == [url]
+    assert scraper.stats["cached"] == 1
+
+
+def test_scraper_skips_final_and_refetches_stale(scraper, fetched):
+    scraper.cache["/final"] = entry(FINAL, age=30 * DAY)
+    scraper.cache["/stale"] = entry(ACTIVE, age=2 * DAY)
+
+    detail(scraper, "/final")
+    detail(scraper, "/stale")
+
+    assert fetched == ["/stale"]
+    assert scraper.stats["refreshed"] == 1
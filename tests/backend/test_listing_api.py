@@ -0,0 +1,176 @@
+"""Tests for replaying the listing JSON endpoint."""
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from backend.listing_api import (
+    ListingEndpoint,
+    endpoint_from_request,
+    extract_records,
+    extract_total,
+    record_to_bill,
+)
+
+BASE_URL = "https://www.legis.ga.gov"
+
+RECORD = {
+    "Id": 69001,
+    "DocNumber": " HB 12 ",
+    "Caption": " Education; provide for funding ",
+    "Sponsors": [{"Name": "Smith, John 12th"}, {"Name": "Doe, Jane 34th"}],
+    "Committee": "Education",
+}
+
+
+def query(url):
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+def test_record_to_bill_maps_fields():
+    assert record_to_bill(RECORD, BASE_URL) == {
+        "doc_number": "HB12",
+        "caption": "Education; provide for funding",
+        "committees": ["Education"],
+        "sponsors": ["Smith, John 12th", "Doe, Jane 34th"],
+        "detail_url": f"{BASE_URL}/legislation/69001",
+    }
+
+
+def test_record_to_bill_defaults_missing_fields():
+    bill = record_to_bill({"legislationId": 7, "documentNumber": "SR 5"}, BASE_URL)
+
+    assert bill == {
+        "doc_number": "SR5",
+        "caption": "",
+        "committees": [],
+        "sponsors": [],
+        "detail_url": f"{BASE_URL}/legislation/7",
+    }
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"id": 1},
+        {"docNumber": "HB 1"},
+        {"id": 1, "docNumber": "  "},
+        {"name": "not a bill"},
+    ],
+)
+def test_record_to_bill_rejects_non_bills(record):
+    assert record_to_bill(record, BASE_URL) is None
+
+
+def test_extract_records_and_total():
+    payload = {"TotalCount": 1234, "Results": [RECORD, "noise"]}
+
+    assert extract_records(payload) == [RECORD]
+    assert extract_records([RECORD]) == [RECORD]
+    assert extract_records({"unrelated": []}) == []
+    assert extract_total(payload) == 1234
+    assert extract_total([RECORD]) is None
+
+
+def test_endpoint_from_get_request():
+    endpoint = endpoint_from_request(
+        "get",
+        f"{BASE_URL}/api/legislation/search?session=1033&page=1&pageSize=20",
+        None,
+        {"Accept": "application/json", "Cookie": "secret", "Host": "www.legis.ga.gov"},
+        {"results": [RECORD]},
+        BASE_URL,
+    )
+
+    assert endpoint is not None
+    assert endpoint.method == "GET"
+    assert (endpoint.page_key, endpoint.size_key, endpoint.offset_key) == (
+        "page",
+        "pageSize",
+        None,
+    )
+    assert not endpoint.in_body
+    assert endpoint.first_page == 1
+    assert endpoint.headers == {"Accept": "application/json"}
+
+
+def test_endpoint_from_post_request():
+    endpoint = endpoint_from_request(
+        "POST",
+        f"{BASE_URL}/api/legislation/search",
+        '{"sessionId": 1033, "pageIndex": 0, "take": 50}',
+        {},
+        [RECORD],
+        BASE_URL,
+    )
+
+    assert endpoint is not None
+    assert endpoint.in_body
+    assert endpoint.page_key == "pageIndex"
+    assert endpoint.size_key == "take"
+    assert endpoint.first_page == 0
+
+
+@pytest.mark.parametrize(
+    ("url", "post_data", "payload"),
+    [
+        # Not bill records
+        (f"{BASE_URL}/api/sessions?page=1", None, {"results": [{"id": 1, "name": "2025"}]}),
+        # No pagination parameters
+        (f"{BASE_URL}/api/legislation/search?session=1033", None, [RECORD]),
+        # Undecodable body
+        (f"{BASE_URL}/api/legislation/search", "page=1", [RECORD]),
+        # Empty response
+        (f"{BASE_URL}/api/legislation/search?page=1", None, {"results": []}),
+    ],
+)
+def test_endpoint_from_request_ignores_other_requests(url, post_data, payload):
+    assert endpoint_from_request("GET", url, post_data, {}, payload, BASE_URL) is None
+
+
+def test_request_for_query_parameters():
+    endpoint = ListingEndpoint(
+        method="GET",
+        url=f"{BASE_URL}/api/search?session=1033&page=1&pageSize=20",
+        page_key="page",
+        size_key="pageSize",
+    )
+
+    url, body = endpoint.request_for(2, 50)
+
+    assert body is None
+    assert url.startswith(f"{BASE_URL}/api/search?")
+    assert query(url) == {"session": "1033", "page": "3", "pageSize": "50"}
+
+
+def test_request_for_zero_based_offsets():
+    endpoint = ListingEndpoint(
+        method="GET",
+        url=f"{BASE_URL}/api/search?skip=0&take=20",
+        page_key="pageIndex",
+        offset_key="skip",
+        size_key="take",
+        first_page=0,
+    )
+
+    url, _ = endpoint.request_for(3, 20)
+
+    assert query(url) == {"skip": "60", "take": "20", "pageIndex": "3"}
+
+
+def test_request_for_json_body():
+    endpoint = ListingEndpoint(
+        method="POST",
+        url=f"{BASE_URL}/api/search",
+        body={"sessionId": 1033, "page": 1, "pageSize": 20},
+        page_key="page",
+        size_key="pageSize",
+        in_body=True,
+    )
+
+    url, body = endpoint.request_for(4, 20)
+
+    assert url == f"{BASE_URL}/api/search"
+    assert body == {"sessionId": 1033, "page": 5, "pageSize": 20}
+    # The captured body is a template and stays unchanged
+    assert endpoint.body == {"sessionId": 1033, "page": 1, "pageSize": 20}
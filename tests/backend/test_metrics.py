@@ -0,0 +1,143 @@
+"""Tests for run metrics and their Prometheus export."""
+
+import json
+import re
+
+import pytest
+
+from backend.metrics import Histogram, ScrapeMetrics
+
+# Prometheus text format: name{labels} value, with \\, \" and \n escaped in label values
+LABEL = r'[a-z_]+="(?:[^"\\\n]|\\[\\"n])*"'
+SAMPLE_PATTERN = re.compile(rf"^[a-zA-Z_:][a-zA-Z0-9_:]*(\{{{LABEL}(,{LABEL})*\}})? \S+$")
+
+
+def samples(text, prefix):
+    return [line for line in text.splitlines() if line.startswith(prefix)]
+
+
+def without_wall_time(text):
+    return [line for line in text.splitlines() if not line.startswith("ga_scraper_wall_seconds")]
+
+
+def test_quantiles_are_bucket_upper_bounds():
+    histogram = Histogram((0.1, 0.5, 1.0))
+    for value in (0.05, 0.05, 0.2, 0.3, 0.7):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.5) == 0.5
+    assert histogram.quantile(0.95) == 0.7  # capped at the largest observation
+    assert histogram.to_dict() == {
+        "count": 5,
+        "total": 1.3,
+        "mean": 0.26,
+        "p50": 0.5,
+        "p95": 0.7,
+        "max": 0.7,
+    }
+
+
+def test_quantile_above_the_last_bucket_is_the_maximum():
+    histogram = Histogram((0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(42.0)
+
+    assert histogram.quantile(0.99) == 42.0
+
+
+def test_empty_histogram():
+    assert Histogram().quantile(0.5) == 0.0
+    assert Histogram().to_dict()["mean"] == 0.0
+
+
+def test_bucket_boundaries_are_inclusive():
+    histogram = Histogram((0.1, 1.0))
+    histogram.observe(0.1)
+
+    assert histogram.counts == [1, 0, 0]
+
+
+@pytest.fixture
+def metrics():
+    metrics = ScrapeMetrics(buckets=(0.1, 1.0))
+    metrics.observe("navigation", 0.05)
+    metrics.observe("navigation", 0.5)
+    metrics.observe("navigation", 3.0)
+    metrics.observe("parse", 0.01)
+    metrics.increment("detail_retries")
+    metrics.increment("detail_retries", 2)
+    metrics.set_gauge("queue depth", 4)
+    metrics.set_gauge("queue depth", 1)
+    return metrics
+
+
+def test_prometheus_histogram_buckets_are_cumulative(metrics):
+    text = metrics.to_prometheus()
+
+    assert samples(text, 'ga_scraper_phase_seconds_bucket{phase="navigation"') == [
+        'ga_scraper_phase_seconds_bucket{phase="navigation",le="0.1"} 1',
+        'ga_scraper_phase_seconds_bucket{phase="navigation",le="1.0"} 2',
+        'ga_scraper_phase_seconds_bucket{phase="navigation",le="+Inf"} 3',
+    ]
+    assert 'ga_scraper_phase_seconds_sum{phase="navigation"} 3.550000' in text
+    assert 'ga_scraper_phase_seconds_count{phase="navigation"} 3' in text
+    assert "# TYPE ga_scraper_phase_seconds histogram" in text
+
+
+def test_prometheus_counters_gauges_and_stats(metrics):
+    text = metrics.to_prometheus({"fetched": 12, "parser": "lxml"})
+
+    assert 'ga_scraper_events_total{event="detail_retries"} 3' in text
+    # Gauge names are sanitized into valid metric names
+    assert "ga_scraper_queue_depth 1" in text
+    assert "ga_scraper_queue_depth_max 4" in text
+    assert 'ga_scraper_run_stat{stat="fetched"} 12' in text
+    assert "parser" not in text
+
+
+def test_prometheus_output_is_well_formed(metrics):
+    text = metrics.to_prometheus({"fetched": 12})
+
+    assert text.endswith("\n")
+    for line in text.splitlines():
+        assert (
+            line.startswith("# HELP ") or line.startswith("# TYPE ") or SAMPLE_PATTERN.match(line)
+        ), line
+
+
+def test_prometheus_label_values_are_escaped(metrics):
+    metrics.observe('say "hi"\\\n', 0.5)
+    metrics.increment("C:\\cache")
+
+    text = metrics.to_prometheus()
+
+    assert 'ga_scraper_phase_seconds_count{phase="say \\"hi\\"\\\\\\n"} 1' in text
+    assert 'ga_scraper_events_total{event="C:\\\\cache"} 1' in text
+    for line in text.splitlines():
+        assert line.startswith("# ") or SAMPLE_PATTERN.match(line), line
+
+
+def test_write_json_and_prom_files(metrics, tmp_path):
+    prom_file = metrics.write(tmp_path / "scrape_metrics.json", {"fetched": 12})
+
+    report = json.loads((tmp_path / "scrape_metrics.json").read_text(encoding="utf-8"))
+    assert prom_file == tmp_path / "scrape_metrics.prom"
+    # Everything but the wall time, which keeps running, matches a fresh render
+    assert without_wall_time(prom_file.read_text(encoding="utf-8")) == without_wall_time(
+        metrics.to_prometheus({"fetched": 12})
+    )
+    assert report["phases"]["navigation"]["count"] == 3
+    assert report["counters"] == {"detail_retries": 3}
+    assert report["gauges"] == {"queue depth": {"last": 1, "max": 4}}
+    assert report["stats"] == {"fetched": 12}
+
+
+def test_timer_records_one_observation():
+    metrics = ScrapeMetrics()
+
+    with pytest.raises(RuntimeError):
+        with metrics.timer("navigation"):
+            raise RuntimeError
+
+    assert metrics.phases["navigation"].count == 1
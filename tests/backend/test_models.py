@@ -0,0 +1,86 @@
+"""Tests for the compact bill records."""
+
+import pytest
+
+from backend.models import Bill, BillDetails, StatusEvent
+
+FULL_BILL = {
+    "doc_number": "HB 1",
+    "caption": "Education; provide for funding",
+    "committees": ["Education"],
+    "sponsors": ["Smith, John 12th", "Doe, Jane 34th"],
+    "detail_url": "https://example.test/legislation/1",
+    "first_reader_summary": "A BILL to be entitled an Act",
+    "status_history": [
+        {"date": "1/10/2025", "status": "House Hopper"},
+        {"date": "1/11/2025", "status": "House First Readers"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "bill",
+    [
+        FULL_BILL,
+        {key: FULL_BILL[key] for key in ("doc_number", "caption", "detail_url")},
+        {},
+        # Field order of the output schema differs from the source dict
+        {"status_history": [], "doc_number": "SB 2", "sponsors": []},
+        # Fields the module does not know
+        {**FULL_BILL, "session": "2025-2026", "votes": [{"yea": 100}]},
+        # Unexpected shapes are kept verbatim
+        {"doc_number": 7, "committees": "Rules", "sponsors": [1, 2], "caption": None},
+        {"status_history": [{"date": "1/10/2025", "status": "Filed", "note": "x"}]},
+        {"status_history": [{"date": "1/10/2025"}], "first_reader_summary": 3},
+        {"status_history": "none"},
+    ],
+)
+def test_bill_round_trip(bill):
+    assert Bill.from_dict(bill).to_dict() == bill
+
+
+def test_round_trip_keeps_field_order():
+    assert list(Bill.from_dict(FULL_BILL).to_dict()) == list(FULL_BILL)
+
+
+@pytest.mark.parametrize(
+    "details",
+    [
+        {"first_reader_summary": "Summary", "status_history": FULL_BILL["status_history"]},
+        {"first_reader_summary": "", "status_history": [], "fetched_at": 1.5, "fingerprint": "f"},
+        {"status_history": [{"status": "Filed"}], "error": "timeout"},
+        {},
+    ],
+)
+def test_bill_details_round_trip(details):
+    assert BillDetails.from_dict(details).to_dict() == details
+
+
+def test_apply_details_matches_dict_update():
+    stub = {key: FULL_BILL[key] for key in ("doc_number", "caption", "detail_url")}
+    details = {"first_reader_summary": "Summary", "status_history": [], "extra": 1}
+
+    bill = Bill.from_dict(stub)
+    bill.apply_details(BillDetails.from_dict(details))
+
+    assert bill.to_dict() == {**stub, **details}
+
+
+def test_get_matches_to_dict():
+    bill = Bill.from_dict({**FULL_BILL, "caption": 5, "session": "2025"})
+
+    assert bill.get("doc_number") == "HB 1"
+    assert bill.get("caption") == 5
+    assert bill.get("session") == "2025"
+    assert bill.get("sponsors") == tuple(FULL_BILL["sponsors"])
+    assert bill.get("status_history")[0] == StatusEvent("1/10/2025", "House Hopper")
+    assert bill.get("missing", "default") == "default"
+    assert Bill.from_dict({}).get("caption", "default") == "default"
+
+
+def test_repeated_strings_are_shared():
+    first = Bill.from_dict(FULL_BILL)
+    second = Bill.from_dict({**FULL_BILL, "committees": ["".join(["Edu", "cation"])]})
+
+    assert first.committees is not None and second.committees is not None
+    assert first.committees[0] is second.committees[0]
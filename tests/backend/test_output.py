@@ -0,0 +1,148 @@
+"""Tests for streaming scrape output and reading it back."""
+
+import io
+import json
+
+import pytest
+
+from backend.models import Bill
+from backend.output import (
+    OrderedBillSink,
+    StreamingBillWriter,
+    _iter_json_array,
+    iter_bills,
+)
+
+BILLS = [
+    {"doc_number": "HB1", "caption": "Ünïcode caption", "sponsors": ["Smith"]},
+    {"doc_number": "HB2", "caption": "Two", "status_history": []},
+    {"doc_number": "SB1", "caption": "Three"},
+]
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_json_array_matches_json_dump(tmp_path):
+    jsonl, array = tmp_path / "ga_legislation.jsonl", tmp_path / "ga_legislation.json"
+
+    with StreamingBillWriter(jsonl, array) as writer:
+        for bill in BILLS:
+            writer.write(bill)
+
+    assert array.read_text(encoding="utf-8") == json.dumps(BILLS, indent=2, ensure_ascii=False)
+    assert read_jsonl(jsonl) == BILLS
+    assert not (tmp_path / "ga_legislation.json.tmp").exists()
+
+
+def test_empty_run_writes_an_empty_array(tmp_path):
+    array = tmp_path / "ga_legislation.json"
+
+    StreamingBillWriter(tmp_path / "ga_legislation.jsonl", array).close()
+
+    assert json.loads(array.read_text(encoding="utf-8")) == []
+
+
+def test_duplicates_and_bills_without_doc_number_are_skipped(tmp_path):
+    jsonl = tmp_path / "ga_legislation.jsonl"
+
+    with StreamingBillWriter(jsonl) as writer:
+        results = [writer.write(bill) for bill in [*BILLS, {**BILLS[0], "caption": "x"}, {}]]
+
+    assert results == [True, True, True, False, False]
+    assert (writer.written, writer.duplicates) == (3, 2)
+    assert read_jsonl(jsonl) == BILLS
+
+
+def test_jsonl_is_readable_while_writing(tmp_path):
+    jsonl = tmp_path / "ga_legislation.jsonl"
+    writer = StreamingBillWriter(jsonl)
+
+    writer.write(BILLS[0])
+
+    assert read_jsonl(jsonl) == BILLS[:1]
+    writer.close()
+
+
+def test_failed_run_keeps_the_previous_array(tmp_path):
+    array = tmp_path / "ga_legislation.json"
+    array.write_text(json.dumps(BILLS[:1]), encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with StreamingBillWriter(tmp_path / "ga_legislation.jsonl", array) as writer:
+            writer.write(BILLS[1])
+            # The array is streamed into a temporary file until the writer closes
+            assert (tmp_path / "ga_legislation.json.tmp").exists()
+            assert json.loads(array.read_text(encoding="utf-8")) == BILLS[:1]
+            raise RuntimeError("scrape failed")
+
+    assert json.loads(array.read_text(encoding="utf-8")) == BILLS[:1]
+    assert not (tmp_path / "ga_legislation.json.tmp").exists()
+
+
+def test_close_without_commit_discards_the_array(tmp_path):
+    array = tmp_path / "ga_legislation.json"
+    writer = StreamingBillWriter(tmp_path / "ga_legislation.jsonl", array)
+    writer.write(BILLS[0])
+
+    writer.close(commit=False)
+
+    assert not array.exists()
+    assert not (tmp_path / "ga_legislation.json.tmp").exists()
+
+
+def test_sink_releases_bills_in_listing_order(tmp_path):
+    writer = StreamingBillWriter(tmp_path / "bills.jsonl")
+    results: list[Bill] = []
+    sink = OrderedBillSink(results, writer)
+    bills = [Bill.from_dict(bill) for bill in BILLS]
+    tickets = [sink.ticket() for _ in bills]
+
+    sink.finish(tickets[2], bills[2])
+    sink.finish(tickets[1], bills[1])
+    assert results == []
+
+    sink.finish(tickets[0], bills[0])
+    writer.close()
+
+    assert results == bills
+    assert read_jsonl(tmp_path / "bills.jsonl") == BILLS
+
+
+def test_sink_skips_failed_bills():
+    results: list[Bill] = []
+    sink = OrderedBillSink(results)
+    bills = [Bill.from_dict(bill) for bill in BILLS]
+    tickets = [sink.ticket() for _ in bills]
+
+    sink.finish(tickets[1], bills[1])
+    sink.finish(tickets[2], bills[2])
+    # The first bill failed; everything queued after it is released
+    sink.finish(tickets[0], None)
+
+    assert results == bills[1:]
+    assert sink.queued == 3
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_json_array_streaming_across_chunks(chunk_size):
+    items = [1.5e3, -20, "a, ]", {"b": [1, 2]}, [], None, True, 123456789]
+    text = json.dumps(items, indent=1)
+
+    assert list(_iter_json_array(io.StringIO(text), chunk_size)) == items
+
+
+@pytest.mark.parametrize("text", ["[1 2]", "[1,", "{}", "", "[1,,2]"])
+def test_json_array_streaming_rejects_invalid_input(text):
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO(text), 2))
+
+
+def test_iter_bills_reads_both_formats(tmp_path):
+    array = tmp_path / "bills.json"
+    array.write_text(json.dumps(BILLS, indent=2), encoding="utf-8")
+    lines = tmp_path / "bills.jsonl"
+    lines.write_text("".join(json.dumps(bill) + "\n" for bill in BILLS), encoding="utf-8")
+
+    assert list(iter_bills(array)) == list(iter_bills(lines)) == BILLS
@@ -0,0 +1,119 @@
+"""Tests for the browser page pool."""
+
+import asyncio
+
+import pytest
+
+from backend.page_pool import PagePool
+
+
+class FakePage:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(len(self.pages))
+        self.pages.append(page)
+        return page
+
+
+async def use(pool, times=1):
+    pages = []
+    for _ in range(times):
+        async with pool.checkout() as page:
+            pages.append(page)
+    return pages
+
+
+def test_idle_page_is_reused():
+    context = FakeContext()
+    pool = PagePool(context, size=2)
+
+    pages = asyncio.run(use(pool, times=3))
+
+    assert pages[0] is pages[1] is pages[2]
+    assert len(context.pages) == 1
+    assert pool.stats()["checkouts"] == 3
+
+
+def test_page_is_recycled_after_max_uses():
+    context = FakeContext()
+    pool = PagePool(context, size=1, max_uses=2)
+
+    pages = asyncio.run(use(pool, times=5))
+
+    assert [page.number for page in pages] == [0, 0, 1, 1, 2]
+    assert context.pages[0].closed and context.pages[1].closed
+    assert not context.pages[2].closed
+    assert pool.recycled == 2
+
+
+def test_page_that_raised_is_discarded():
+    context = FakeContext()
+    pool = PagePool(context, size=1)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            async with pool.checkout() as page:
+                failed = page
+                raise RuntimeError("navigation failed")
+        [replacement] = await use(pool)
+        return failed, replacement
+
+    failed, replacement = asyncio.run(run())
+
+    assert failed.closed
+    assert replacement is not failed
+    assert pool.recycled == 1
+
+
+def test_closed_page_is_not_handed_out():
+    context = FakeContext()
+    pool = PagePool(context, size=1)
+
+    async def run():
+        [first] = await use(pool)
+        first.closed = True  # e.g. the renderer crashed while idle
+        [second] = await use(pool)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is not first
+    assert pool.recycled == 1
+
+
+def test_checkouts_are_exclusive():
+    context = FakeContext()
+    pool = PagePool(context, size=2)
+    held = set()
+    overlaps = []
+
+    async def worker():
+        async with pool.checkout() as page:
+            overlaps.append(page in held)
+            held.add(page)
+            await asyncio.sleep(0.01)
+            held.discard(page)
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(6)))
+        await pool.close()
+
+    asyncio.run(run())
+
+    assert not any(overlaps)
+    assert len(context.pages) == 2
+    assert all(page.closed for page in context.pages)
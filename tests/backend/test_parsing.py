@@ -0,0 +1,206 @@
+"""Tests for the HTML parser backends and the parsing process pool."""
+
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from backend.benchmarks.fixtures import detail_html, listing_html
+from backend.parsing import (
+    available_parsers,
+    parse_bill_details,
+    parse_listing_page,
+    resolve_parser,
+)
+
+BASE_URL = "https://www.legis.ga.gov"
+
+LISTING = """
+<html><body>
+<div class="pager"><span> 21-40 </span><span>of 3000 results</span></div>
+<table>
+  <thead><tr><th>Doc</th><th>Caption</th><th>Committees</th><th>Sponsors</th></tr></thead>
+  <tbody>
+    <tr>
+      <td><a href="/legislation/69001"> HB  12 </a></td>
+      <td><a href="/legislation/69001">
+        Education; provide <b>for</b> funding &amp; other purposes
+      </a></td>
+      <td><a href="/committees/1"> Education </a><a href="/committees/2">Rules</a></td>
+      <td><a href="/members/1">Smith, John 12th</a>, <a href="/members/2"> Doe, Jane 34th</a></td>
+    </tr>
+    <tr>
+      <td><a href="/legislation/69002">SR 5</a></td>
+      <td>No caption link</td>
+      <td></td>
+      <td></td>
+    </tr>
+    <tr><td>Not a bill row</td><td></td><td></td><td></td></tr>
+    <tr><td><a href="/legislation/69003">HB 13</a></td><td>Too few cells</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+LISTING_WITHOUT_TBODY = """
+<table>
+  <tr><th>Doc</th><th>Caption</th><th>Committees</th><th>Sponsors</th></tr>
+  <tr>
+    <td><a href="/legislation/1">HB 1</a></td>
+    <td><a href="/legislation/1">Caption</a></td>
+    <td><a href="/committees/1">Judiciary</a></td>
+    <td><a href="/members/1">Lee 3rd</a></td>
+  </tr>
+</table>
+<p>1-1 of 1</p>
+"""
+
+DETAIL = """
+<html><body>
+<h2> First Reader Summary </h2>
+<div>
+  <p>A BILL to be entitled an Act to amend <i>Title 20</i>,</p>
+  <p> relating to education &amp; funding. </p>
+</div>
+<h2>Status History</h2>
+<div>
+  <table>
+    <thead><tr><th>Date</th><th>Status</th></tr></thead>
+    <tbody>
+      <tr><td> 01/13/2025 </td><td>House <b>Hopper</b></td></tr>
+      <tr><td>1/14/2025</td><td>House First Readers</td></tr>
+      <tr><td>Pending</td><td> House Second Readers </td></tr>
+      <tr><td>Missing status</td></tr>
+    </tbody>
+  </table>
+</div>
+</body></html>
+"""
+
+DETAIL_WITHOUT_SUMMARY = DETAIL.replace("First Reader Summary", "Sponsors")
+DETAIL_WITHOUT_HISTORY = DETAIL.replace("Status History", "Votes")
+DETAIL_WITHOUT_TABLE = "<h2>Status History</h2><div><p>No actions yet</p></div>"
+
+LISTING_PAGES = {
+    "listing": LISTING,
+    "listing without tbody": LISTING_WITHOUT_TBODY,
+    "fixture": listing_html(2),
+    "empty": "",
+    "no table": "<html><body><p>No results</p></body></html>",
+}
+DETAIL_PAGES = {
+    "detail": DETAIL,
+    "fixture": detail_html(7),
+    "empty": "",
+    "no summary": DETAIL_WITHOUT_SUMMARY,
+    "no history": DETAIL_WITHOUT_HISTORY,
+    "history without table": DETAIL_WITHOUT_TABLE,
+}
+
+OTHER_PARSERS = [name for name in available_parsers() if name != "bs4"]
+
+
+@pytest.mark.parametrize("parser", OTHER_PARSERS)
+@pytest.mark.parametrize("page", list(LISTING_PAGES))
+def test_listing_parsers_agree(parser, page):
+    html = LISTING_PAGES[page]
+
+    assert parse_listing_page(html, BASE_URL, parser) == parse_listing_page(html, BASE_URL)
+
+
+@pytest.mark.parametrize("parser", OTHER_PARSERS)
+@pytest.mark.parametrize("page", list(DETAIL_PAGES))
+def test_detail_parsers_agree(parser, page):
+    html = DETAIL_PAGES[page]
+
+    assert parse_bill_details(html, parser) == parse_bill_details(html)
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_listing_page(parser):
+    bills, total, per_page = parse_listing_page(LISTING, BASE_URL, parser)
+
+    assert (total, per_page) == (3000, 20)
+    assert bills == [
+        {
+            "doc_number": "HB12",
+            "caption": "Education; provide for funding & other purposes",
+            "committees": ["Education", "Rules"],
+            "sponsors": ["Smith, John 12th", "Doe, Jane 34th"],
+            "detail_url": f"{BASE_URL}/legislation/69001",
+        },
+        {
+            "doc_number": "SR5",
+            "caption": "",
+            "committees": [],
+            "sponsors": [],
+            "detail_url": f"{BASE_URL}/legislation/69002",
+        },
+    ]
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_detail_page(parser):
+    # Text fragments are stripped and joined like BeautifulSoup's get_text(strip=True)
+    assert parse_bill_details(DETAIL, parser) == {
+        "first_reader_summary": (
+            "A BILL to be entitled an Act to amendTitle 20,relating to education & funding."
+        ),
+        "status_history": [
+            {"date": "2025-01-13", "status": "HouseHopper"},
+            {"date": "2025-01-14", "status": "House First Readers"},
+            {"date": "Pending", "status": "House Second Readers"},
+        ],
+    }
+
+
+@pytest.mark.parametrize("parser", available_parsers())
+def test_empty_pages(parser):
+    assert parse_listing_page("", BASE_URL, parser) == ([], None, 0)
+    assert parse_bill_details("", parser) == {"first_reader_summary": "", "status_history": []}
+
+
+def test_resolve_parser():
+    assert resolve_parser("auto") == available_parsers()[0]
+    assert resolve_parser("bs4") == "bs4"
+    with pytest.raises(ValueError):
+        resolve_parser("html5lib")
+
+
+def exit_in_worker(html):
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return parse_bill_details(html)
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    from backend.scraper import GALegislationScraper
+
+    monkeypatch.chdir(tmp_path)
+    scraper = GALegislationScraper(parse_workers=2)
+    scraper._parse_executor = scraper._start_parse_pool()
+    yield scraper
+    if scraper._parse_executor is not None:
+        scraper._parse_executor.shutdown()
+
+
+def test_process_pool_matches_inline_parsing(scraper):
+    async def run():
+        return await asyncio.gather(
+            scraper._parse(parse_listing_page, LISTING, BASE_URL, scraper.parser),
+            scraper._parse(parse_bill_details, DETAIL, scraper.parser),
+        )
+
+    listing, details = asyncio.run(run())
+
+    assert listing == parse_listing_page(LISTING, BASE_URL, scraper.parser)
+    assert details == parse_bill_details(DETAIL, scraper.parser)
+
+
+def test_broken_process_pool_falls_back_to_inline_parsing(scraper):
+    details = asyncio.run(scraper._parse(exit_in_worker, DETAIL))
+
+    assert details == parse_bill_details(DETAIL)
+    assert scraper._parse_executor is None
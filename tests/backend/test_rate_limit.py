@@ -0,0 +1,180 @@
+"""Tests for the adaptive rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.rate_limit import (
+    AdaptiveRateLimiter,
+    RequestOutcome,
+    is_retryable,
+    parse_retry_after,
+)
+
+
+def run_request(limiter, status=None, retry_after=None, error=None):
+    async def request():
+        async with limiter.request() as outcome:
+            outcome.status = status
+            outcome.retry_after = retry_after
+            if error is not None:
+                raise error
+
+    asyncio.run(request())
+
+
+def make_limiter(**kwargs):
+    options = {"rate": 4.0, "max_rate": 8.0, "max_concurrency": 8, "burst": 100}
+    return AdaptiveRateLimiter(**{**options, **kwargs})
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [(None, True), (429, True), (500, True), (503, True), (404, False), (304, False)],
+)
+def test_is_retryable(status, expected):
+    assert is_retryable(status) is expected
+
+
+def test_success_increases_rate_and_concurrency():
+    limiter = make_limiter()
+
+    run_request(limiter, status=200)
+
+    assert limiter.rate > 4.0
+    assert limiter.concurrency > 2
+    assert limiter.stats()["requests"] == 1
+
+
+def test_throttling_halves_rate_once_per_cooldown():
+    limiter = make_limiter(cooldown=60)
+
+    run_request(limiter, status=429)
+    run_request(limiter, status=429)
+
+    assert limiter.rate == 2.0
+    assert limiter.concurrency == 1
+    assert limiter.stats()["throttled"] == 2
+    assert limiter.decreases == 1
+
+
+def test_client_errors_do_not_slow_down():
+    limiter = make_limiter()
+
+    with pytest.raises(ValueError):
+        run_request(limiter, status=404, error=ValueError("not found"))
+
+    assert limiter.rate == 4.0
+    assert limiter.decreases == 0
+
+
+def test_connection_errors_slow_down():
+    limiter = make_limiter()
+
+    with pytest.raises(ConnectionError):
+        run_request(limiter, error=ConnectionError())
+
+    assert limiter.rate == 2.0
+
+
+def test_rate_never_drops_below_minimum():
+    limiter = make_limiter(min_rate=3.0, cooldown=0)
+
+    for _ in range(3):
+        run_request(limiter, status=503)
+
+    assert limiter.rate == 3.0
+    assert limiter.concurrency == 1
+
+
+def test_retry_after_pauses_requests():
+    limiter = make_limiter()
+
+    run_request(limiter, status=429, retry_after="30")
+
+    assert limiter._paused_until - time.monotonic() > 25
+
+
+def test_token_bucket_spaces_requests():
+    limiter = AdaptiveRateLimiter(rate=50.0, max_rate=50.0, max_concurrency=1)
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(6):
+            async with limiter.request() as outcome:
+                outcome.status = 200
+        return time.monotonic() - started
+
+    # One token up front, then one every 20 ms
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_concurrency_limit_is_enforced():
+    limiter = make_limiter(max_concurrency=1)
+    in_flight = []
+
+    async def worker():
+        async with limiter.request() as outcome:
+            in_flight.append(limiter._in_flight)
+            await asyncio.sleep(0.01)
+            outcome.status = 200
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(4)))
+
+    asyncio.run(run())
+
+    assert in_flight == [1, 1, 1, 1]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def throttled(retry_after=None):
+    outcome = RequestOutcome()
+    outcome.status = 429
+    outcome.retry_after = retry_after
+    return outcome
+
+
+def test_backoff_sleeps_exponentially_on_other_failures(sleeps):
+    limiter = make_limiter()
+
+    for attempt in range(3):
+        asyncio.run(limiter.backoff(attempt, RequestOutcome()))
+
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_backoff_pauses_everyone_when_throttled(sleeps):
+    limiter = make_limiter()
+
+    asyncio.run(limiter.backoff(2, throttled()))
+
+    assert sleeps == []
+    assert limiter._paused_until - time.monotonic() > 3
+
+
+def test_backoff_defers_to_retry_after(sleeps):
+    limiter = make_limiter()
+
+    asyncio.run(limiter.backoff(5, throttled("1")))
+
+    assert sleeps == []
+    assert limiter._paused_until == 0.0
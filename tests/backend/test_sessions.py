@@ -0,0 +1,137 @@
+"""Tests for discovering and selecting legislative sessions."""
+
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from backend.listing_api import ListingEndpoint
+from backend.sessions import (
+    LegislativeSession,
+    endpoint_for_session,
+    extract_sessions,
+    select_sessions,
+)
+
+PAYLOAD = {
+    "Sessions": [
+        {"Id": 1029, "Description": "2021-2022 Regular Session"},
+        {"Id": 1033, "Description": "2025-2026 Regular Session"},
+        {"Id": 1031, "Description": "2023-2024 Regular Session"},
+        {"Id": 1032, "Description": "2023 Special Session"},
+        {"Id": 7, "Description": "Committee of the Whole"},
+        {"Description": "2019-2020 Regular Session"},
+        "noise",
+    ]
+}
+
+SESSIONS = extract_sessions(PAYLOAD)
+
+
+def ids(sessions):
+    return [session.id for session in sessions]
+
+
+def test_extract_sessions_newest_first():
+    assert ids(SESSIONS) == ["1033", "1032", "1031", "1029"]
+    assert SESSIONS[0] == LegislativeSession("1033", "2025-2026 Regular Session", 2025)
+    assert SESSIONS[0].slug == "2025-2026-regular-session"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [{"id": 1, "name": "2025-2026 Regular Session"}],
+        {"results": [{"id": 1, "displayName": "2025-2026 Regular Session"}]},
+    ],
+)
+def test_extract_sessions_from_other_shapes(payload):
+    assert ids(extract_sessions(payload)) == ["1"]
+
+
+@pytest.mark.parametrize("payload", [None, {}, {"sessions": "2025"}, [{"id": 1, "name": "HB 1"}]])
+def test_extract_sessions_ignores_other_responses(payload):
+    assert extract_sessions(payload) == []
+
+
+def test_select_all():
+    assert select_sessions(SESSIONS, " ALL ") == SESSIONS
+
+
+def test_select_by_id_and_year():
+    # A year selects every session starting in it; duplicates are dropped
+    assert ids(select_sessions(SESSIONS, "1029, 2023,1031")) == ["1032", "1031", "1029"]
+
+
+def test_select_unknown_session():
+    with pytest.raises(ValueError, match="2011"):
+        select_sessions(SESSIONS, "1033,2011")
+
+
+def test_endpoint_for_session_in_query():
+    endpoint = ListingEndpoint(
+        method="GET", url="https://example.test/api/search?session=1033&page=1", page_key="page"
+    )
+
+    url = endpoint_for_session(endpoint, "1029").url
+
+    assert parse_qs(urlsplit(url).query) == {"session": ["1029"], "page": ["1"]}
+    assert "session=1033" in endpoint.url
+
+
+def test_endpoint_for_session_adds_parameter():
+    endpoint = ListingEndpoint(method="GET", url="https://example.test/api/search?page=1")
+
+    url = endpoint_for_session(endpoint, "1029").url
+
+    assert parse_qs(urlsplit(url).query) == {"page": ["1"], "sessionId": ["1029"]}
+
+
+def test_endpoint_for_session_in_body_keeps_json_type():
+    endpoint = ListingEndpoint(
+        method="POST",
+        url="https://example.test/api/search",
+        body={"SessionId": 1033, "page": 1},
+        in_body=True,
+    )
+
+    assert endpoint_for_session(endpoint, "1029").body == {"SessionId": 1029, "page": 1}
+    assert endpoint_for_session(endpoint, "abc").body == {"SessionId": "abc", "page": 1}
+    assert endpoint.body == {"SessionId": 1033, "page": 1}
+
+
+class FakeListingPage:
+    """Listing page whose session picker shows ``selected``."""
+
+    def __init__(self, selected):
+        self.selected = selected
+        self.url = None
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+    async def evaluate(self, script):
+        from backend.scraper import SELECTED_OPTIONS_JS
+
+        assert script == SELECTED_OPTIONS_JS
+        return self.selected
+
+
+@pytest.mark.parametrize(("selected", "listed"), [(["1029", "25"], True), (["1033"], False)])
+def test_browser_listing_checks_the_session_shown(tmp_path, monkeypatch, selected, listed):
+    from backend import scraper as scraper_module
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scraper_module.asyncio, "sleep", no_sleep)
+    scraper = scraper_module.GALegislationScraper(
+        listing_mode="browser", session_id="1029", checkpoint_file=None
+    )
+    page = FakeListingPage(selected)
+
+    listing = asyncio.run(scraper._open_listing(page, None, None))
+
+    assert parse_qs(urlsplit(page.url).query) == {"session": ["1029"]}
+    assert (listing is not None) == listed
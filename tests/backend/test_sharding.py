@@ -0,0 +1,107 @@
+"""Tests for shard assignment, work manifests and merging shard outputs."""
+
+import json
+import zlib
+
+import pytest
+
+from backend.sharding import (
+    load_manifest,
+    merge_outputs,
+    select_shard,
+    shard_of,
+    shard_path,
+    write_manifest,
+)
+
+BILLS = [
+    {"doc_number": f"{prefix}{number}", "detail_url": f"/legislation/{prefix}{number}"}
+    for prefix in ("HB", "SB", "HR", "SR")
+    for number in range(1, 51)
+]
+
+
+def test_shard_is_crc32_of_doc_number():
+    assert shard_of("HB123", 4) == zlib.crc32(b"HB123") % 4
+    # Stable across calls and processes (unlike hash())
+    assert shard_of("HB123", 4) == shard_of("HB123", 4)
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 3, 8])
+def test_every_bill_lands_in_exactly_one_shard(num_shards):
+    shards = [select_shard(BILLS, index, num_shards) for index in range(num_shards)]
+
+    doc_numbers = [bill["doc_number"] for shard in shards for bill in shard]
+    assert sorted(doc_numbers) == sorted(bill["doc_number"] for bill in BILLS)
+    assert len(set(doc_numbers)) == len(BILLS)
+
+
+def test_select_shard_keeps_manifest_order():
+    shard = select_shard(BILLS, 1, 3)
+
+    assert shard == [bill for bill in BILLS if bill in shard]
+    assert all(shard_of(bill["doc_number"], 3) == 1 for bill in shard)
+
+
+@pytest.mark.parametrize(("shard_index", "num_shards"), [(-1, 2), (2, 2), (0, 0)])
+def test_select_shard_rejects_bad_index(shard_index, num_shards):
+    with pytest.raises(ValueError):
+        select_shard(BILLS, shard_index, num_shards)
+
+
+def test_shard_path():
+    assert shard_path("out/ga_legislation.json", 0, 4).as_posix() == (
+        "out/ga_legislation.shard-1-of-4.json"
+    )
+
+
+def test_manifest_round_trip(tmp_path):
+    path = tmp_path / "scrape_manifest.json"
+
+    write_manifest(BILLS, path)
+
+    assert load_manifest(path) == BILLS
+    assert json.loads(path.read_text(encoding="utf-8"))["total_bills"] == len(BILLS)
+    assert not (tmp_path / "scrape_manifest.json.tmp").exists()
+
+
+def test_load_manifest_rejects_other_files(tmp_path):
+    path = tmp_path / "ga_legislation.json"
+    path.write_text(json.dumps(BILLS), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_manifest(path)
+
+
+def test_merge_outputs_keeps_first_record_per_bill(tmp_path):
+    first = tmp_path / "ga_legislation.shard-1-of-2.json"
+    second = tmp_path / "ga_legislation.shard-2-of-2.json"
+    first.write_text(
+        json.dumps([{"doc_number": "HB1", "caption": "first"}, {"doc_number": "HB2"}]),
+        encoding="utf-8",
+    )
+    # Partial outputs may also be JSON Lines
+    second = second.with_suffix(".jsonl")
+    second.write_text(
+        "".join(
+            json.dumps(bill) + "\n"
+            for bill in (
+                {"doc_number": "HB1", "caption": "duplicate"},
+                {"caption": "no doc number"},
+                {"doc_number": "SB1"},
+            )
+        ),
+        encoding="utf-8",
+    )
+    output = tmp_path / "ga_legislation.json"
+
+    assert merge_outputs([first, second], output) == 3
+
+    expected = [
+        {"doc_number": "HB1", "caption": "first"},
+        {"doc_number": "HB2"},
+        {"doc_number": "SB1"},
+    ]
+    assert json.loads(output.read_text(encoding="utf-8")) == expected
+    lines = output.with_suffix(".jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == expected
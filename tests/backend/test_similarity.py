@@ -0,0 +1,131 @@
+"""Tests for the precomputed similar bills."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.similarity import (  # noqa: E402
+    MIN_SCORE,
+    build_neighbors,
+    lsh_candidates,
+    minhash_signatures,
+    pair_dots,
+    pair_jaccard,
+    text_tokens,
+    tfidf_matrix,
+)
+
+WORDS = [f"word{chr(97 + i)}{chr(97 + j)}" for i in range(26) for j in range(26)]
+
+
+def distinct_bills(count, seed=7):
+    """Bills with disjoint vocabularies, sponsors and committees."""
+    rng = random.Random(seed)
+    words = rng.sample(WORDS, count * 12)
+    return [
+        {
+            "doc_number": f"HB{n}",
+            "caption": " ".join(words[n * 12 : n * 12 + 6]),
+            "first_reader_summary": " ".join(words[n * 12 + 6 : n * 12 + 12]),
+            "sponsors": [f"Member {n}"],
+            "committees": [f"Committee {n}"],
+        }
+        for n in range(count)
+    ]
+
+
+def near_duplicate(bill, doc_number):
+    words = bill["first_reader_summary"].split()
+    return {
+        **bill,
+        "doc_number": doc_number,
+        "first_reader_summary": " ".join([*words[:-1], "amended"]),
+        "sponsors": ["Someone Else"],
+    }
+
+
+def pair_codes(pairs, count):
+    return {i * count + j for i, j in pairs}
+
+
+def test_near_duplicates_pair_up_and_distinct_bills_do_not():
+    bills = distinct_bills(40)
+    bills.append(near_duplicate(bills[3], "SB3"))
+
+    neighbors = build_neighbors(bills)
+
+    assert [other for other, _ in neighbors["HB3"]] == ["SB3"]
+    assert [other for other, _ in neighbors["SB3"]] == ["HB3"]
+    assert set(neighbors) == {"HB3", "SB3"}
+    # Text and committee match, sponsors differ: 0.6 * cosine + 0.15
+    assert 60 <= neighbors["HB3"][0][1] < 75
+
+
+def test_minhash_estimates_jaccard():
+    shared = set(WORDS[:60])
+    first, second = shared | set(WORDS[60:80]), shared | set(WORDS[80:100])
+    signatures = minhash_signatures([first, second, set()], num_perm=256)
+
+    estimate = np.mean(signatures[0] == signatures[1])
+
+    assert abs(estimate - 60 / 100) < 0.1
+    # Signatures are deterministic and empty sets never match
+    assert (minhash_signatures([first])[0] == minhash_signatures([first])[0]).all()
+    assert not (signatures[2] == signatures[0]).any()
+
+
+def test_lsh_finds_similar_token_sets():
+    bills = distinct_bills(30)
+    bills.append(near_duplicate(bills[5], "SB5"))
+    signatures = minhash_signatures([text_tokens(bill) for bill in bills])
+
+    candidates = set(lsh_candidates(signatures).tolist())
+
+    assert 5 * len(bills) + 30 in candidates
+    assert len(candidates) == 1
+
+
+def test_pair_dots_and_jaccard_match_brute_force():
+    rng = random.Random(3)
+    sets = [set(rng.sample(WORDS[:30], rng.randint(0, 8))) for _ in range(12)]
+    first = np.array([i for i in range(12) for j in range(i + 1, 12)])
+    second = np.array([j for i in range(12) for j in range(i + 1, 12)])
+
+    jaccard = pair_jaccard(sets, first, second)
+    expected = [
+        len(sets[i] & sets[j]) / len(sets[i] | sets[j]) if sets[i] | sets[j] else 0.0
+        for i, j in zip(first, second, strict=True)
+    ]
+    assert np.allclose(jaccard, expected)
+
+    indptr, indices, weights = tfidf_matrix(sets)
+    dense = np.zeros((12, int(indices.max()) + 1))
+    for row in range(12):
+        dense[row, indices[indptr[row] : indptr[row + 1]]] = weights[indptr[row] : indptr[row + 1]]
+    cosine = pair_dots((indptr, indices, weights), first, second)
+    assert np.allclose(cosine, (dense[first] * dense[second]).sum(axis=1))
+
+
+def test_shared_sponsor_makes_a_candidate():
+    bills = distinct_bills(2)
+    bills[1]["sponsors"] = bills[0]["sponsors"]
+    bills[1]["committees"] = bills[0]["committees"]
+
+    neighbors = build_neighbors(bills)
+
+    # No shared words: only the sponsor (0.25) and committee (0.15) weights count
+    assert neighbors == {"HB0": [("HB1", 40)], "HB1": [("HB0", 40)]}
+
+
+def test_weak_matches_are_dropped():
+    bills = distinct_bills(2)
+    bills[1]["sponsors"] = [*bills[1]["sponsors"], *bills[0]["sponsors"]]
+    bills[1]["committees"] = []
+
+    # Sponsor Jaccard 1/2 scores 0.125, just above the cutoff
+    assert MIN_SCORE < 0.125
+    assert build_neighbors(bills)["HB0"] == [("HB1", 12)]
+    bills[1]["sponsors"] = [*bills[1]["sponsors"], "Third Member", "Fourth Member"]
+    assert build_neighbors(bills) == {}
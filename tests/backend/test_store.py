@@ -0,0 +1,131 @@
+"""Tests for the SQLite bill store and its query API."""
+
+import json
+
+import pytest
+
+from backend.store import BillStore, build_store
+
+BILLS = [
+    {
+        "doc_number": "HB 1",
+        "caption": "Education; school safety grants",
+        "sponsors": ["DOE, JANE", "Smith, John"],
+        "committees": ["Education"],
+        "first_reader_summary": "A BILL to fund school resource officers.",
+        "status_history": [
+            {"date": "2025-01-10", "status": "House Hopper"},
+            {"date": "2025-03-02", "status": "Effective Date - Signed by Governor"},
+        ],
+    },
+    {
+        "doc_number": "HB 2",
+        "caption": "Motor vehicles; revise speed limits",
+        "sponsors": ["Smith, John"],
+        "committees": ["Transportation", "education"],
+        "status_history": [{"date": "2025-01-15", "status": "House Hopper"}],
+    },
+    {
+        "doc_number": "SR 3",
+        "caption": "Honoring a safety officer",
+        "sponsors": "ROE, RICHARD",
+        "committees": [],
+        "status_history": [{"date": "2025-02-20", "status": "Senate Passed/Adopted"}],
+    },
+]
+
+
+def doc_numbers(bills):
+    return [bill["doc_number"] for bill in bills]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with BillStore(tmp_path / "bills.db") as store:
+        assert store.replace_all(BILLS) == 3
+        yield store
+
+
+def test_get_returns_the_full_record(store):
+    assert store.count() == 3
+    assert store.get("HB 1") == BILLS[0]
+    assert store.get("HB 9") is None
+
+
+@pytest.mark.parametrize("name", ["DOE, JANE", "Jane Doe", "jane doe"])
+def test_by_sponsor_matches_raw_and_normalized_names(store, name):
+    assert doc_numbers(store.by_sponsor(name)) == ["HB 1"]
+
+
+def test_by_sponsor_and_committee(store):
+    assert doc_numbers(store.by_sponsor("John Smith")) == ["HB 1", "HB 2"]
+    assert doc_numbers(store.by_sponsor("Richard Roe")) == ["SR 3"]
+    # Committee names are case-insensitive and stored once
+    assert doc_numbers(store.by_committee("EDUCATION")) == ["HB 1", "HB 2"]
+    assert store.committees() == [("Education", 2), ("Transportation", 1)]
+    assert store.sponsors() == [("John Smith", 2), ("Jane Doe", 1), ("Richard Roe", 1)]
+
+
+def test_by_status_date(store):
+    assert doc_numbers(store.by_status_date("2025-01-12", "2025-02-28")) == ["SR 3", "HB 2"]
+    assert doc_numbers(store.by_status_date(start="2025-03-01")) == ["HB 1"]
+    assert doc_numbers(store.by_status_date(status="hopper")) == ["HB 2", "HB 1"]
+    assert doc_numbers(store.by_status_date(end="2025-01-10", status="signed")) == []
+
+
+def test_search(store):
+    assert set(doc_numbers(store.search("safety"))) == {"HB 1", "SR 3"}
+    # The last word also matches as a prefix
+    assert doc_numbers(store.search("resource offic")) == ["HB 1"]
+    assert doc_numbers(store.search("speed limits")) == ["HB 2"]
+    # FTS5 operators in user input are taken literally
+    assert store.search('school" OR "speed') == []
+    assert store.search("  ") == []
+
+
+def test_search_without_fts5(store):
+    store.full_text = False
+
+    assert doc_numbers(store.search("safety")) == ["HB 1", "SR 3"]
+    assert doc_numbers(store.search("resource offic")) == ["HB 1"]
+
+
+def test_duplicate_doc_numbers_keep_the_last_record(tmp_path):
+    updated = dict(BILLS[1], caption="Motor vehicles; raise fines", sponsors=["Roe, Richard"])
+
+    with BillStore(tmp_path / "bills.db") as store:
+        assert store.replace_all([*BILLS, updated]) == 3
+
+        assert store.get("HB 2") == updated
+        # The replaced row's sponsors, committees and events went with it
+        assert doc_numbers(store.by_sponsor("John Smith")) == ["HB 1"]
+        assert doc_numbers(store.by_sponsor("Richard Roe")) == ["HB 2", "SR 3"]
+        assert doc_numbers(store.by_status_date("2025-01-15", "2025-01-15")) == ["HB 2"]
+        assert len(store.by_status_date()) == 3
+        assert store.search("speed") == []
+        assert doc_numbers(store.search("fines")) == ["HB 2"]
+
+
+def test_reingest_replaces_everything(tmp_path):
+    current = [dict(BILLS[0], caption="Education; teacher pay")]
+
+    with BillStore(tmp_path / "bills.db") as store:
+        store.replace_all(BILLS)
+        assert store.replace_all(current) == 1
+
+        assert store.count() == 1
+        assert store.search("safety") == []
+        assert store.search("speed") == []
+        assert doc_numbers(store.search("teacher")) == ["HB 1"]
+        assert store.by_sponsor("Richard Roe") == []
+        assert store.by_committee("Transportation") == []
+        assert store.sponsors() == [("Jane Doe", 1), ("John Smith", 1)]
+
+
+def test_build_store_from_jsonl(tmp_path):
+    output = tmp_path / "bills.jsonl"
+    output.write_text("".join(json.dumps(bill) + "\n" for bill in BILLS), encoding="utf-8")
+
+    assert build_store(output, tmp_path / "bills.db") == 3
+    with BillStore(tmp_path / "bills.db") as store:
+        assert store.get("SR 3") == BILLS[2]